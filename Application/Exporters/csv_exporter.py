@@ -0,0 +1,47 @@
+import csv
+
+
+class CsvExporter:
+    """
+    CsvExporter writes encoding table rows to a CSV file. Rows are written as
+    they are received, so the file is never assembled in memory.
+    """
+    file_extension = "csv"
+    file_filter = "CSV files (*.csv)"
+
+    def __init__(self):
+        """
+        Constructor - Creates an instance of CsvExporter
+        """
+        self._file = None
+        self._csv_writer = None
+
+    def open(self, path, headers):
+        """
+        Opens the destination file and writes the column headers.
+
+        Parameters:
+            path - path of the file to write.
+            headers - list of table headers.
+        """
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._csv_writer = csv.writer(self._file, delimiter=",", quoting=csv.QUOTE_NONNUMERIC)
+        self._csv_writer.writerow(headers)
+
+    def write_rows(self, rows):
+        """
+        Writes a chunk of table rows.
+
+        Parameters:
+            rows - list of rows, each a list of cell values or None for empty cells.
+        """
+        self._csv_writer.writerows([["" if cell is None else cell for cell in row] for row in rows])
+
+    def close(self):
+        """
+        Flushes and closes the destination file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._csv_writer = None
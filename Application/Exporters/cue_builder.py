@@ -0,0 +1,55 @@
+from Application.timecode import parse_time_range
+
+
+class CueBuilder:
+    """
+    CueBuilder turns a stream of timed table rows into cues with a start and an
+    end time. Rows coding a segment end at the segment's end, and any other row
+    lasts until the next timed row starts, so one row is held back until its
+    successor arrives. The last row lasts DEFAULT_DURATION_MS.
+    """
+    DEFAULT_DURATION_MS = 2000
+
+    def __init__(self):
+        """
+        Constructor - Creates an instance of CueBuilder
+        """
+        self._pending = None  # (start ms, end ms or None, row) waiting for the next row's time
+
+    def add_rows(self, rows):
+        """
+        Adds a chunk of rows, returning the cues that could be completed.
+        Rows whose time cell cannot be parsed are skipped.
+
+        Parameters:
+            rows - list of rows whose first cell holds the row's timestamp.
+
+        Returns:
+            List of (start ms, end ms, row) cues.
+        """
+        cues = []
+        for row in rows:
+            start_ms, end_ms = parse_time_range(row[0]) if row else (None, None)
+            if start_ms is None:
+                continue
+            if self._pending is not None:
+                pending_start_ms, pending_end_ms, pending_row = self._pending
+                if pending_end_ms is None:
+                    pending_end_ms = start_ms if start_ms > pending_start_ms \
+                        else pending_start_ms + self.DEFAULT_DURATION_MS
+                cues.append((pending_start_ms, pending_end_ms, pending_row))
+            self._pending = (start_ms, end_ms, row)
+        return cues
+
+    def finish(self):
+        """
+        Completes the last held back row.
+
+        Returns:
+            List of the remaining (start ms, end ms, row) cues.
+        """
+        if self._pending is None:
+            return []
+        start_ms, end_ms, row = self._pending
+        self._pending = None
+        return [(start_ms, end_ms if end_ms is not None else start_ms + self.DEFAULT_DURATION_MS, row)]
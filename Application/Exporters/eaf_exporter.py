@@ -0,0 +1,128 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape, quoteattr
+
+from Application.Exporters.cue_builder import CueBuilder
+
+
+class EafExporter:
+    """
+    EafExporter writes the encoding table as an ELAN annotation document with
+    one tier per coded column. An EAF document lists every time slot before
+    any tier, and each tier holds all of its annotations, so the time slots and
+    the annotations of each tier are spooled to temporary files while the rows
+    stream in and are concatenated into the document when the export closes.
+    """
+    file_extension = "eaf"
+    file_filter = "ELAN annotation files (*.eaf)"
+
+    def __init__(self):
+        """
+        Constructor - Creates an instance of EafExporter
+        """
+        self._path = None
+        self._spool_directory = None
+        self._time_slot_file = None
+        self._tier_files = []
+        self._tier_ids = []
+        self._cue_builder = None
+        self._time_slot_count = 0
+        self._annotation_count = 0
+
+    def open(self, path, headers):
+        """
+        Prepares the spool files of the document.
+
+        Parameters:
+            path - path of the file to write.
+            headers - list of table headers.
+        """
+        self._path = path
+        self._spool_directory = tempfile.mkdtemp(prefix="eaf-export-")
+        self._time_slot_file = open(os.path.join(self._spool_directory, "time-slots"), "w+", encoding="utf-8")
+        self._tier_ids = [header or str(col_ix + 1) for col_ix, header in enumerate(headers)][1:]
+        self._tier_files = [open(os.path.join(self._spool_directory, f"tier-{tier_ix}"), "w+", encoding="utf-8")
+                            for tier_ix in range(len(self._tier_ids))]
+        self._cue_builder = CueBuilder()
+        self._time_slot_count = 0
+        self._annotation_count = 0
+
+    def write_rows(self, rows):
+        """
+        Spools the annotations completed by a chunk of table rows.
+
+        Parameters:
+            rows - list of rows, each a list of cell values or None for empty cells.
+        """
+        self._spool_cues(self._cue_builder.add_rows(rows))
+
+    def close(self):
+        """
+        Assembles the document from its spool files and removes them.
+        """
+        if self._time_slot_file is None:
+            return
+        try:
+            self._spool_cues(self._cue_builder.finish())
+            self._write_document()
+        finally:
+            for spool_file in [self._time_slot_file] + self._tier_files:
+                spool_file.close()
+            shutil.rmtree(self._spool_directory, ignore_errors=True)
+            self._time_slot_file = None
+            self._tier_files = []
+
+    def _spool_cues(self, cues):
+        """
+        Spools the time slots of each cue and the annotations of its coded cells.
+
+        Parameters:
+            cues - list of (start ms, end ms, row) cues.
+        """
+        for start_ms, end_ms, row in cues:
+            start_slot = f"ts{self._time_slot_count + 1}"
+            end_slot = f"ts{self._time_slot_count + 2}"
+            self._time_slot_count += 2
+            self._time_slot_file.write(
+                f'        <TIME_SLOT TIME_SLOT_ID="{start_slot}" TIME_VALUE="{start_ms}"/>\n'
+                f'        <TIME_SLOT TIME_SLOT_ID="{end_slot}" TIME_VALUE="{end_ms}"/>\n')
+
+            for tier_file, cell in zip(self._tier_files, row[1:]):
+                if not cell:
+                    continue
+                self._annotation_count += 1
+                tier_file.write(
+                    f'        <ANNOTATION>\n'
+                    f'            <ALIGNABLE_ANNOTATION ANNOTATION_ID="a{self._annotation_count}" '
+                    f'TIME_SLOT_REF1="{start_slot}" TIME_SLOT_REF2="{end_slot}">\n'
+                    f'                <ANNOTATION_VALUE>{escape(cell)}</ANNOTATION_VALUE>\n'
+                    f'            </ALIGNABLE_ANNOTATION>\n'
+                    f'        </ANNOTATION>\n')
+
+    def _write_document(self):
+        """
+        Writes the document, copying the spooled time slots and tiers into place.
+        """
+        date = datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds")
+        with open(self._path, "w", encoding="utf-8") as file:
+            file.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                       f'<ANNOTATION_DOCUMENT AUTHOR="" DATE="{date}" FORMAT="3.0" VERSION="3.0" '
+                       'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+                       'xsi:noNamespaceSchemaLocation="http://www.mpi.nl/tools/elan/EAFv3.0.xsd">\n'
+                       '    <HEADER MEDIA_FILE="" TIME_UNITS="milliseconds"/>\n'
+                       '    <TIME_ORDER>\n')
+            self._time_slot_file.seek(0)
+            shutil.copyfileobj(self._time_slot_file, file)
+            file.write('    </TIME_ORDER>\n')
+
+            for tier_id, tier_file in zip(self._tier_ids, self._tier_files):
+                file.write(f'    <TIER LINGUISTIC_TYPE_REF="default-lt" TIER_ID={quoteattr(tier_id)}>\n')
+                tier_file.seek(0)
+                shutil.copyfileobj(tier_file, file)
+                file.write('    </TIER>\n')
+
+            file.write('    <LINGUISTIC_TYPE GRAPHIC_REFERENCES="false" LINGUISTIC_TYPE_ID="default-lt" '
+                       'TIME_ALIGNABLE="true"/>\n'
+                       '</ANNOTATION_DOCUMENT>\n')
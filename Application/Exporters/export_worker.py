@@ -0,0 +1,88 @@
+import os
+import tempfile
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+
+class ExportWorker(QObject):
+    """
+    ExportWorker streams a snapshot of the encoding table to disk on a worker
+    thread. Rows are decoded and handed to an exporter in chunks, progress is
+    reported after every chunk, and the file is written to a temporary file
+    that only replaces the destination once the export has completed.
+    """
+    CHUNK_ROWS = 2000
+
+    progress = Signal(int)
+    finished = Signal(str)
+    failed = Signal(str)
+    canceled = Signal()
+
+    def __init__(self, exporter, path, headers, rows):
+        """
+        Constructor - Creates an instance of ExportWorker
+
+        Parameters:
+            exporter - exporter writing the destination format.
+            path - path of the file to export to.
+            headers - list of table headers.
+            rows - TableDataEntity holding a snapshot of the table to export.
+        """
+        super().__init__()
+        self._exporter = exporter
+        self._path = path
+        self._headers = headers
+        self._rows = rows
+        self._cancel_requested = False
+        # Message of the error that ended the run, read once the thread has finished.
+        self.error_message = None
+
+    def cancel(self):
+        """
+        Requests the export to stop after the chunk being written. This method
+        is called from the GUI thread while the worker thread is busy exporting.
+        """
+        self._cancel_requested = True
+
+    @Slot()
+    def run(self):
+        """
+        Exports the rows to a temporary file next to the destination, then
+        atomically renames it over the destination.
+        """
+        directory, file_name = os.path.split(os.path.abspath(self._path))
+        try:
+            descriptor, temp_path = tempfile.mkstemp(prefix=f".{file_name}.", suffix=".part", dir=directory)
+            os.close(descriptor)
+        except OSError as error:
+            self.error_message = str(error)
+            self.failed.emit(self.error_message)
+            return
+
+        try:
+            self._exporter.open(temp_path, self._headers)
+            rows_written = 0
+            for start in range(0, len(self._rows), self.CHUNK_ROWS):
+                if self._cancel_requested:
+                    break
+                chunk = self._rows.get_rows(start, self.CHUNK_ROWS)
+                self._exporter.write_rows(chunk)
+                rows_written += len(chunk)
+                self.progress.emit(rows_written)
+            self._exporter.close()
+
+            if self._cancel_requested:
+                os.remove(temp_path)
+                self.canceled.emit()
+            else:
+                os.replace(temp_path, self._path)
+                self.finished.emit(self._path)
+        except (OSError, ValueError) as error:
+            self._exporter.close()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            self.error_message = str(error)
+            self.failed.emit(self.error_message)
+        finally:
+            # Release the snapshot as soon as it has been written.
+            self._rows = None
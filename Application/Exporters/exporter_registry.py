@@ -0,0 +1,43 @@
+import importlib
+
+# Maps an export format id to its display name, module and exporter class name.
+# Exporter modules are only imported the first time their format is used.
+EXPORT_FORMATS = {
+    "csv": ("CSV", "Application.Exporters.csv_exporter", "CsvExporter"),
+    "jsonl": ("JSON Lines", "Application.Exporters.jsonl_exporter", "JsonLinesExporter"),
+    "sqlite": ("SQLite database", "Application.Exporters.sqlite_exporter", "SqliteExporter"),
+    "srt": ("SRT subtitles", "Application.Exporters.subtitle_exporter", "SrtExporter"),
+    "vtt": ("WebVTT subtitles", "Application.Exporters.subtitle_exporter", "WebVttExporter"),
+    "eaf": ("ELAN annotations", "Application.Exporters.eaf_exporter", "EafExporter"),
+}
+
+_exporter_classes = {}
+
+
+def get_export_formats():
+    """
+    Gets the available export formats, without loading any exporter.
+
+    Returns:
+        List of (format id, display name) pairs.
+    """
+    return [(format_id, entry[0]) for format_id, entry in EXPORT_FORMATS.items()]
+
+
+def create_exporter(format_id):
+    """
+    Creates an exporter for the given format, importing its module on first use.
+
+    Parameters:
+        format_id - identifier of the export format.
+
+    Returns:
+        A new exporter instance.
+    Exception:
+        KeyError - the format is not registered.
+    """
+    if format_id not in _exporter_classes:
+        _, module_name, class_name = EXPORT_FORMATS[format_id]
+        module = importlib.import_module(module_name)
+        _exporter_classes[format_id] = getattr(module, class_name)
+    return _exporter_classes[format_id]()
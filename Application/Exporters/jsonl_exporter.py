@@ -0,0 +1,47 @@
+import json
+
+
+class JsonLinesExporter:
+    """
+    JsonLinesExporter writes each encoding table row as a JSON object keyed by
+    the column headers, one object per line.
+    """
+    file_extension = "jsonl"
+    file_filter = "JSON Lines files (*.jsonl)"
+
+    def __init__(self):
+        """
+        Constructor - Creates an instance of JsonLinesExporter
+        """
+        self._file = None
+        self._headers = []
+
+    def open(self, path, headers):
+        """
+        Opens the destination file.
+
+        Parameters:
+            path - path of the file to write.
+            headers - list of table headers.
+        """
+        self._file = open(path, "w", encoding="utf-8")
+        self._headers = headers
+
+    def write_rows(self, rows):
+        """
+        Writes a chunk of table rows.
+
+        Parameters:
+            rows - list of rows, each a list of cell values or None for empty cells.
+        """
+        headers = self._headers
+        self._file.write("".join(
+            json.dumps(dict(zip(headers, row)), ensure_ascii=False) + "\n" for row in rows))
+
+    def close(self):
+        """
+        Flushes and closes the destination file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
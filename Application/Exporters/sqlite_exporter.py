@@ -0,0 +1,89 @@
+import sqlite3
+
+from Application.timecode import parse_time_range
+
+
+class SqliteExporter:
+    """
+    SqliteExporter writes the encoding table to a standalone SQLite database.
+    Every column becomes a text column of an "encoding_table" table, next to
+    the row index and the parsed time of the row in milliseconds, along with
+    the end time of rows coding a segment.
+    """
+    file_extension = "sqlite"
+    file_filter = "SQLite databases (*.sqlite *.db)"
+
+    def __init__(self):
+        """
+        Constructor - Creates an instance of SqliteExporter
+        """
+        self._connection = None
+        self._insert_statement = None
+        self._row_index = 0
+
+    def open(self, path, headers):
+        """
+        Creates the database and its table.
+
+        Parameters:
+            path - path of the database to write.
+            headers - list of table headers.
+        """
+        column_names = self._unique_column_names(headers)
+        quoted_names = ['"' + name.replace('"', '""') + '"' for name in column_names]
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+        self._connection.execute(
+            "CREATE TABLE encoding_table (row_index INTEGER PRIMARY KEY, time_ms INTEGER, end_ms INTEGER, "
+            + ", ".join(f"{name} TEXT" for name in quoted_names) + ")")
+        self._insert_statement = (
+            "INSERT INTO encoding_table (row_index, time_ms, end_ms, " + ", ".join(quoted_names) + ") VALUES ("
+            + ", ".join("?" * (len(quoted_names) + 3)) + ")")
+        self._row_index = 0
+
+    def write_rows(self, rows):
+        """
+        Inserts a chunk of table rows.
+
+        Parameters:
+            rows - list of rows, each a list of cell values or None for empty cells.
+        """
+        records = []
+        for row in rows:
+            time_ms, end_ms = parse_time_range(row[0]) if row else (None, None)
+            records.append([self._row_index, time_ms, end_ms] + list(row))
+            self._row_index += 1
+        self._connection.executemany(self._insert_statement, records)
+
+    def close(self):
+        """
+        Commits and closes the database.
+        """
+        if self._connection is not None:
+            self._connection.execute("CREATE INDEX encoding_table_time ON encoding_table (time_ms)")
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def _unique_column_names(headers):
+        """
+        Makes the table headers usable as distinct column names.
+
+        Parameters:
+            headers - list of table headers.
+        """
+        column_names = []
+        used_names = {"row_index", "time_ms", "end_ms"}
+        for col_ix, header in enumerate(headers):
+            name = header or str(col_ix + 1)
+            candidate = name
+            suffix = 2
+            while candidate.lower() in used_names:
+                candidate = f"{name}_{suffix}"
+                suffix += 1
+            used_names.add(candidate.lower())
+            column_names.append(candidate)
+        return column_names
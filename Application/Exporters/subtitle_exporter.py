@@ -0,0 +1,100 @@
+from Application.Exporters.cue_builder import CueBuilder
+from Application.timecode import format_timestamp
+
+
+class SrtExporter:
+    """
+    SrtExporter writes the timed rows of the encoding table as an SRT subtitle
+    track. The text of each cue lists the row's coded columns.
+    """
+    file_extension = "srt"
+    file_filter = "SRT subtitles (*.srt)"
+    fraction_separator = ","
+
+    def __init__(self):
+        """
+        Constructor - Creates an instance of SrtExporter
+        """
+        self._file = None
+        self._headers = []
+        self._cue_builder = None
+        self._cue_count = 0
+
+    def open(self, path, headers):
+        """
+        Opens the destination file.
+
+        Parameters:
+            path - path of the file to write.
+            headers - list of table headers.
+        """
+        self._file = open(path, "w", encoding="utf-8")
+        self._headers = headers
+        self._cue_builder = CueBuilder()
+        self._cue_count = 0
+        self._write_preamble()
+
+    def write_rows(self, rows):
+        """
+        Writes the cues completed by a chunk of table rows.
+
+        Parameters:
+            rows - list of rows, each a list of cell values or None for empty cells.
+        """
+        self._write_cues(self._cue_builder.add_rows(rows))
+
+    def close(self):
+        """
+        Writes the last cue, then flushes and closes the destination file.
+        """
+        if self._file is not None:
+            self._write_cues(self._cue_builder.finish())
+            self._file.close()
+            self._file = None
+
+    def _write_preamble(self):
+        """
+        Writes the content preceding the first cue. SRT files have none.
+        """
+
+    def _write_cues(self, cues):
+        """
+        Writes a list of cues.
+
+        Parameters:
+            cues - list of (start ms, end ms, row) cues.
+        """
+        blocks = []
+        for start_ms, end_ms, row in cues:
+            self._cue_count += 1
+            start = format_timestamp(start_ms, self.fraction_separator)
+            end = format_timestamp(end_ms, self.fraction_separator)
+            blocks.append(f"{self._cue_count}\n{start} --> {end}\n{self._cue_text(row)}\n\n")
+        self._file.write("".join(blocks))
+
+    def _cue_text(self, row):
+        """
+        Builds the text of a cue from the non-empty coded cells of a row.
+
+        Parameters:
+            row - table row whose first cell is its timestamp.
+        """
+        lines = [f"{header}: {cell}" for header, cell in zip(self._headers[1:], row[1:]) if cell]
+        # Blank lines would end the cue early.
+        return "\n".join(line.replace("\n", " ") for line in lines) or " "
+
+
+class WebVttExporter(SrtExporter):
+    """
+    WebVttExporter writes the timed rows of the encoding table as a WebVTT
+    subtitle track.
+    """
+    file_extension = "vtt"
+    file_filter = "WebVTT subtitles (*.vtt)"
+    fraction_separator = "."
+
+    def _write_preamble(self):
+        """
+        Writes the WebVTT file header.
+        """
+        self._file.write("WEBVTT\n\n")
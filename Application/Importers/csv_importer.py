@@ -0,0 +1,67 @@
+import csv
+
+
+class CsvImporter:
+    """
+    CsvImporter reads table rows from a CSV file whose first row holds the
+    column headers. Rows are read on demand, so the file is never loaded
+    into memory as a whole.
+    """
+
+    def __init__(self):
+        """
+        Constructor - Creates an instance of CsvImporter
+        """
+        self.headers = []
+        self._file = None
+        self._csv_reader = None
+
+    def open(self, path):
+        """
+        Opens the source file and reads its column headers.
+
+        Parameters:
+            path - path of the file to read.
+        """
+        self._file = open(path, "r", encoding="utf-8-sig", newline="")
+        self._csv_reader = csv.reader(self._file)
+        self.headers = next(self._csv_reader, [])
+
+    def read_rows(self, max_rows):
+        """
+        Reads the next chunk of rows.
+
+        Parameters:
+            max_rows - maximum number of rows to read.
+
+        Returns:
+            List of rows, each a list of cell strings aligned with the headers.
+            The list is empty once the file is exhausted.
+        Exception:
+            ValueError - the file is malformed.
+        """
+        rows = []
+        try:
+            for row in self._csv_reader:
+                if row:
+                    rows.append(row)
+                    if len(rows) == max_rows:
+                        break
+        except csv.Error as error:
+            raise ValueError(f"Malformed CSV on line {self._csv_reader.line_num}: {error}") from error
+        return rows
+
+    def tell(self):
+        """
+        Gets the number of bytes of the source file read so far.
+        """
+        return self._file.buffer.tell()
+
+    def close(self):
+        """
+        Closes the source file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._csv_reader = None
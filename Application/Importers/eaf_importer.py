@@ -0,0 +1,110 @@
+import os
+import xml.etree.ElementTree as ElementTree
+
+from Application.timecode import format_timestamp
+
+
+class EafImporter:
+    """
+    EafImporter reads table rows from an ELAN annotation document. Every tier
+    becomes a column, and annotations starting at the same time share a row.
+    As an EAF document stores its tiers one after another, all annotations are
+    collected when the file is opened. Parsed elements are discarded as soon
+    as they are read, so only the annotation values are held in memory.
+    """
+
+    def __init__(self):
+        """
+        Constructor - Creates an instance of EafImporter
+        """
+        self.headers = ["Time"]
+        self._rows = []
+        self._next_row = 0
+        self._size = 0
+
+    def open(self, path):
+        """
+        Reads the annotations of the source file.
+
+        Parameters:
+            path - path of the file to read.
+        Exception:
+            ValueError - the file is malformed.
+        """
+        self._size = os.path.getsize(path)
+        time_slots = {}  # time slot id : time in ms
+        annotation_starts = {}  # annotation id : time in ms
+        cells = {}  # time in ms : {column : value}
+        column = 0
+        annotation = None  # [annotation id, start ms] of the annotation being read
+
+        try:
+            for event, element in ElementTree.iterparse(path, events=("start", "end")):
+                tag = element.tag
+                if event == "start":
+                    # Attributes are complete at the start of an element.
+                    if tag == "TIER":
+                        self.headers.append(element.get("TIER_ID", str(len(self.headers) + 1)))
+                        column = len(self.headers) - 1
+                    elif tag == "ALIGNABLE_ANNOTATION":
+                        annotation = [element.get("ANNOTATION_ID"), time_slots.get(element.get("TIME_SLOT_REF1"))]
+                    elif tag == "REF_ANNOTATION":
+                        annotation = [element.get("ANNOTATION_ID"),
+                                      annotation_starts.get(element.get("ANNOTATION_REF"))]
+                    continue
+
+                if tag == "TIME_SLOT":
+                    time_value = element.get("TIME_VALUE")
+                    if time_value is not None:
+                        time_slots[element.get("TIME_SLOT_ID")] = int(time_value)
+                elif tag == "ANNOTATION_VALUE" and annotation is not None:
+                    annotation_id, start_ms = annotation
+                    annotation = None
+                    if start_ms is None:
+                        continue
+                    annotation_starts[annotation_id] = start_ms
+                    row_cells = cells.setdefault(start_ms, {})
+                    value = element.text or ""
+                    row_cells[column] = f"{row_cells[column]}; {value}" if column in row_cells else value
+                elif tag == "ANNOTATION":
+                    element.clear()
+        except (ElementTree.ParseError, ValueError) as error:
+            raise ValueError(f"Malformed ELAN file: {error}") from error
+
+        width = len(self.headers)
+        for start_ms in sorted(cells):
+            row = [format_timestamp(start_ms)] + [None] * (width - 1)
+            for column, value in cells[start_ms].items():
+                row[column] = value or None
+            self._rows.append(row)
+        self._next_row = 0
+
+    def read_rows(self, max_rows):
+        """
+        Reads the next chunk of rows, in order of time.
+
+        Parameters:
+            max_rows - maximum number of rows to read.
+
+        Returns:
+            List of rows, each a list of cell strings aligned with the headers.
+            The list is empty once all rows have been read.
+        """
+        rows = self._rows[self._next_row:self._next_row + max_rows]
+        self._next_row += len(rows)
+        return rows
+
+    def tell(self):
+        """
+        Gets the number of bytes of the source file read so far, in proportion
+        to the rows read as the file is parsed when opened.
+        """
+        if not self._rows:
+            return self._size
+        return self._size * self._next_row // len(self._rows)
+
+    def close(self):
+        """
+        Releases the collected rows.
+        """
+        self._rows = []
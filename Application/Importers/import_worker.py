@@ -0,0 +1,171 @@
+import os
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from Application.timecode import format_timestamp_cached, parse_timestamps
+
+# Case-insensitive source headers recognized as the time column of a row.
+TIME_HEADERS = {"time", "timestamp", "start", "start time", "begin", "begin time"}
+
+
+class ImportWorker(QObject):
+    """
+    ImportWorker reads a table data file in chunks on a worker thread and maps
+    its columns onto the encoding table. A source column is mapped onto the
+    table column of the same name, or else onto the next table column still
+    named by its default number, or else onto a new column. Time cells are
+    normalized to the table's timestamp format. Mapped rows are handed to the
+    GUI thread one chunk at a time.
+    """
+    CHUNK_ROWS = 5000
+
+    # list of (table column index, header) for columns to name or create
+    columns_mapped = Signal(list)
+    # first table row of the chunk, list of mapped rows
+    rows_read = Signal(int, list)
+    # percentage of the file read
+    progress = Signal(int)
+    finished = Signal(int)
+    failed = Signal(str)
+    canceled = Signal()
+
+    def __init__(self, importer, path, table_headers, first_row):
+        """
+        Constructor - Creates an instance of ImportWorker
+
+        Parameters:
+            importer - importer reading the source format.
+            path - path of the file to import.
+            table_headers - list of the encoding table's headers.
+            first_row - table row receiving the first imported row.
+        """
+        super().__init__()
+        self._importer = importer
+        self._path = path
+        self._table_headers = list(table_headers)
+        self._first_row = first_row
+        self._column_map = []  # source column index : table column index
+        self._cancel_requested = False
+        # Message of the error that ended the run, read once the thread has finished.
+        self.error_message = None
+
+    def cancel(self):
+        """
+        Requests the import to stop after the chunk being read. This method
+        is called from the GUI thread while the worker thread is busy importing.
+        """
+        self._cancel_requested = True
+
+    @Slot()
+    def run(self):
+        """
+        Reads the file chunk by chunk, emitting the mapped rows of each chunk.
+        """
+        rows_imported = 0
+        try:
+            size = os.path.getsize(self._path)
+            self._importer.open(self._path)
+            while not self._cancel_requested:
+                rows = self._importer.read_rows(self.CHUNK_ROWS)
+                if not rows:
+                    break
+                self._map_new_headers()
+                self.rows_read.emit(self._first_row + rows_imported, self._map_rows(rows))
+                rows_imported += len(rows)
+                self.progress.emit(100 * self._importer.tell() // size if size else 100)
+        except (OSError, ValueError) as error:
+            self.error_message = str(error)
+            self.failed.emit(self.error_message)
+            return
+        finally:
+            self._importer.close()
+
+        if self._cancel_requested:
+            self.canceled.emit()
+        else:
+            self.finished.emit(rows_imported)
+
+    def _map_new_headers(self):
+        """
+        Maps the source headers read since the last chunk onto table columns,
+        emitting the table columns that have to be named or created.
+        """
+        table_keys = [header.strip().casefold() for header in self._table_headers]
+        mapped_columns = set(self._column_map)
+        changes = []
+
+        for header in self._importer.headers[len(self._column_map):]:
+            key = str(header).strip().casefold()
+            if key in table_keys and table_keys.index(key) not in mapped_columns:
+                column = table_keys.index(key)
+            elif key in TIME_HEADERS and 0 not in mapped_columns:
+                column = 0
+            else:
+                column = self._find_unused_column(mapped_columns)
+                changes.append((column, header))
+                if column == len(self._table_headers):
+                    self._table_headers.append(header)
+                    table_keys.append(key)
+                else:
+                    self._table_headers[column] = header
+                    table_keys[column] = key
+            self._column_map.append(column)
+            mapped_columns.add(column)
+
+        if changes:
+            self.columns_mapped.emit(changes)
+
+    def _find_unused_column(self, mapped_columns):
+        """
+        Finds the first table column that still has its default numbered
+        header and has not been mapped, or the index of a new column.
+
+        Parameters:
+            mapped_columns - set of table columns already mapped.
+        """
+        for column in range(1, len(self._table_headers)):
+            if column not in mapped_columns and self._table_headers[column] == str(column + 1):
+                return column
+        return len(self._table_headers)
+
+    def _map_rows(self, rows):
+        """
+        Rearranges source rows into the table's column order.
+
+        Parameters:
+            rows - list of source rows.
+
+        Returns:
+            List of table rows, each a list of cell strings or None for empty cells.
+        """
+        column_map = self._column_map
+        width = len(self._table_headers)
+        time_source = column_map.index(0) if 0 in column_map else None
+        if time_source is not None:
+            times = self._normalize_times([row[time_source] if time_source < len(row) else None for row in rows])
+
+        table_rows = []
+        for row_ix, row in enumerate(rows):
+            table_row = [None] * width
+            for column, value in zip(column_map, row):
+                if value:
+                    table_row[column] = value
+            if time_source is not None:
+                table_row[0] = times[row_ix]
+            table_rows.append(table_row)
+        return table_rows
+
+    @staticmethod
+    def _normalize_times(texts):
+        """
+        Converts the time cells of a chunk to the table's "HH:MM:SS" format,
+        keeping the milliseconds only when there are any. Unrecognized text is
+        kept as is.
+
+        Parameters:
+            texts - list of the texts of the source time cells, or None.
+        """
+        times = parse_timestamps(text.strip() if text else None for text in texts)
+        return [(text or None) if milliseconds is None
+                else format_timestamp_cached(milliseconds, fraction_digits=3 if milliseconds % 1000 else 0)
+                for text, milliseconds in zip(texts, times)]
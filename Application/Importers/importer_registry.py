@@ -0,0 +1,51 @@
+import importlib
+import os
+
+# Maps an import file extension to its display name, module and importer class name.
+# Importer modules are only imported the first time their format is used.
+IMPORT_FORMATS = {
+    "csv": ("CSV files", "Application.Importers.csv_importer", "CsvImporter"),
+    "jsonl": ("JSON Lines files", "Application.Importers.jsonl_importer", "JsonLinesImporter"),
+    "srt": ("SRT subtitles", "Application.Importers.subtitle_importer", "SubtitleImporter"),
+    "vtt": ("WebVTT subtitles", "Application.Importers.subtitle_importer", "SubtitleImporter"),
+    "eaf": ("ELAN annotation files", "Application.Importers.eaf_importer", "EafImporter"),
+}
+
+_importer_classes = {}
+
+
+def get_import_file_filter():
+    """
+    Builds a file dialog filter listing every importable format, without
+    loading any importer.
+
+    Returns:
+        File dialog filter string.
+    """
+    all_patterns = " ".join(f"*.{extension}" for extension in IMPORT_FORMATS)
+    filters = [f"Table data ({all_patterns})"]
+    filters += [f"{entry[0]} (*.{extension})" for extension, entry in IMPORT_FORMATS.items()]
+    return ";;".join(filters)
+
+
+def create_importer(path):
+    """
+    Creates an importer for a file based on its extension, importing the
+    importer's module on first use.
+
+    Parameters:
+        path - path of the file to import.
+
+    Returns:
+        A new importer instance.
+    Exception:
+        ValueError - the extension is not a supported import format.
+    """
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension not in IMPORT_FORMATS:
+        raise ValueError(f"Unsupported table data format: .{extension}")
+    if extension not in _importer_classes:
+        _, module_name, class_name = IMPORT_FORMATS[extension]
+        module = importlib.import_module(module_name)
+        _importer_classes[extension] = getattr(module, class_name)
+    return _importer_classes[extension]()
@@ -0,0 +1,81 @@
+import json
+
+
+class JsonLinesImporter:
+    """
+    JsonLinesImporter reads table rows from a JSON Lines file holding one
+    object per row. Object keys are the column headers, and keys that first
+    appear part way through the file are added as new headers.
+    """
+
+    def __init__(self):
+        """
+        Constructor - Creates an instance of JsonLinesImporter
+        """
+        self.headers = []
+        self._header_indices = {}
+        self._file = None
+        self._line_number = 0
+
+    def open(self, path):
+        """
+        Opens the source file.
+
+        Parameters:
+            path - path of the file to read.
+        """
+        self._file = open(path, "rb")
+        self._line_number = 0
+
+    def read_rows(self, max_rows):
+        """
+        Reads the next chunk of rows.
+
+        Parameters:
+            max_rows - maximum number of rows to read.
+
+        Returns:
+            List of rows, each a list of cell strings aligned with the headers.
+            The list is empty once the file is exhausted.
+        Exception:
+            ValueError - the file is malformed.
+        """
+        rows = []
+        for line in self._file:
+            self._line_number += 1
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Malformed JSON on line {self._line_number}: {error}") from error
+            if not isinstance(obj, dict):
+                raise ValueError(f"Expected an object on line {self._line_number}")
+
+            row = [None] * len(self.headers)
+            for key, value in obj.items():
+                column = self._header_indices.get(key)
+                if column is None:
+                    column = self._header_indices[key] = len(self.headers)
+                    self.headers.append(key)
+                    row.append(None)
+                if value is not None:
+                    row[column] = value if isinstance(value, str) else json.dumps(value)
+            rows.append(row)
+            if len(rows) == max_rows:
+                break
+        return rows
+
+    def tell(self):
+        """
+        Gets the number of bytes of the source file read so far.
+        """
+        return self._file.tell()
+
+    def close(self):
+        """
+        Closes the source file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
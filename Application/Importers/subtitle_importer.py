@@ -0,0 +1,125 @@
+import re
+
+from Application.timecode import format_timestamp, parse_timestamp
+
+# Matches a cue line in which a column header labels its value, as in "Code: A".
+_LABELED_LINE_PATTERN = re.compile(r"^([^:]{1,64}):\s?(.*)$")
+
+
+class SubtitleImporter:
+    """
+    SubtitleImporter reads table rows from SRT and WebVTT subtitle files, one
+    row per cue, with the cue's start time in the "Time" column. Cues written
+    by the subtitle exporters label every line with its column header, and
+    those lines are read back into their columns. The text of any other cue
+    is read into a "Text" column.
+    """
+    TEXT_HEADER = "Text"
+
+    def __init__(self):
+        """
+        Constructor - Creates an instance of SubtitleImporter
+        """
+        self.headers = ["Time"]
+        self._header_indices = {"Time": 0}
+        self._file = None
+
+    def open(self, path):
+        """
+        Opens the source file.
+
+        Parameters:
+            path - path of the file to read.
+        """
+        self._file = open(path, "rb")
+
+    def read_rows(self, max_rows):
+        """
+        Reads the next chunk of cues.
+
+        Parameters:
+            max_rows - maximum number of rows to read.
+
+        Returns:
+            List of rows, each a list of cell strings aligned with the headers.
+            The list is empty once the file is exhausted.
+        """
+        rows = []
+        block = []
+        for raw_line in self._file:
+            line = raw_line.decode("utf-8-sig", errors="replace").rstrip("\r\n")
+            if line.strip():
+                block.append(line)
+                continue
+            row = self._read_cue(block)
+            block = []
+            if row is not None:
+                rows.append(row)
+                if len(rows) == max_rows:
+                    return rows
+
+        row = self._read_cue(block)
+        if row is not None:
+            rows.append(row)
+        return rows
+
+    def tell(self):
+        """
+        Gets the number of bytes of the source file read so far.
+        """
+        return self._file.tell()
+
+    def close(self):
+        """
+        Closes the source file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read_cue(self, block):
+        """
+        Converts the lines of a cue block into a row. Blocks without a timing
+        line, such as the WebVTT header and comments, are skipped.
+
+        Parameters:
+            block - list of the block's lines.
+
+        Returns:
+            The row, or None if the block is not a cue.
+        """
+        for timing_ix, line in enumerate(block):
+            if "-->" in line:
+                break
+        else:
+            return None
+
+        start_ms = parse_timestamp(block[timing_ix].split("-->", 1)[0].strip())
+        if start_ms is None:
+            return None
+        row = [format_timestamp(start_ms)] + [None] * (len(self.headers) - 1)
+
+        text_lines = block[timing_ix + 1:]
+        matches = [_LABELED_LINE_PATTERN.match(line) for line in text_lines]
+        if text_lines and all(matches):
+            for match in matches:
+                self._set_cell(row, match.group(1).strip(), match.group(2))
+        elif text_lines:
+            self._set_cell(row, self.TEXT_HEADER, " ".join(line.strip() for line in text_lines))
+        return row
+
+    def _set_cell(self, row, header, value):
+        """
+        Sets the cell of a row under a header, adding the header if it is new.
+
+        Parameters:
+            row - row being read.
+            header - column header of the cell.
+            value - text of the cell.
+        """
+        column = self._header_indices.get(header)
+        if column is None:
+            column = self._header_indices[header] = len(self.headers)
+            self.headers.append(header)
+        row.extend([None] * (column + 1 - len(row)))
+        row[column] = value or None
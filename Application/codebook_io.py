@@ -0,0 +1,346 @@
+import csv
+import json
+import os
+import uuid
+import xml.etree.ElementTree as ElementTree
+from xml.sax.saxutils import XMLGenerator
+
+from Models.button_definition_entity import ButtonDefinitionEntity
+
+# Namespace of REFI-QDA codebook (.qdc) documents.
+QDC_NAMESPACE = "urn:QDA-XML:codebook:1.0"
+
+# Number of characters read from a JSON document at a time.
+JSON_CHUNK_SIZE = 64 * 1024
+
+
+def get_codebook_format(path):
+    """
+    Determines the codebook format of a file from its extension.
+
+    Parameters:
+        path - path of the codebook file.
+
+    Returns:
+        One of "csv", "json", "jsonl" or "qdc".
+    Exception:
+        ValueError - the extension is not a supported codebook format.
+    """
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "xml":
+        extension = "qdc"
+    if extension not in CODEBOOK_READERS:
+        raise ValueError(f"Unsupported codebook format: .{extension}")
+    return extension
+
+
+def read_codebook(path):
+    """
+    Streams the button definitions of a codebook file. Definitions are yielded
+    one at a time as they are parsed, parents before their children wherever
+    the format allows it.
+
+    Parameters:
+        path - path of the codebook file.
+
+    Returns:
+        Generator of button definitions.
+    Exception:
+        ValueError - the file is malformed.
+    """
+    codebook_format = get_codebook_format(path)
+    if codebook_format == "qdc":
+        file = open(path, "rb")
+    else:
+        file = open(path, "r", encoding="utf-8-sig", newline="")
+
+    with file:
+        try:
+            yield from CODEBOOK_READERS[codebook_format](file)
+        # JSONDecodeError and malformed button definitions are ValueErrors.
+        except (csv.Error, ValueError, ElementTree.ParseError) as error:
+            raise ValueError(f"Unable to read codebook {os.path.basename(path)}: {error}") from error
+
+
+def write_codebook(path, button_definitions, get_children):
+    """
+    Streams a codebook to a file, walking the hierarchy depth first so that
+    only the subtree currently being written is held in memory.
+
+    Parameters:
+        path - path of the codebook file to write.
+        button_definitions - top-level button definitions.
+        get_children - function returning the child definitions of a code.
+    """
+    codebook_format = get_codebook_format(path)
+    if codebook_format == "qdc":
+        file = open(path, "wb")
+    else:
+        file = open(path, "w", encoding="utf-8", newline="")
+
+    with file:
+        CODEBOOK_WRITERS[codebook_format](file, button_definitions, get_children)
+
+
+def iter_codebook_tree(button_definitions, get_children):
+    """
+    Walks a codebook hierarchy depth first.
+
+    Parameters:
+        button_definitions - button definitions to start from.
+        get_children - function returning the child definitions of a code.
+
+    Returns:
+        Generator of button definitions, parents before their children.
+    """
+    for button_definition in button_definitions:
+        yield button_definition
+        yield from iter_codebook_tree(get_children(button_definition.button_id), get_children)
+
+
+def read_csv_codebook(file):
+    """
+    Streams button definitions from a CSV codebook. The first row is a header
+    with a "button-id" column and an optional "parent-id" column. Every other
+    column of a row is a data item.
+
+    Parameters:
+        file - text file opened for reading.
+    """
+    rows = csv.reader(file)
+    header = next(rows, None)
+    if header is None:
+        return
+    header = [column.strip().lower() for column in header]
+    if "button-id" not in header:
+        raise csv.Error('missing "button-id" column')
+    id_column = header.index("button-id")
+    parent_column = header.index("parent-id") if "parent-id" in header else None
+
+    for row in rows:
+        if not row:
+            continue
+        row += [""] * (len(header) - len(row))
+        parent_id = row[parent_column] if parent_column is not None else ""
+        # Rows may hold more data items than the header names.
+        data = [item for ix, item in enumerate(row) if ix != id_column and ix != parent_column]
+        # Trailing empty data cells only pad the row to the widest definition.
+        while data and data[-1] == "":
+            data.pop()
+        yield ButtonDefinitionEntity(row[id_column], data, parent_id or None)
+
+
+def write_csv_codebook(file, button_definitions, get_children):
+    """
+    Streams button definitions to a CSV codebook.
+
+    Parameters:
+        file - text file opened for writing.
+        button_definitions - top-level button definitions.
+        get_children - function returning the child definitions of a code.
+    """
+    csv_writer = csv.writer(file)
+    csv_writer.writerow(["button-id", "parent-id", "data"])
+    for button_definition in iter_codebook_tree(button_definitions, get_children):
+        csv_writer.writerow([button_definition.button_id, button_definition.parent_id or ""]
+                            + list(button_definition.data))
+
+
+def _to_button_definition(obj):
+    """
+    Converts a decoded JSON object to a button definition.
+
+    Parameters:
+        obj - dictionary decoded from JSON.
+    """
+    if not isinstance(obj, dict) or "button_id" not in obj:
+        raise json.JSONDecodeError('expected an object with a "button_id" key', "", 0)
+    data = obj.get("data")
+    if data is None:
+        data = []
+    elif not isinstance(data, list):
+        raise ValueError(f'"data" of button {obj["button_id"]!r} is not an array')
+    parent_id = obj.get("parent_id")
+    # Ids are compared as strings, as they are read from QSettings.
+    return ButtonDefinitionEntity(str(obj["button_id"]), [str(item) for item in data],
+                                  str(parent_id) if parent_id is not None else None)
+
+
+def read_json_codebook(file):
+    """
+    Streams button definitions from a JSON codebook holding an array of
+    objects. The array is decoded one element at a time from fixed size
+    chunks instead of loading the whole document.
+
+    Parameters:
+        file - text file opened for reading.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    started = False
+    end_of_file = False
+
+    while True:
+        # Skip whitespace and separators between array elements.
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if not started and position < len(buffer):
+            if buffer[position] != "[":
+                raise json.JSONDecodeError("expected an array of button definitions", buffer, position)
+            started = True
+            position += 1
+            continue
+        if started and position < len(buffer) and buffer[position] == "]":
+            return
+
+        try:
+            if position >= len(buffer):
+                raise ValueError
+            obj, position = decoder.raw_decode(buffer, position)
+        except ValueError:
+            if end_of_file:
+                if buffer[position:].strip():
+                    # Decode once more for a precise error message.
+                    decoder.raw_decode(buffer, position)
+                raise json.JSONDecodeError("unterminated array", buffer, position)
+            chunk = file.read(JSON_CHUNK_SIZE)
+            end_of_file = chunk == ""
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield _to_button_definition(obj)
+
+
+def write_json_codebook(file, button_definitions, get_children):
+    """
+    Streams button definitions to a JSON codebook.
+
+    Parameters:
+        file - text file opened for writing.
+        button_definitions - top-level button definitions.
+        get_children - function returning the child definitions of a code.
+    """
+    file.write("[")
+    separator = "\n"
+    for button_definition in iter_codebook_tree(button_definitions, get_children):
+        file.write(separator)
+        file.write(json.dumps({"button_id": button_definition.button_id,
+                               "parent_id": button_definition.parent_id,
+                               "data": list(button_definition.data)}))
+        separator = ",\n"
+    file.write("\n]\n")
+
+
+def read_jsonl_codebook(file):
+    """
+    Streams button definitions from a JSON Lines codebook, one object per line.
+
+    Parameters:
+        file - text file opened for reading.
+    """
+    for line in file:
+        if line.strip():
+            yield _to_button_definition(json.loads(line))
+
+
+def write_jsonl_codebook(file, button_definitions, get_children):
+    """
+    Streams button definitions to a JSON Lines codebook.
+
+    Parameters:
+        file - text file opened for writing.
+        button_definitions - top-level button definitions.
+        get_children - function returning the child definitions of a code.
+    """
+    for button_definition in iter_codebook_tree(button_definitions, get_children):
+        file.write(json.dumps({"button_id": button_definition.button_id,
+                               "parent_id": button_definition.parent_id,
+                               "data": list(button_definition.data)}))
+        file.write("\n")
+
+
+def read_qdc_codebook(file):
+    """
+    Streams button definitions from a REFI-QDA style codebook. Nested <Code>
+    elements become nested codes, and the lines of a code's <Description> are
+    its data items. Parsed elements are discarded as soon as they are read.
+
+    Parameters:
+        file - binary file opened for reading.
+    """
+    code_stack = []
+    for event, element in ElementTree.iterparse(file, events=("start", "end")):
+        tag = element.tag.rsplit("}", 1)[-1]
+        if tag != "Code":
+            continue
+        if event == "start":
+            parent_id = code_stack[-1][0] if code_stack else None
+            code_stack.append((element.get("name", ""), parent_id))
+            continue
+
+        button_id, parent_id = code_stack.pop()
+        description = element.find(f"{{{QDC_NAMESPACE}}}Description")
+        if description is None:
+            description = element.find("Description")
+        data = description.text.split("\n") if description is not None and description.text else []
+        element.clear()
+        yield ButtonDefinitionEntity(button_id, data, parent_id)
+
+
+def write_qdc_codebook(file, button_definitions, get_children):
+    """
+    Streams button definitions to a REFI-QDA style codebook.
+
+    Parameters:
+        file - binary file opened for writing.
+        button_definitions - top-level button definitions.
+        get_children - function returning the child definitions of a code.
+    """
+    generator = XMLGenerator(file, encoding="utf-8", short_empty_elements=True)
+    generator.startDocument()
+    generator.startElement("CodeBook", {"xmlns": QDC_NAMESPACE, "origin": "Qualitative Coding App"})
+    generator.startElement("Codes", {})
+
+    def write_codes(definitions):
+        for button_definition in definitions:
+            generator.startElement("Code", {"guid": _code_guid(button_definition.button_id),
+                                            "name": button_definition.button_id,
+                                            "isCodable": "true"})
+            if button_definition.data:
+                generator.startElement("Description", {})
+                generator.characters("\n".join(button_definition.data))
+                generator.endElement("Description")
+            write_codes(get_children(button_definition.button_id))
+            generator.endElement("Code")
+
+    write_codes(button_definitions)
+    generator.endElement("Codes")
+    generator.endElement("CodeBook")
+    generator.endDocument()
+
+
+def _code_guid(button_id):
+    """
+    Derives a stable guid for a code from its identifier, as codes are
+    identified by name within the application.
+
+    Parameters:
+        button_id - identifier of the code.
+    """
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, "qualitative-coding-app:" + button_id))
+
+
+CODEBOOK_READERS = {
+    "csv": read_csv_codebook,
+    "json": read_json_codebook,
+    "jsonl": read_jsonl_codebook,
+    "qdc": read_qdc_codebook,
+}
+
+CODEBOOK_WRITERS = {
+    "csv": write_csv_codebook,
+    "json": write_json_codebook,
+    "jsonl": write_jsonl_codebook,
+    "qdc": write_qdc_codebook,
+}
@@ -1,5 +1,6 @@
 from PySide6.QtCore import QSettings
 
+from Application.codebook_io import read_codebook, write_codebook
 from Models.button_definition_entity import ButtonDefinitionEntity
 from Models.global_settings_entity import GlobalSettingsEntity
 
@@ -15,6 +16,12 @@ class GlobalSettingsManager:
         """
         self.global_settings_entity = GlobalSettingsEntity()
 
+        # QSettings group names of every code that has nested codes, read lazily.
+        self._codebook_parents = None
+
+        # Maps every button id in the codebook to its parent id, built on demand.
+        self._button_id_index = None
+
         # Check if global settings have been loaded upon initializing the global settings manager.
         settings = QSettings()
         if "global-settings" in settings.childGroups():
@@ -22,17 +29,69 @@ class GlobalSettingsManager:
 
     def add_button_definition(self, button_definition):
         """
-        Add a button definition to the button definition list
+        Add a button definition to the button definition list, or to the child
+        definitions of its parent code if the definition is nested.
         """
+        if self._button_id_index is not None:
+            self._button_id_index[button_definition.button_id] = button_definition.parent_id
+
+        if button_definition.parent_id is not None:
+            self.get_child_button_definitions(button_definition.parent_id).append(button_definition)
+            self.save_child_button_definitions(button_definition.parent_id)
+            return
+
         self.global_settings_entity.button_definitions.append(button_definition)
         self.save_encoding_button_definitions()
 
     def remove_button_definition(self, button_definition):
         """
-        Remove a button definition from the button definition list
+        Remove a button definition from the button definition list, along with
+        all the codes nested beneath it.
         """
-        self.global_settings_entity.button_definitions.remove(button_definition)
-        self.save_encoding_button_definitions()
+        if button_definition.parent_id is not None:
+            self.get_child_button_definitions(button_definition.parent_id).remove(button_definition)
+            self.save_child_button_definitions(button_definition.parent_id)
+        else:
+            self.global_settings_entity.button_definitions.remove(button_definition)
+            self.save_encoding_button_definitions()
+        self.remove_child_button_definitions(button_definition.button_id)
+        if self._button_id_index is not None:
+            self._button_id_index.pop(button_definition.button_id, None)
+
+    def replace_button_definition(self, old_button_definition, new_button_definition):
+        """
+        Replace a button definition in place, keeping its position and parent.
+        If the definition is renamed, its nested codes are moved to the new name.
+
+        Parameters:
+            old_button_definition - button definition to replace
+            new_button_definition - button definition to store in its place
+        """
+        new_button_definition.parent_id = old_button_definition.parent_id
+        if old_button_definition.parent_id is not None:
+            siblings = self.get_child_button_definitions(old_button_definition.parent_id)
+        else:
+            siblings = self.global_settings_entity.button_definitions
+        siblings[siblings.index(old_button_definition)] = new_button_definition
+
+        old_id = old_button_definition.button_id
+        new_id = new_button_definition.button_id
+        if self._button_id_index is not None:
+            self._button_id_index.pop(old_id, None)
+            self._button_id_index[new_id] = new_button_definition.parent_id
+        if old_id != new_id and self.has_child_button_definitions(old_id):
+            children = self.get_child_button_definitions(old_id)
+            for child in children:
+                child.parent_id = new_id
+            self.global_settings_entity.child_button_definitions[new_id] = children
+            self.save_child_button_definitions(new_id)
+            self.global_settings_entity.child_button_definitions[old_id] = []
+            self.save_child_button_definitions(old_id)
+
+        if old_button_definition.parent_id is not None:
+            self.save_child_button_definitions(old_button_definition.parent_id)
+        else:
+            self.save_encoding_button_definitions()
 
     def get_button_definition(self, button_id):
         """
@@ -43,6 +102,142 @@ class GlobalSettingsManager:
                 return button_definition
         return None
 
+    def find_button_definition(self, button_id):
+        """
+        Return a button definition from the top-level definitions or from any
+        codebook subtree that has already been loaded.
+
+        Parameters:
+            button_id - identifier of the button definition to find
+        """
+        button_definition = self.get_button_definition(button_id)
+        if button_definition is not None:
+            return button_definition
+        for children in self.global_settings_entity.child_button_definitions.values():
+            for child in children:
+                if button_id == child.button_id:
+                    return child
+        return None
+
+    def has_button_id(self, button_id):
+        """
+        Determines whether a code of the codebook has an identifier, including
+        the codes of subtrees that have not been loaded.
+
+        Parameters:
+            button_id - identifier of the code to look for
+
+        Returns:
+            True if the codebook has a code of that identifier, False otherwise.
+        """
+        return button_id in self._get_button_id_index()
+
+    def get_child_button_definitions(self, parent_id):
+        """
+        Return the child definitions of a code, loading its subtree from
+        QSettings the first time it is requested.
+
+        Parameters:
+            parent_id - identifier of the parent code
+        """
+        child_button_definitions = self.global_settings_entity.child_button_definitions
+        if parent_id not in child_button_definitions:
+            child_button_definitions[parent_id] = self.load_child_button_definitions(parent_id)
+        return child_button_definitions[parent_id]
+
+    def has_child_button_definitions(self, parent_id):
+        """
+        Determines whether a code has nested codes, without loading its subtree.
+
+        Parameters:
+            parent_id - identifier of the parent code
+
+        Returns:
+            True if the code has child definitions, False otherwise.
+        """
+        child_button_definitions = self.global_settings_entity.child_button_definitions
+        if parent_id in child_button_definitions:
+            return len(child_button_definitions[parent_id]) > 0
+        return self._codebook_group(parent_id) in self._get_codebook_parents()
+
+    def remove_child_button_definitions(self, parent_id):
+        """
+        Removes every code nested beneath the given code from the codebook.
+
+        Parameters:
+            parent_id - identifier of the parent code
+        """
+        if not self.has_child_button_definitions(parent_id):
+            self.global_settings_entity.child_button_definitions.pop(parent_id, None)
+            return
+
+        for child in self.get_child_button_definitions(parent_id):
+            self.remove_child_button_definitions(child.button_id)
+            if self._button_id_index is not None:
+                self._button_id_index.pop(child.button_id, None)
+        self.global_settings_entity.child_button_definitions[parent_id] = []
+        self.save_child_button_definitions(parent_id)
+        del self.global_settings_entity.child_button_definitions[parent_id]
+
+    def import_codebook(self, path):
+        """
+        Imports every button definition of a CSV, JSON, JSON Lines or REFI-QDA
+        codebook file. The file is parsed as a stream, definitions are validated
+        and deduplicated against the codebook's id index, and all accepted
+        definitions are committed to QSettings in a single batched write.
+
+        Parameters:
+            path - path of the codebook file.
+
+        Returns:
+            Tuple of the number of imported and skipped definitions.
+        Exception:
+            ValueError - the file is not a supported or well-formed codebook.
+        """
+        button_id_index = self._get_button_id_index()
+        imported = {}  # parent id : list of imported button definitions
+        pending = {}   # unknown parent id : definitions waiting for their parent
+        imported_count = skipped_count = 0
+
+        def accept(button_definition):
+            nonlocal imported_count
+            button_id_index[button_definition.button_id] = button_definition.parent_id
+            imported.setdefault(button_definition.parent_id, []).append(button_definition)
+            imported_count += 1
+            # Children listed before their parent can now be accepted too.
+            for child in pending.pop(button_definition.button_id, []):
+                accept(child)
+
+        for button_definition in read_codebook(path):
+            button_id = button_definition.button_id
+            if not button_id or button_id == button_definition.parent_id or button_id in button_id_index:
+                skipped_count += 1
+            elif button_definition.parent_id is not None and button_definition.parent_id not in button_id_index:
+                pending.setdefault(button_definition.parent_id, []).append(button_definition)
+            else:
+                accept(button_definition)
+        skipped_count += sum(len(children) for children in pending.values())
+
+        if imported:
+            self._commit_imported_button_definitions(imported)
+        return imported_count, skipped_count
+
+    def export_codebook(self, path):
+        """
+        Exports the whole codebook hierarchy to a CSV, JSON, JSON Lines or
+        REFI-QDA codebook file. Subtrees that have not been loaded are read
+        one at a time while writing, without being cached.
+
+        Parameters:
+            path - path of the codebook file to write.
+        """
+        def get_children(parent_id):
+            if parent_id in self.global_settings_entity.child_button_definitions:
+                return self.global_settings_entity.child_button_definitions[parent_id]
+            return self.load_child_button_definitions(parent_id)
+
+        write_codebook(path, self.global_settings_entity.button_definitions, get_children)
+
     def save_encoding_button_definitions(self):
         """
         Update the global settings
@@ -52,19 +247,57 @@ class GlobalSettingsManager:
         settings.beginGroup("global-settings")
         settings.beginGroup("encoding-buttons")
 
-        settings.beginWriteArray("button-definitions", len(self.global_settings_entity.button_definitions))
-        for index, button_definition in enumerate(self.global_settings_entity.button_definitions):
-            settings.setArrayIndex(index)
-            settings.setValue("button-id", button_definition.button_id)
-            settings.beginWriteArray("data", len(button_definition.data))
-            for data_index, data_item in enumerate(button_definition.data):
-                settings.setArrayIndex(data_index)
-                settings.setValue("data-item", data_item)
-            settings.endArray()
-        settings.endArray()
+        self._write_button_definitions(settings, self.global_settings_entity.button_definitions)
+
+        settings.endGroup()  # encoding-buttons
+        settings.endGroup()  # global-settings
 
+    def save_child_button_definitions(self, parent_id):
+        """
+        Writes the child definitions of a single code to QSettings, leaving the
+        rest of the codebook untouched.
+
+        Parameters:
+            parent_id - identifier of the parent code
+        """
+        settings = QSettings()
+        settings.beginGroup("global-settings")
+        settings.beginGroup("encoding-buttons")
+        settings.beginGroup("codebook")
+
+        self._write_child_button_definitions(settings, parent_id)
+
+        settings.endGroup()  # codebook
+        settings.endGroup()  # encoding-buttons
+        settings.endGroup()  # global-settings
+
+    def load_child_button_definitions(self, parent_id):
+        """
+        Reads the child definitions of a single code from QSettings.
+
+        Parameters:
+            parent_id - identifier of the parent code
+
+        Returns:
+            List of child button definitions.
+        """
+        group = self._codebook_group(parent_id)
+        if group not in self._get_codebook_parents():
+            return []
+
+        settings = QSettings()
+        settings.beginGroup("global-settings")
+        settings.beginGroup("encoding-buttons")
+        settings.beginGroup("codebook")
+        settings.beginGroup(group)
+
+        children = self._read_button_definitions(settings, parent_id)
+
+        settings.endGroup()  # group
+        settings.endGroup()  # codebook
         settings.endGroup()  # encoding-buttons
         settings.endGroup()  # global-settings
+        return children
 
     def load_global_settings(self):
         """
@@ -84,6 +317,22 @@ class GlobalSettingsManager:
         if table_maximum_width:
             self.global_settings_entity.table_maximum_width = int(table_maximum_width)
 
+        undo_memory_budget = settings.value("undo_memory_budget")
+        if undo_memory_budget:
+            self.global_settings_entity.undo_memory_budget = int(undo_memory_budget)
+
+        table_row_height_mode = settings.value("table_row_height_mode")
+        if table_row_height_mode:
+            self.global_settings_entity.table_row_height_mode = int(table_row_height_mode)
+
+        seek_preroll = settings.value("seek_preroll")
+        if seek_preroll:
+            self.global_settings_entity.seek_preroll = int(seek_preroll)
+
+        self.global_settings_entity.table_auto_sort = settings.value("table_auto_sort", False, type=bool)
+        self.global_settings_entity.table_segment_coding = settings.value("table_segment_coding", False, type=bool)
+        self.global_settings_entity.table_follow_playback = settings.value("table_follow_playback", False, type=bool)
+
         # Sets the cell size with width, index 0, and height, index 1 to global settings entity
         table_cell_size_width = settings.value("table_cell_size_width")
         table_cell_size_height = settings.value("table_cell_size_height")
@@ -96,24 +345,13 @@ class GlobalSettingsManager:
 
         settings.beginGroup("encoding-buttons")
 
-        button_definitions_length = settings.beginReadArray("button-definitions")
-        if not button_definitions_length:
-            button_definitions_length = 0
-
         self.global_settings_entity.button_definitions.clear()  # Clear button definitions
+        self.global_settings_entity.button_definitions.extend(self._read_button_definitions(settings))
 
-        for index in range(button_definitions_length):
-            settings.setArrayIndex(index)
-            button_id = settings.value("button-id")
-            data = []
-            data_length = settings.beginReadArray("data")
-            for data_index in range(data_length):
-                settings.setArrayIndex(data_index)
-                data.append(settings.value("data-item"))
-            settings.endArray()
-            button_definition = ButtonDefinitionEntity(button_id, data)
-            self.global_settings_entity.button_definitions.append(button_definition)
-        settings.endArray()
+        # Nested codes are only read once their parent is expanded.
+        self.global_settings_entity.child_button_definitions.clear()
+        self._codebook_parents = None
+        self._button_id_index = None
 
         settings.endGroup()  # encoding-buttons
         settings.endGroup()  # global-settings
@@ -136,9 +374,43 @@ class GlobalSettingsManager:
         settings.setValue("table_cell_size_width", self.global_settings_entity.table_cell_size[0])
         settings.setValue("table_cell_size_height", self.global_settings_entity.table_cell_size[1])
 
+        settings.setValue("undo_memory_budget", self.global_settings_entity.undo_memory_budget)
+        settings.setValue("table_row_height_mode", self.global_settings_entity.table_row_height_mode)
+        settings.setValue("seek_preroll", self.global_settings_entity.seek_preroll)
+        settings.setValue("table_auto_sort", self.global_settings_entity.table_auto_sort)
+        settings.setValue("table_segment_coding", self.global_settings_entity.table_segment_coding)
+        settings.setValue("table_follow_playback", self.global_settings_entity.table_follow_playback)
+
         settings.endGroup()
         settings.endGroup()
 
+    def replace_global_settings(self, global_settings_entity):
+        """
+        Replaces the user settings and the whole codebook, removing the previous
+        ones from QSettings. Every codebook group is written through a single
+        QSettings instance, synced once.
+
+        Parameters:
+            global_settings_entity - GlobalSettingsEntity holding the new settings
+        """
+        settings = QSettings()
+        settings.remove("global-settings")
+        self.global_settings_entity = global_settings_entity
+        self._codebook_parents = set()
+        self._button_id_index = None
+        self.save_user_settings()
+
+        settings.beginGroup("global-settings")
+        settings.beginGroup("encoding-buttons")
+        self._write_button_definitions(settings, global_settings_entity.button_definitions)
+        settings.beginGroup("codebook")
+        for parent_id in global_settings_entity.child_button_definitions:
+            self._write_child_button_definitions(settings, parent_id)
+        settings.endGroup()  # codebook
+        settings.endGroup()  # encoding-buttons
+        settings.endGroup()  # global-settings
+        settings.sync()
+
     def set_table_padding(self, table_padding):
         """
         Setter method to set the cell padding to the global settings entity.
@@ -166,3 +438,224 @@ class GlobalSettingsManager:
         """
         self.global_settings_entity.table_maximum_width = table_maximum_width
 
+    def set_undo_memory_budget(self, undo_memory_budget):
+        """
+        Setter method to set the memory budget of the table's undo history to the global settings entity.
+
+        Parameter:
+            Int representing the budget in MB.
+        """
+        self.global_settings_entity.undo_memory_budget = undo_memory_budget
+
+    def set_table_row_height_mode(self, table_row_height_mode):
+        """
+        Setter method to set how the heights of the table's rows are determined to the global settings entity.
+
+        Parameter:
+            Int representing the row height mode of the encoding table.
+        """
+        self.global_settings_entity.table_row_height_mode = table_row_height_mode
+
+    def set_seek_preroll(self, seek_preroll):
+        """
+        Setter method to set the time played before a row's time when seeking to it to the global settings entity.
+
+        Parameter:
+            Int representing the preroll in ms.
+        """
+        self.global_settings_entity.seek_preroll = seek_preroll
+
+    def set_table_auto_sort(self, table_auto_sort):
+        """
+        Setter method to set whether coded events are inserted in time order to the global settings entity.
+
+        Parameter:
+            Bool representing whether the table's rows are kept in time order.
+        """
+        self.global_settings_entity.table_auto_sort = table_auto_sort
+
+    def set_table_segment_coding(self, table_segment_coding):
+        """
+        Setter method to set whether codes start and end segments to the global settings entity.
+
+        Parameter:
+            Bool representing whether a second press of a code ends the segment it started.
+        """
+        self.global_settings_entity.table_segment_coding = table_segment_coding
+
+    def set_table_follow_playback(self, table_follow_playback):
+        """
+        Setter method to set whether the table follows the video to the global settings entity.
+
+        Parameter:
+            Bool representing whether the row at the video's position is marked and scrolled to.
+        """
+        self.global_settings_entity.table_follow_playback = table_follow_playback
+
+    def _get_codebook_parents(self):
+        """
+        Gets the set of codebook groups holding nested codes, reading the group
+        names from QSettings on first use.
+
+        Returns:
+            Set of QSettings group names of parent codes.
+        """
+        if self._codebook_parents is None:
+            settings = QSettings()
+            settings.beginGroup("global-settings")
+            settings.beginGroup("encoding-buttons")
+            settings.beginGroup("codebook")
+            self._codebook_parents = set(settings.childGroups())
+            settings.endGroup()  # codebook
+            settings.endGroup()  # encoding-buttons
+            settings.endGroup()  # global-settings
+        return self._codebook_parents
+
+    @staticmethod
+    def _codebook_group(parent_id):
+        """
+        Converts a code identifier to a QSettings-safe group name.
+
+        Parameters:
+            parent_id - identifier of the parent code
+        """
+        return str(parent_id).encode("utf-8").hex()
+
+    @staticmethod
+    def _write_button_definitions(settings, button_definitions):
+        """
+        Writes a list of button definitions to the current QSettings group.
+
+        Parameters:
+            settings - QSettings instance positioned at the target group
+            button_definitions - list of button definitions to write
+        """
+        settings.beginWriteArray("button-definitions", len(button_definitions))
+        for index, button_definition in enumerate(button_definitions):
+            settings.setArrayIndex(index)
+            settings.setValue("button-id", button_definition.button_id)
+            settings.beginWriteArray("data", len(button_definition.data))
+            for data_index, data_item in enumerate(button_definition.data):
+                settings.setArrayIndex(data_index)
+                settings.setValue("data-item", data_item)
+            settings.endArray()
+        settings.endArray()
+
+    @staticmethod
+    def _read_button_definitions(settings, parent_id=None):
+        """
+        Reads a list of button definitions from the current QSettings group.
+
+        Parameters:
+            settings - QSettings instance positioned at the source group
+            parent_id - identifier of the parent code of the definitions read
+
+        Returns:
+            List of button definitions.
+        """
+        button_definitions = []
+        button_definitions_length = settings.beginReadArray("button-definitions")
+        for index in range(button_definitions_length):
+            settings.setArrayIndex(index)
+            button_id = settings.value("button-id")
+            data = []
+            data_length = settings.beginReadArray("data")
+            for data_index in range(data_length):
+                settings.setArrayIndex(data_index)
+                data.append(settings.value("data-item"))
+            settings.endArray()
+            button_definitions.append(ButtonDefinitionEntity(button_id, data, parent_id))
+        settings.endArray()
+        return button_definitions
+
+    def _write_child_button_definitions(self, settings, parent_id):
+        """
+        Writes the cached child definitions of a code to the codebook group.
+
+        Parameters:
+            settings - QSettings instance positioned at the codebook group
+            parent_id - identifier of the parent code
+        """
+        children = self.global_settings_entity.child_button_definitions.get(parent_id, [])
+        group = self._codebook_group(parent_id)
+
+        settings.remove(group)
+        if children:
+            settings.beginGroup(group)
+            settings.setValue("parent-id", parent_id)
+            self._write_button_definitions(settings, children)
+            settings.endGroup()  # group
+            self._get_codebook_parents().add(group)
+        else:
+            self._get_codebook_parents().discard(group)
+
+    def _commit_imported_button_definitions(self, imported):
+        """
+        Appends imported definitions to the codebook and writes every affected
+        group through a single QSettings instance, synced once.
+
+        Parameters:
+            imported - dictionary mapping parent ids to imported definitions
+        """
+        for parent_id, button_definitions in imported.items():
+            if parent_id is None:
+                self.global_settings_entity.button_definitions.extend(button_definitions)
+            else:
+                self.get_child_button_definitions(parent_id).extend(button_definitions)
+
+        settings = QSettings()
+        settings.beginGroup("global-settings")
+        settings.beginGroup("encoding-buttons")
+
+        if None in imported:
+            self._write_button_definitions(settings, self.global_settings_entity.button_definitions)
+
+        settings.beginGroup("codebook")
+        for parent_id in imported:
+            if parent_id is not None:
+                self._write_child_button_definitions(settings, parent_id)
+        settings.endGroup()  # codebook
+
+        settings.endGroup()  # encoding-buttons
+        settings.endGroup()  # global-settings
+        settings.sync()
+
+    def _get_button_id_index(self):
+        """
+        Gets the index of every button id in the codebook, reading only the ids
+        of unloaded subtrees from QSettings on first use.
+
+        Returns:
+            Dictionary mapping button ids to their parent ids.
+        """
+        if self._button_id_index is not None:
+            return self._button_id_index
+
+        button_id_index = {}
+        for button_definition in self.global_settings_entity.button_definitions:
+            button_id_index[button_definition.button_id] = None
+
+        settings = QSettings()
+        settings.beginGroup("global-settings")
+        settings.beginGroup("encoding-buttons")
+        settings.beginGroup("codebook")
+        for group in self._get_codebook_parents():
+            settings.beginGroup(group)
+            parent_id = settings.value("parent-id")
+            button_definitions_length = settings.beginReadArray("button-definitions")
+            for index in range(button_definitions_length):
+                settings.setArrayIndex(index)
+                button_id_index[settings.value("button-id")] = parent_id
+            settings.endArray()
+            settings.endGroup()  # group
+        settings.endGroup()  # codebook
+        settings.endGroup()  # encoding-buttons
+        settings.endGroup()  # global-settings
+
+        # Subtrees edited since they were loaded are more recent than QSettings.
+        for parent_id, children in self.global_settings_entity.child_button_definitions.items():
+            for child in children:
+                button_id_index[child.button_id] = parent_id
+
+        self._button_id_index = button_id_index
+        return button_id_index
@@ -0,0 +1,263 @@
+import random
+
+
+class _Node:
+    """
+    A node of an IntervalTree, holding one interval and the latest end of the
+    intervals in its subtree.
+    """
+    __slots__ = ("key", "start", "end", "value", "priority", "left", "right", "max_end")
+
+    def __init__(self, start, end, value, priority):
+        """
+        Constructor - Creates an instance of _Node
+
+        Parameters:
+            start - start of the interval.
+            end - end of the interval.
+            value - value identifying the interval.
+            priority - random heap priority of the node.
+        """
+        self.key = (start, end, value)
+        self.start = start
+        self.end = end
+        self.value = value
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.max_end = end
+
+
+def _update(node):
+    """
+    Recomputes the latest end of a node's subtree from its children.
+
+    Parameters:
+        node - node whose children changed.
+    """
+    max_end = node.end
+    if node.left is not None and node.left.max_end > max_end:
+        max_end = node.left.max_end
+    if node.right is not None and node.right.max_end > max_end:
+        max_end = node.right.max_end
+    node.max_end = max_end
+
+
+def _split(node, key):
+    """
+    Splits a subtree into the nodes ordered before a key and the others.
+
+    Parameters:
+        node - root of the subtree, or None.
+        key - (start, end, value) to split at.
+
+    Returns:
+        (left root, right root), either may be None.
+    """
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _update(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _update(node)
+    return left, node
+
+
+def _merge(left, right):
+    """
+    Joins two subtrees whose nodes are all ordered before those of the other.
+
+    Parameters:
+        left - root of the subtree ordered first, or None.
+        right - root of the subtree ordered last, or None.
+
+    Returns:
+        Root of the joined subtree.
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+def _insert(node, new_node):
+    """
+    Inserts a node into a subtree.
+
+    Parameters:
+        node - root of the subtree, or None.
+        new_node - node to insert.
+
+    Returns:
+        Root of the subtree.
+    """
+    if node is None:
+        return new_node
+    if new_node.priority > node.priority:
+        new_node.left, new_node.right = _split(node, new_node.key)
+        _update(new_node)
+        return new_node
+    if new_node.key < node.key:
+        node.left = _insert(node.left, new_node)
+    else:
+        node.right = _insert(node.right, new_node)
+    _update(node)
+    return node
+
+
+def _remove(node, key):
+    """
+    Removes the node of a key from a subtree.
+
+    Parameters:
+        node - root of the subtree, or None.
+        key - (start, end, value) of the node.
+
+    Returns:
+        (root of the subtree, whether the node was found)
+    """
+    if node is None:
+        return None, False
+    if key == node.key:
+        return _merge(node.left, node.right), True
+    if key < node.key:
+        node.left, found = _remove(node.left, key)
+    else:
+        node.right, found = _remove(node.right, key)
+    if found:
+        _update(node)
+    return node, found
+
+
+class IntervalTree:
+    """
+    IntervalTree holds closed intervals in a balanced search tree ordered by
+    their starts, in which every node also knows the latest end within its
+    subtree. Whole subtrees ending before a query, or starting after it, are
+    skipped, so finding the intervals that contain a point or overlap a range
+    takes logarithmic time plus the number of intervals found. The tree is a
+    treap: random priorities keep it balanced however intervals are added.
+    """
+
+    def __init__(self, intervals=()):
+        """
+        Constructor - Creates an instance of IntervalTree
+
+        Parameters:
+            intervals - iterable of (start, end, value) to hold, where each
+                value identifies its interval.
+        """
+        self._root = None
+        self._size = 0
+        self._build(sorted(intervals))
+
+    def __len__(self):
+        """
+        Gets the number of intervals in the tree.
+        """
+        return self._size
+
+    def add(self, start, end, value):
+        """
+        Adds an interval.
+
+        Parameters:
+            start - start of the interval.
+            end - end of the interval, not before its start.
+            value - value identifying the interval.
+        """
+        self._root = _insert(self._root, _Node(start, end, value, random.random()))
+        self._size += 1
+
+    def remove(self, start, end, value):
+        """
+        Removes an interval.
+
+        Parameters:
+            start - start of the interval.
+            end - end of the interval.
+            value - value identifying the interval.
+
+        Returns:
+            Whether the interval was in the tree.
+        """
+        self._root, found = _remove(self._root, (start, end, value))
+        if found:
+            self._size -= 1
+        return found
+
+    def at(self, point):
+        """
+        Finds the intervals containing a point.
+
+        Parameters:
+            point - point to look up.
+
+        Returns:
+            List of (start, end, value) ordered by start.
+        """
+        return self.overlapping(point, point)
+
+    def overlapping(self, first, last):
+        """
+        Finds the intervals overlapping a range.
+
+        Parameters:
+            first - start of the range.
+            last - end of the range.
+
+        Returns:
+            List of (start, end, value) ordered by start.
+        """
+        intervals = []
+        # Walk the tree in order, skipping subtrees that end before the range.
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None and node.max_end >= first:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                break
+            node = stack.pop()
+            if node.start > last:
+                # Every node that follows starts after the range too.
+                break
+            if node.end >= first:
+                intervals.append(node.key)
+            node = node.right
+        return intervals
+
+    def _build(self, intervals):
+        """
+        Builds the tree from sorted intervals in linear time, as the Cartesian
+        tree of the intervals' random priorities.
+
+        Parameters:
+            intervals - list of (start, end, value) in ascending order.
+        """
+        stack = []  # right spine of the tree built so far
+        for start, end, value in intervals:
+            node = _Node(start, end, value, random.random())
+            last_popped = None
+            while stack and stack[-1].priority < node.priority:
+                last_popped = stack.pop()
+                # The nodes below a popped node are final, so its subtree end is too.
+                _update(last_popped)
+            node.left = last_popped
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+        for node in reversed(stack):
+            _update(node)
+        self._root = stack[0] if stack else None
+        self._size = len(intervals)
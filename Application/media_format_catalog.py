@@ -0,0 +1,248 @@
+import fnmatch
+import os
+import sys
+
+from PySide6.QtCore import QObject, QMimeDatabase, QSettings, QThread, Qt, Signal, Slot, qVersion
+from PySide6.QtMultimedia import QMediaFormat
+
+# Video formats added to the decodable formats when the backend does not list them.
+AVI_VIDEO_FILE = "video/x-msvideo"
+MP4_VIDEO_FILE = "video/mp4"
+
+
+def discover_media_formats():
+    """
+    Asks the multimedia backend which file formats it can decode, and looks
+    up the file name patterns of each.
+
+    Returns:
+        (list of MIME type names, list of glob patterns, list of file dialog name filters)
+    """
+    mime_types = []
+    for file_format in QMediaFormat().supportedFileFormats(QMediaFormat.Decode):
+        mime_types.append(QMediaFormat(file_format).mimeType().name())
+
+    # Adds AVI and MP4 if they were not supported.
+    if sys.platform == "win32" and AVI_VIDEO_FILE not in mime_types:
+        mime_types.append(AVI_VIDEO_FILE)
+    elif MP4_VIDEO_FILE not in mime_types:
+        mime_types.append(MP4_VIDEO_FILE)
+
+    mime_db = QMimeDatabase()
+    glob_patterns = []
+    name_filters = []
+    for mime_type in mime_types:
+        mime = mime_db.mimeTypeForName(mime_type)
+        if not mime.isValid() or not mime.globPatterns():
+            continue
+        glob_patterns.extend(pattern for pattern in mime.globPatterns() if pattern not in glob_patterns)
+        name_filters.append(mime.filterString())
+    # An "all supported types" filter comes first, as the default.
+    name_filters.insert(0, f"All supported formats ({' '.join(glob_patterns)})")
+    return mime_types, glob_patterns, name_filters
+
+
+class MediaFormatWorker(QObject):
+    """
+    MediaFormatWorker asks the multimedia backend for its decodable formats on
+    a worker thread, since loading the backend's format information can take
+    a noticeable moment.
+    """
+    finished = Signal()
+
+    def __init__(self):
+        """
+        Constructor - Creates an instance of MediaFormatWorker
+        """
+        super().__init__()
+        # Formats found, read once the thread has finished.
+        self.result = None
+
+    @Slot()
+    def run(self):
+        """
+        Discovers the decodable formats.
+        """
+        try:
+            self.result = discover_media_formats()
+        finally:
+            self.finished.emit()
+
+
+class MediaFormatCatalog(QObject):
+    """
+    MediaFormatCatalog knows which media files the application can play. The
+    formats are discovered once, on a worker thread started after the window
+    is shown, and saved to QSettings along with the Qt version and multimedia
+    backend they were discovered with, so that later runs read them back
+    instead. Asking for the formats before they are known waits for the
+    discovery to finish.
+    """
+    SETTINGS_GROUP = "media-formats"
+
+    ready = Signal()
+
+    def __init__(self, parent=None):
+        """
+        Constructor - Creates an instance of MediaFormatCatalog
+
+        Parameters:
+            parent - owner of the catalog.
+        """
+        super().__init__(parent)
+        self._mime_types = None  # None until the formats are known
+        self._glob_patterns = []
+        self._name_filters = []
+        self._suffixes = set()  # lower-case suffixes of the plain "*.ext" patterns
+        self._other_patterns = []  # lower-case patterns that are not plain suffixes
+        self._thread = None
+        self._worker = None
+
+    @staticmethod
+    def cache_key():
+        """
+        Gets the key the saved formats are valid for, since another Qt version
+        or multimedia backend may decode other formats.
+        """
+        return f"{qVersion()} {os.environ.get('QT_MEDIA_BACKEND', 'default')} {sys.platform}"
+
+    def start(self):
+        """
+        Reads the saved formats, or starts discovering them on a worker thread
+        if none were saved for this Qt version and backend.
+        """
+        if self._mime_types is not None or self._thread is not None:
+            return
+        if self._read_from_settings():
+            return
+        self._thread = QThread()
+        self._worker = MediaFormatWorker()
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        # The thread quits straight from the worker, since the GUI thread may be waiting on it.
+        self._worker.finished.connect(self._thread.quit, Qt.DirectConnection)
+        self._thread.finished.connect(self._on_thread_finished)
+        self._thread.start()
+
+    def is_ready(self):
+        """
+        Determines whether the formats are known.
+        """
+        return self._mime_types is not None
+
+    def mime_types(self):
+        """
+        Gets the MIME type names of the formats that can be played.
+        """
+        self._wait_until_ready()
+        return list(self._mime_types)
+
+    def glob_patterns(self):
+        """
+        Gets the file name patterns of the formats that can be played.
+        """
+        self._wait_until_ready()
+        return list(self._glob_patterns)
+
+    def name_filters(self):
+        """
+        Gets the file dialog name filters of the formats that can be played,
+        led by one matching all of them.
+        """
+        self._wait_until_ready()
+        return list(self._name_filters)
+
+    def is_supported_file(self, path):
+        """
+        Determines whether a file's name matches a format that can be played,
+        as when it is dropped onto the window.
+
+        Parameters:
+            path - path of the file.
+        """
+        self._wait_until_ready()
+        name = os.path.basename(path).lower()
+        _, suffix = os.path.splitext(name)
+        if suffix in self._suffixes:
+            return True
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in self._other_patterns)
+
+    def _wait_until_ready(self):
+        """
+        Makes sure the formats are known, finishing or running their discovery
+        on this thread if needed.
+        """
+        if self._mime_types is not None:
+            return
+        if self._thread is None:
+            self.start()
+        if self._thread is not None:
+            self._thread.wait()
+            self._on_thread_finished()
+
+    def _on_thread_finished(self):
+        """
+        Keeps and saves the formats discovered by the worker thread.
+        """
+        if self._thread is None:
+            return
+        result = self._worker.result
+        self._thread.deleteLater()
+        self._worker.deleteLater()
+        self._thread = self._worker = None
+        if result is None:
+            # Discovery failed on the worker thread, so it is tried here instead.
+            result = discover_media_formats()
+        self._set_formats(*result)
+        self._write_to_settings()
+
+    def _set_formats(self, mime_types, glob_patterns, name_filters):
+        """
+        Keeps the formats and indexes their patterns.
+
+        Parameters:
+            mime_types - list of MIME type names.
+            glob_patterns - list of glob patterns.
+            name_filters - list of file dialog name filters.
+        """
+        self._mime_types = list(mime_types)
+        self._glob_patterns = list(glob_patterns)
+        self._name_filters = list(name_filters)
+        self._suffixes = set()
+        self._other_patterns = []
+        for pattern in self._glob_patterns:
+            pattern = pattern.lower()
+            if pattern.startswith("*.") and not any(character in pattern[2:] for character in "*?["):
+                self._suffixes.add(pattern[1:])
+            else:
+                self._other_patterns.append(pattern)
+        self.ready.emit()
+
+    def _read_from_settings(self):
+        """
+        Reads the formats saved for this Qt version and backend.
+
+        Returns:
+            Whether formats were saved for them.
+        """
+        settings = QSettings()
+        settings.beginGroup(self.SETTINGS_GROUP)
+        found = settings.value("key") == self.cache_key()
+        if found:
+            self._set_formats(settings.value("mime-types", [], type=list),
+                              settings.value("glob-patterns", [], type=list),
+                              settings.value("name-filters", [], type=list))
+        settings.endGroup()
+        return found
+
+    def _write_to_settings(self):
+        """
+        Saves the formats along with the Qt version and backend they are valid for.
+        """
+        settings = QSettings()
+        settings.beginGroup(self.SETTINGS_GROUP)
+        settings.setValue("key", self.cache_key())
+        settings.setValue("mime-types", self._mime_types)
+        settings.setValue("glob-patterns", self._glob_patterns)
+        settings.setValue("name-filters", self._name_filters)
+        settings.endGroup()
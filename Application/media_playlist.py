@@ -0,0 +1,220 @@
+from PySide6.QtCore import QObject, QUrl, Signal
+from PySide6.QtMultimedia import QMediaPlayer
+
+from Models.playlist_entry_entity import PlaylistEntryEntity
+
+
+class MediaPlaylist(QObject):
+    """
+    MediaPlaylist plays the media files of a session in order, remembering
+    the position each was last played to so that it resumes from there.
+    While one file plays, the next is opened on a second player that has no
+    outputs: this probes it, finding its duration or that it cannot be
+    played, and reads its data from the resume position, so that switching
+    to it does not wait on the disk. Once a file plays to its end, the next
+    one follows.
+    """
+    entries_changed = Signal()  # media files were added, removed or probed
+    current_changed = Signal(int)  # index of the media file playing, -1 for none
+
+    def __init__(self, media_player, media_player_factory=QMediaPlayer, parent=None):
+        """
+        Constructor - Creates an instance of MediaPlaylist
+
+        Parameters:
+            media_player - QMediaPlayer playing the media files.
+            media_player_factory - function creating the player preloading the next file.
+            parent - owner of the playlist.
+        """
+        super().__init__(parent)
+        self._media_player = media_player
+        self._entries = []
+        self._current_index = -1
+        self._resume_position = None  # position to seek to once the current file is loaded
+        self._preload_player = media_player_factory(self)
+        self._preload_entry = None  # PlaylistEntryEntity opened on the preload player
+
+        media_player.mediaStatusChanged.connect(self._on_media_status_changed)
+        media_player.positionChanged.connect(self._on_position_changed)
+        self._preload_player.mediaStatusChanged.connect(self._on_preload_status_changed)
+
+    def entries(self):
+        """
+        Gets the PlaylistEntryEntity of each media file, in order.
+        """
+        return list(self._entries)
+
+    def current_index(self):
+        """
+        Gets the index of the media file playing, -1 for none.
+        """
+        return self._current_index
+
+    def set_entries(self, entries, current_index):
+        """
+        Replaces the media files, as when a session is loaded, and opens the
+        one last played without playing it.
+
+        Parameters:
+            entries - list of PlaylistEntryEntity, in order.
+            current_index - index of the media file to open, -1 for none.
+        """
+        self._entries = list(entries)
+        self._current_index = -1
+        self.entries_changed.emit()
+        if 0 <= current_index < len(self._entries):
+            self.open(current_index, play=False)
+        else:
+            self.current_changed.emit(-1)
+            self._preload_next()
+
+    def add(self, url):
+        """
+        Adds a media file at the end of the playlist, unless it is already in it.
+
+        Parameters:
+            url - QUrl of the media file.
+
+        Returns:
+            Index of the media file.
+        """
+        path = url.toLocalFile() or url.toString()
+        for index, entry in enumerate(self._entries):
+            if entry.path == path:
+                return index
+        self._entries.append(PlaylistEntryEntity(path))
+        self.entries_changed.emit()
+        self._preload_next()
+        return len(self._entries) - 1
+
+    def remove(self, index):
+        """
+        Removes a media file. If it is the one playing, the file after it is
+        opened in its place.
+
+        Parameters:
+            index - index of the media file.
+        """
+        del self._entries[index]
+        self.entries_changed.emit()
+        if index < self._current_index:
+            self._current_index -= 1
+            self.current_changed.emit(self._current_index)
+        elif index == self._current_index:
+            self._current_index = -1
+            if self._entries:
+                self.open(min(index, len(self._entries) - 1), play=False)
+            else:
+                self._media_player.setSource(QUrl())
+                self.current_changed.emit(-1)
+        self._preload_next()
+
+    def open(self, index, play=True):
+        """
+        Opens a media file, resuming from the position it was last played to.
+
+        Parameters:
+            index - index of the media file.
+            play - whether playback starts straight away.
+        """
+        entry = self._entries[index]
+        self._current_index = index
+        self._resume_position = entry.position if entry.position > 0 else None
+        self._media_player.setSource(self._source_of(entry))
+        if play:
+            self._media_player.play()
+        self.current_changed.emit(index)
+        self._preload_next()
+
+    def next(self):
+        """
+        Opens the next media file, carrying on playing if the current one is.
+        """
+        if self._current_index + 1 < len(self._entries):
+            self.open(self._current_index + 1, play=self._is_playing())
+
+    def previous(self):
+        """
+        Opens the previous media file, carrying on playing if the current one is.
+        """
+        if self._current_index > 0:
+            self.open(self._current_index - 1, play=self._is_playing())
+
+    def _is_playing(self):
+        """
+        Determines whether the media player is playing.
+        """
+        return self._media_player.playbackState() == QMediaPlayer.PlayingState
+
+    @staticmethod
+    def _source_of(entry):
+        """
+        Gets the QUrl of a media file.
+
+        Parameters:
+            entry - PlaylistEntryEntity of the media file.
+        """
+        return QUrl.fromUserInput(entry.path)
+
+    def _preload_next(self):
+        """
+        Opens the media file after the current one on the preload player, or
+        releases the preload player if there is none.
+        """
+        next_index = self._current_index + 1
+        entry = self._entries[next_index] if next_index < len(self._entries) else None
+        if entry is self._preload_entry:
+            return
+        self._preload_entry = entry
+        self._preload_player.setSource(self._source_of(entry) if entry is not None else QUrl())
+
+    def _on_preload_status_changed(self, status):
+        """
+        Records what probing the next media file found, and reads its data
+        from the position it resumes from.
+        """
+        entry = self._preload_entry
+        if entry is None:
+            return
+        if status == QMediaPlayer.LoadedMedia:
+            entry.duration = self._preload_player.duration()
+            entry.playable = True
+            if entry.position > 0:
+                self._preload_player.setPosition(entry.position)
+            self.entries_changed.emit()
+        elif status == QMediaPlayer.InvalidMedia:
+            entry.playable = False
+            self.entries_changed.emit()
+
+    def _on_media_status_changed(self, status):
+        """
+        Resumes the current media file once it is loaded, and plays the next
+        one once it ends.
+        """
+        if self._current_index < 0:
+            return
+        entry = self._entries[self._current_index]
+        if status == QMediaPlayer.LoadedMedia:
+            entry.duration = self._media_player.duration()
+            entry.playable = True
+            if self._resume_position is not None:
+                self._media_player.setPosition(self._resume_position)
+                self._resume_position = None
+            self.entries_changed.emit()
+        elif status == QMediaPlayer.InvalidMedia:
+            entry.playable = False
+            self._resume_position = None
+            self.entries_changed.emit()
+        elif status == QMediaPlayer.EndOfMedia:
+            # A file played to its end starts over when it is opened again.
+            entry.position = 0
+            if self._current_index + 1 < len(self._entries):
+                self.open(self._current_index + 1)
+
+    def _on_position_changed(self, position):
+        """
+        Records how far the current media file was played, short of its end.
+        """
+        if self._current_index >= 0 and self._resume_position is None \
+                and self._media_player.mediaStatus() != QMediaPlayer.EndOfMedia:
+            self._entries[self._current_index].position = position
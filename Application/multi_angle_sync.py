@@ -0,0 +1,254 @@
+import itertools
+import math
+
+from PySide6.QtCore import QElapsedTimer, QObject, QTimer
+from PySide6.QtMultimedia import QMediaPlayer
+
+
+class _Angle:
+    """
+    A camera angle played alongside the master video.
+    """
+    __slots__ = ("player", "offset_ms", "active")
+
+    def __init__(self, player):
+        """
+        Constructor - Creates an instance of _Angle
+
+        Parameters:
+            player - QMediaPlayer of the angle.
+        """
+        self.player = player
+        self.offset_ms = 0  # position of the angle when the master is at 0
+        self.active = True  # whether the angle is shown, hidden angles are paused
+
+
+class MultiAngleSync(QObject):
+    """
+    MultiAngleSync keeps the players of further camera angles in step with the
+    master player, whose clock gives the time of every coded event. Each angle
+    is offset from the master by the time its recording started earlier or
+    later. While the master plays, the angles are checked at an interval:
+    angles that drifted slightly are sped up or slowed down until they catch
+    up, and angles that drifted far, or whose master was seeked, are seeked.
+    Hidden angles are paused rather than decoded, and only one player, the
+    master or the angle in focus, decodes its audio.
+    """
+    SYNC_INTERVAL_MS = 500
+    # Drift within which the angle plays at the master's rate.
+    ADJUST_DRIFT_MS = 40
+    # Drift beyond which the angle is seeked rather than sped up or slowed down.
+    SEEK_DRIFT_MS = 300
+    # Share of the master's rate by which a drifting angle is sped up or slowed down.
+    RATE_ADJUSTMENT = 0.05
+
+    def __init__(self, master_player, audio_output, parent=None):
+        """
+        Constructor - Creates an instance of MultiAngleSync
+
+        Parameters:
+            master_player - QMediaPlayer of the master video.
+            audio_output - QAudioOutput played by the player in focus.
+            parent - owner of the sync.
+        """
+        super().__init__(parent)
+        self._master = master_player
+        self._audio_output = audio_output
+        self._angles = {}  # angle id : _Angle
+        self._next_angle_id = itertools.count()
+        self._audio_focus = None  # angle id whose audio plays, None for the master
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.SYNC_INTERVAL_MS)
+        self._timer.timeout.connect(self.sync)
+        # Time since the angles were last synced, to tell a seek of the master from playback.
+        self._synced_clock = QElapsedTimer()
+        self._synced_position = 0
+
+        master_player.playbackStateChanged.connect(self._on_master_state_changed)
+        master_player.playbackRateChanged.connect(lambda rate: self.sync())
+        master_player.positionChanged.connect(self._on_master_position_changed)
+        master_player.tracksChanged.connect(lambda: self._update_audio_track(None))
+
+    def add_angle(self, player):
+        """
+        Adds a camera angle, which is aligned with the master straight away.
+        Its audio is not decoded unless it is brought into focus.
+
+        Parameters:
+            player - QMediaPlayer of the angle, with its source and video output set.
+
+        Returns:
+            Id of the angle.
+        """
+        angle_id = next(self._next_angle_id)
+        player.setAudioOutput(None)
+        self._angles[angle_id] = _Angle(player)
+        # Tracks are only known once the media is loaded.
+        player.tracksChanged.connect(lambda: self._update_audio_track(angle_id))
+        self._update_audio_track(angle_id)
+        self.sync()
+        return angle_id
+
+    def remove_angle(self, angle_id):
+        """
+        Removes a camera angle, stopping its player. Its audio focus returns to
+        the master.
+
+        Parameters:
+            angle_id - id of the angle.
+        """
+        if self._audio_focus == angle_id:
+            self.set_audio_focus(None)
+        angle = self._angles.pop(angle_id)
+        angle.player.stop()
+
+    def angle_ids(self):
+        """
+        Gets the ids of the camera angles, in the order they were added.
+        """
+        return list(self._angles)
+
+    def set_offset(self, angle_id, offset_ms):
+        """
+        Sets the position of an angle when the master is at its start, which
+        is negative for angles whose recording started after the master's.
+
+        Parameters:
+            angle_id - id of the angle.
+            offset_ms - offset in ms.
+        """
+        self._angles[angle_id].offset_ms = offset_ms
+        self._align(self._angles[angle_id], self._master.position())
+
+    def set_active(self, angle_id, active):
+        """
+        Shows or hides an angle. Hidden angles are paused, and catch up with
+        the master once shown again.
+
+        Parameters:
+            angle_id - id of the angle.
+            active - whether the angle is shown.
+        """
+        angle = self._angles[angle_id]
+        angle.active = active
+        if active:
+            self._align(angle, self._master.position())
+        else:
+            angle.player.pause()
+
+    def audio_focus(self):
+        """
+        Gets the id of the angle whose audio plays, None for the master.
+        """
+        return self._audio_focus
+
+    def set_audio_focus(self, angle_id):
+        """
+        Plays the audio of an angle, or of the master, and stops decoding the
+        audio of every other player.
+
+        Parameters:
+            angle_id - id of the angle, None for the master.
+        """
+        previous_focus = self._audio_focus
+        self._audio_focus = angle_id
+        if previous_focus != angle_id:
+            self._player_of(previous_focus).setAudioOutput(None)
+            self._update_audio_track(previous_focus)
+        self._update_audio_track(angle_id)
+        self._player_of(angle_id).setAudioOutput(self._audio_output)
+
+    def sync(self):
+        """
+        Brings every shown angle in step with the master.
+        """
+        position = self._master.position()
+        self._synced_clock.start()
+        self._synced_position = position
+        for angle in self._angles.values():
+            if angle.active:
+                self._align(angle, position)
+
+    def _align(self, angle, master_position):
+        """
+        Brings an angle in step with the master, seeking it if it drifted far
+        and otherwise adjusting its rate until it catches up.
+
+        Parameters:
+            angle - _Angle to align.
+            master_position - position of the master in ms.
+        """
+        player = angle.player
+        target = master_position + angle.offset_ms
+        duration = player.duration()
+        if target < 0 or (duration > 0 and target >= duration):
+            # The angle's recording has not started yet or has ended.
+            player.pause()
+            player.setPosition(min(max(target, 0), duration) if duration > 0 else 0)
+            return
+
+        master_rate = self._master.playbackRate()
+        if self._master.playbackState() != QMediaPlayer.PlayingState:
+            player.pause()
+            player.setPosition(target)
+            return
+        drift = player.position() - target
+        if player.playbackState() != QMediaPlayer.PlayingState or abs(drift) > self.SEEK_DRIFT_MS:
+            player.setPosition(target)
+            rate = master_rate
+        elif abs(drift) > self.ADJUST_DRIFT_MS:
+            rate = master_rate * (1 - math.copysign(self.RATE_ADJUSTMENT, drift))
+        else:
+            rate = master_rate
+        if player.playbackRate() != rate:
+            player.setPlaybackRate(rate)
+        player.play()
+
+    def _player_of(self, angle_id):
+        """
+        Gets the player of an angle, or the master for None.
+
+        Parameters:
+            angle_id - id of the angle, or None.
+        """
+        return self._master if angle_id is None else self._angles[angle_id].player
+
+    def _update_audio_track(self, angle_id):
+        """
+        Decodes the audio of a player if it is in focus, and otherwise turns
+        its audio track off. Players without loaded media are left as they
+        are, and updated once their tracks are known.
+
+        Parameters:
+            angle_id - id of the angle, None for the master.
+        """
+        if angle_id is not None and angle_id not in self._angles:
+            return
+        player = self._player_of(angle_id)
+        if player.audioTracks():
+            player.setActiveAudioTrack(0 if angle_id == self._audio_focus else -1)
+
+    def _on_master_state_changed(self, state):
+        """
+        Plays, pauses or stops the angles along with the master.
+        """
+        if state == QMediaPlayer.PlayingState:
+            self._timer.start()
+        else:
+            self._timer.stop()
+        self.sync()
+
+    def _on_master_position_changed(self, position):
+        """
+        Seeks the angles along with the master. While the master plays, its
+        position is only compared with the position expected since the last
+        sync, and the angles are synced if the master was seeked.
+        """
+        if not self._angles:
+            return
+        if self._master.playbackState() != QMediaPlayer.PlayingState:
+            self.sync()
+            return
+        expected = self._synced_position + self._synced_clock.elapsed() * self._master.playbackRate()
+        if abs(position - expected) > self.SEEK_DRIFT_MS:
+            self.sync()
@@ -0,0 +1,124 @@
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
+from PySide6.QtMultimedia import QMediaPlayer
+
+
+class PlaybackLoop(QObject):
+    """
+    PlaybackLoop repeats the part of a video between two marked points, A and
+    B. Rather than checking every position the player reports, which arrive
+    late and would let playback run past B, a precise timer is set for the
+    moment the playback clock reaches B, from the current position and
+    playback rate. It is set again whenever playback starts, seeks or changes
+    speed.
+    """
+    # Position reports lag the clock by up to about a frame, so B counts as
+    # reached this close to it.
+    END_TOLERANCE_MS = 20
+
+    loop_changed = Signal(object, object)  # A in ms or None, B in ms or None
+
+    def __init__(self, media_player, parent=None):
+        """
+        Constructor - Creates an instance of PlaybackLoop
+
+        Parameters:
+            media_player - QMediaPlayer whose playback is looped.
+            parent - owner of the loop.
+        """
+        super().__init__(parent)
+        self._media_player = media_player
+        self._start_ms = None
+        self._end_ms = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+        media_player.playbackStateChanged.connect(self.reschedule)
+        media_player.playbackRateChanged.connect(self.reschedule)
+        media_player.sourceChanged.connect(self.clear)
+
+    def start_ms(self):
+        """
+        Gets point A of the loop in ms, None if it is not marked.
+        """
+        return self._start_ms
+
+    def end_ms(self):
+        """
+        Gets point B of the loop in ms, None if it is not marked.
+        """
+        return self._end_ms
+
+    def is_active(self):
+        """
+        Determines whether both points are marked, so that playback loops.
+        """
+        return self._end_ms is not None
+
+    def mark(self):
+        """
+        Marks the next point of the loop at the player's position: A first,
+        then B, which starts looping. Marking again clears the loop. A B
+        marked before A swaps the two.
+        """
+        position = self._media_player.position()
+        if self._start_ms is None:
+            self.set_loop(position, None)
+        elif self._end_ms is None:
+            if position != self._start_ms:
+                self.set_loop(min(self._start_ms, position), max(self._start_ms, position))
+        else:
+            self.clear()
+
+    def set_loop(self, start_ms, end_ms):
+        """
+        Sets the points of the loop.
+
+        Parameters:
+            start_ms - point A in ms, None for no loop.
+            end_ms - point B in ms after A, None to only mark A.
+        """
+        self._start_ms = start_ms
+        self._end_ms = end_ms if start_ms is not None else None
+        self.loop_changed.emit(self._start_ms, self._end_ms)
+        self.reschedule()
+
+    def clear(self):
+        """
+        Clears both points of the loop.
+        """
+        self.set_loop(None, None)
+
+    def reschedule(self, *args):
+        """
+        Sets the timer for the moment playback reaches B, from the player's
+        current position. Called when playback starts, seeks or changes speed.
+        """
+        self._schedule_from(self._media_player.position())
+
+    def _schedule_from(self, position):
+        """
+        Sets the timer for the moment playback reaches B.
+
+        Parameters:
+            position - position of the player in ms.
+        """
+        self._timer.stop()
+        if not self.is_active() or self._media_player.playbackState() != QMediaPlayer.PlayingState:
+            return
+        rate = self._media_player.playbackRate()
+        if rate <= 0:
+            return
+        remaining_ms = (self._end_ms - position) / rate
+        if remaining_ms <= self.END_TOLERANCE_MS:
+            self._media_player.setPosition(self._start_ms)
+            remaining_ms = (self._end_ms - self._start_ms) / rate
+        self._timer.start(max(1, int(remaining_ms)))
+
+    def _on_timeout(self):
+        """
+        Returns playback to A once it reached B. Timers may fire a little
+        early, in which case the timer is set again for the rest of the way.
+        """
+        self._schedule_from(self._media_player.position())
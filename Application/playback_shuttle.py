@@ -0,0 +1,157 @@
+import math
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtMultimedia import QMediaPlayer
+
+
+class PlaybackShuttle(QObject):
+    """
+    PlaybackShuttle drives a media player with J/K/L shuttle controls and
+    steps it one frame at a time. Each press of L plays forwards faster and
+    each press of J plays backwards faster, while K stops. The player cannot
+    play backwards, so it is paused and stepped back at the shuttle speed
+    instead. Frames are stepped using the start and end times of the frame
+    last shown, so that each step lands on the neighbouring frame whatever
+    the video's frame rate.
+    """
+    SPEEDS = (1, 2, 4, 8)
+    REWIND_INTERVAL_MS = 100
+    DEFAULT_FRAME_DURATION_US = 1000000 // 30
+
+    speed_changed = Signal(float)  # shuttle speed, negative backwards and 0 when stopped
+
+    def __init__(self, media_player, parent=None):
+        """
+        Constructor - Creates an instance of PlaybackShuttle
+
+        Parameters:
+            media_player - QMediaPlayer to drive.
+            parent - owner of the shuttle.
+        """
+        super().__init__(parent)
+        self._media_player = media_player
+        self._speed = 0
+        self._frame_start_us = None  # start time of the frame last shown, None before any frame
+        self._frame_duration_us = self.DEFAULT_FRAME_DURATION_US
+        self._rewind_timer = QTimer(self)
+        self._rewind_timer.setInterval(self.REWIND_INTERVAL_MS)
+        self._rewind_timer.timeout.connect(self._rewind_step)
+
+        media_player.playbackStateChanged.connect(self._on_playback_state_changed)
+        media_player.sourceChanged.connect(self._on_source_changed)
+
+    def speed(self):
+        """
+        Gets the shuttle speed, negative backwards and 0 when stopped.
+        """
+        return self._speed
+
+    def forward(self):
+        """
+        Plays forwards, or faster if already playing forwards (L).
+        """
+        self._set_speed(self._faster(self._speed) if self._speed > 0 else self.SPEEDS[0])
+
+    def backward(self):
+        """
+        Plays backwards, or faster if already playing backwards (J).
+        """
+        self._set_speed(-self._faster(-self._speed) if self._speed < 0 else -self.SPEEDS[0])
+
+    def stop(self):
+        """
+        Pauses playback in either direction (K).
+        """
+        self._set_speed(0)
+
+    def step_frames(self, count):
+        """
+        Pauses playback and moves it by whole frames.
+
+        Parameters:
+            count - number of frames to move, negative to move backwards.
+        """
+        self._set_speed(0)
+        if self._frame_start_us is None:
+            self._frame_start_us = self._media_player.position() * 1000
+        target_us = max(0, self._frame_start_us + count * self._frame_duration_us)
+        # Steps taken before the player shows the frame continue from it.
+        self._frame_start_us = target_us
+        # The position is rounded up into the frame, rather than down into the one before it.
+        self._media_player.setPosition(math.ceil(target_us / 1000))
+
+    def observe_frame(self, frame):
+        """
+        Records the times of a frame shown by the video output.
+
+        Parameters:
+            frame - QVideoFrame shown.
+        """
+        if not frame.isValid() or frame.startTime() < 0:
+            return
+        self._frame_start_us = frame.startTime()
+        if frame.endTime() > frame.startTime():
+            self._frame_duration_us = frame.endTime() - frame.startTime()
+
+    def _faster(self, speed):
+        """
+        Gets the next shuttle speed up from a speed, staying at the fastest.
+
+        Parameters:
+            speed - current speed, 0 or one of SPEEDS.
+        """
+        faster_speeds = [candidate for candidate in self.SPEEDS if candidate > speed]
+        return faster_speeds[0] if faster_speeds else self.SPEEDS[-1]
+
+    def _set_speed(self, speed):
+        """
+        Drives the player at a shuttle speed.
+
+        Parameters:
+            speed - shuttle speed, negative backwards and 0 to stop.
+        """
+        self._speed = speed
+        if speed > 0:
+            self._rewind_timer.stop()
+            self._media_player.setPlaybackRate(speed)
+            self._media_player.play()
+        else:
+            if speed < 0:
+                self._rewind_timer.start()
+            else:
+                self._rewind_timer.stop()
+            self._media_player.pause()
+        self.speed_changed.emit(speed)
+
+    def _rewind_step(self):
+        """
+        Steps the paused player back by the time the shuttle speed covers in
+        one interval.
+        """
+        position = self._media_player.position() + self._speed * self.REWIND_INTERVAL_MS
+        self._media_player.setPosition(max(0, position))
+        if position <= 0:
+            self.stop()
+
+    def _on_playback_state_changed(self, state):
+        """
+        Stops the shuttle when the player is played, paused or stopped other
+        than through the shuttle.
+        """
+        if state == QMediaPlayer.PlayingState:
+            taken_over = self._speed < 0
+        elif state == QMediaPlayer.PausedState:
+            taken_over = self._speed > 0
+        else:
+            taken_over = self._speed != 0
+        if taken_over:
+            self._rewind_timer.stop()
+            self._speed = 0
+            self.speed_changed.emit(0)
+
+    def _on_source_changed(self, source):
+        """
+        Forgets the frame times of the previous video.
+        """
+        self._frame_start_us = None
+        self._frame_duration_us = self.DEFAULT_FRAME_DURATION_US
@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+
+class SeekCache:
+    """
+    SeekCache keeps the first frame decoded at each of the most recently
+    visited seek targets, so that returning to one of them shows its frame
+    straight away while the player is still seeking. When the cache is full,
+    the target visited least recently is dropped.
+    """
+    DEFAULT_CAPACITY = 8
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Constructor - Creates an instance of SeekCache
+
+        Parameters:
+            capacity - number of seek targets kept.
+        """
+        self._capacity = capacity
+        self._frames = OrderedDict()  # seek target ms : frame, least recently visited first
+
+    def __len__(self):
+        """
+        Gets the number of seek targets kept.
+        """
+        return len(self._frames)
+
+    def __contains__(self, target_ms):
+        """
+        Determines whether the frame of a seek target is kept, without
+        counting as a visit.
+
+        Parameters:
+            target_ms - seek target in ms.
+        """
+        return target_ms in self._frames
+
+    def visit(self, target_ms):
+        """
+        Gets the frame of a seek target, marking the target as the most
+        recently visited.
+
+        Parameters:
+            target_ms - seek target in ms.
+
+        Returns:
+            The frame, or None if it is not kept.
+        """
+        frame = self._frames.get(target_ms)
+        if frame is not None:
+            self._frames.move_to_end(target_ms)
+        return frame
+
+    def put(self, target_ms, frame):
+        """
+        Keeps the frame of a seek target, dropping the least recently visited
+        target if the cache is full.
+
+        Parameters:
+            target_ms - seek target in ms.
+            frame - first frame decoded at the target.
+        """
+        self._frames[target_ms] = frame
+        self._frames.move_to_end(target_ms)
+        while len(self._frames) > self._capacity:
+            self._frames.popitem(last=False)
+
+    def clear(self):
+        """
+        Drops every frame, as when another video is loaded.
+        """
+        self._frames.clear()
@@ -1,7 +1,9 @@
 from PySide6.QtCore import QSettings
 
 from Models.button_definition_entity import ButtonDefinitionEntity
+from Models.playlist_entry_entity import PlaylistEntryEntity
 from Models.session_entity import SessionEntity
+from Models.table_data_entity import TableDataEntity
 
 
 class SessionManager:
@@ -67,10 +69,21 @@ class SessionManager:
         Sets the session entity table data
 
         Parameters:
-            table data 2D list
+            TableDataEntity holding the table data
         """
         self.session_entity.table_data = data
 
+    def set_playlist(self, playlist, playlist_index):
+        """
+        Sets the session entity playlist.
+
+        Parameters:
+            playlist - list of PlaylistEntryEntity, in order
+            playlist_index - index of the media file last played, -1 for none
+        """
+        self.session_entity.playlist = playlist
+        self.session_entity.playlist_index = playlist_index
+
     def set_session_id(self, session_id):
         """
         Sets the session entity session id.
@@ -110,11 +123,12 @@ class SessionManager:
         settings.endArray()
 
         settings.beginGroup("table-data")  # creates table-data bin
+        table_data = self.session_entity.table_data
         for rowIx in range(self.session_entity.table_row_count):
             settings.beginWriteArray(str(rowIx))
             for colIx in range(self.session_entity.table_col_count):
                 settings.setArrayIndex(colIx)
-                item = self.session_entity.table_data[rowIx][colIx]
+                item = table_data.get_cell(rowIx, colIx)
                 if item is not None and item != '':
                     settings.setValue("cell", item)
                 else:
@@ -144,6 +158,17 @@ class SessionManager:
 
         settings.endGroup()  # encoding-buttons
 
+        settings.beginGroup("playlist")
+        settings.remove("")  # Removes all pre-existing media files
+        settings.setValue("current", self.session_entity.playlist_index)
+        settings.beginWriteArray("media", len(self.session_entity.playlist))
+        for entry_ix, entry in enumerate(self.session_entity.playlist):
+            settings.setArrayIndex(entry_ix)
+            settings.setValue("path", entry.path)
+            settings.setValue("position", entry.position)
+        settings.endArray()
+        settings.endGroup()  # playlist
+
         settings.endGroup()  # session-id
         settings.endGroup()  # sessions
 
@@ -181,21 +206,17 @@ class SessionManager:
         settings.endArray()
 
         # Update the table data of the table.
-        row_data = []
+        table_data = TableDataEntity(self.session_entity.table_col_count)
         settings.beginGroup("table-data")
         for rowIx in range(self.session_entity.table_row_count):
             size = settings.beginReadArray(str(rowIx))
             col_data = []
             for colIx in range(size):
                 settings.setArrayIndex(colIx)
-                cell_data = settings.value("cell")
-                if cell_data is not None:
-                    col_data.append(cell_data)
-                else:
-                    col_data.append(None)
-            row_data.append(col_data)
+                col_data.append(settings.value("cell"))
+            table_data.append_row(col_data)
             settings.endArray()
-        self.session_entity.table_data = row_data
+        self.session_entity.table_data = table_data
         settings.endGroup()  # table-data
         settings.endGroup()  # encoding-table
 
@@ -221,5 +242,17 @@ class SessionManager:
 
         settings.endGroup()  # encoding-buttons
 
+        # Sessions saved before playlists were added have none.
+        settings.beginGroup("playlist")
+        num_media = settings.beginReadArray("media")
+        playlist = []
+        for entry_ix in range(num_media):
+            settings.setArrayIndex(entry_ix)
+            playlist.append(PlaylistEntryEntity(settings.value("path"), int(settings.value("position", 0))))
+        settings.endArray()
+        self.session_entity.playlist = playlist
+        self.session_entity.playlist_index = int(settings.value("current", -1))
+        settings.endGroup()  # playlist
+
         settings.endGroup()  # session-id
         settings.endGroup()  # sessions
@@ -0,0 +1,418 @@
+from PySide6.QtCore import QElapsedTimer, QObject, QTimer, QUrl, Qt, Signal
+from PySide6.QtMultimedia import QMediaMetaData, QMediaPlayer
+
+
+class SimulatedMediaPlayer(QObject):
+    """
+    SimulatedMediaPlayer stands in for a QMediaPlayer without decoding any
+    media, offering the part of its interface that the application uses.
+    Every source loads as media of the same made-up duration and tracks.
+    Playback follows a simulated clock: the position advances with it at the
+    playback rate, positionChanged is emitted once per position interval of
+    it, and loading and seeking take a set time on it, during which playback
+    holds still.
+
+    The clock either follows real time, ticking at the position interval, or
+    only moves when advance() is called, so that the signals a test or
+    benchmark sees are exactly the same on every run.
+    """
+    positionChanged = Signal("qint64")
+    durationChanged = Signal("qint64")
+    mediaStatusChanged = Signal(QMediaPlayer.MediaStatus)
+    playbackStateChanged = Signal(QMediaPlayer.PlaybackState)
+    playbackRateChanged = Signal(float)
+    sourceChanged = Signal(QUrl)
+    tracksChanged = Signal()
+    hasVideoChanged = Signal(bool)
+    hasAudioChanged = Signal(bool)
+
+    def __init__(self, parent=None, duration=60000, has_video=True, has_audio=True, position_interval_ms=40,
+                 load_latency_ms=0, seek_latency_ms=0, real_time=True):
+        """
+        Constructor - Creates an instance of SimulatedMediaPlayer
+
+        Parameters:
+            parent - owner of the player.
+            duration - duration of the media of every source in ms.
+            has_video - whether the media has a video track.
+            has_audio - whether the media has an audio track.
+            position_interval_ms - clock time between positionChanged signals during playback.
+            load_latency_ms - clock time taken to load a source.
+            seek_latency_ms - clock time taken by a seek, until its position is reported.
+            real_time - whether the clock follows real time, rather than only moving on advance().
+        """
+        super().__init__(parent)
+        self._media_duration = duration
+        self._media_has_video = has_video
+        self._media_has_audio = has_audio
+        self._position_interval_ms = max(1, position_interval_ms)
+        self._load_latency_ms = load_latency_ms
+        self._seek_latency_ms = seek_latency_ms
+
+        self._source = QUrl()
+        self._duration = 0
+        self._position = 0.0
+        self._rate = 1.0
+        self._state = QMediaPlayer.StoppedState
+        self._status = QMediaPlayer.NoMedia
+        self._active_video_track = 0
+        self._active_audio_track = 0
+        self._video_output = None
+        self._audio_output = None
+
+        self._clock_ms = 0.0
+        self._load_due = None  # clock time the source finishes loading, None when not loading
+        self._seek_due = None  # clock time the seek finishes, None when not seeking
+        self._next_report_ms = 0.0  # clock time of the next positionChanged during playback
+
+        self._timer = None
+        if real_time:
+            self._elapsed_timer = QElapsedTimer()
+            self._elapsed_timer.start()
+            self._timer = QTimer(self)
+            self._timer.setTimerType(Qt.PreciseTimer)
+            self._timer.setInterval(self._position_interval_ms)
+            self._timer.timeout.connect(self._on_tick)
+            self._timer.start()
+
+    def clock(self):
+        """
+        Gets the time of the simulated clock in ms.
+        """
+        return self._clock_ms
+
+    def advance(self, elapsed_ms):
+        """
+        Moves the simulated clock forwards, emitting every signal due within
+        that time in order.
+
+        Parameters:
+            elapsed_ms - time to move the clock by in ms.
+        """
+        end_ms = self._clock_ms + max(0, elapsed_ms)
+        while True:
+            # The earliest of the events due by the end, in order of precedence on ties.
+            events = [(end_ms, 4, None)]
+            if self._load_due is not None:
+                events.append((self._load_due, 0, self._finish_loading))
+            if self._seek_due is not None:
+                events.append((self._seek_due, 1, self._finish_seek))
+            if self._is_advancing():
+                events.append((self._clock_ms + (self._duration - self._position) / self._rate, 2, self._finish_media))
+                events.append((self._next_report_ms, 3, self._report_position))
+            due_ms, _, handle = min(events, key=lambda event: event[:2])
+            if due_ms > end_ms:
+                due_ms, handle = end_ms, None
+            self._move_clock_to(due_ms)
+            if handle is None:
+                return
+            handle()
+
+    # The part of QMediaPlayer's interface used by the application.
+
+    def source(self):
+        """
+        Gets the source of the media.
+        """
+        return QUrl(self._source)
+
+    def setSource(self, source):
+        """
+        Stops playback and starts loading a source, or unloads the media for an
+        empty source. As with QMediaPlayer, loading always finishes later, at
+        the earliest when the clock next moves.
+        """
+        if source == self._source:
+            return
+        self._set_state(QMediaPlayer.StoppedState)
+        self._source = QUrl(source)
+        self._seek_due = None
+        self._set_position(0)
+        self._set_duration(0)
+        self.sourceChanged.emit(QUrl(self._source))
+        if self._source.isEmpty():
+            self._load_due = None
+            self._set_status(QMediaPlayer.NoMedia)
+        else:
+            self._load_due = self._clock_ms + self._load_latency_ms
+            self._set_status(QMediaPlayer.LoadingMedia)
+        self.tracksChanged.emit()
+
+    def play(self):
+        """
+        Starts or resumes playback, from the start if the media had ended.
+        """
+        if self._status in (QMediaPlayer.NoMedia, QMediaPlayer.InvalidMedia):
+            return
+        if self._status == QMediaPlayer.EndOfMedia:
+            self._set_position(0)
+        self._set_state(QMediaPlayer.PlayingState)
+        if self._load_due is None:
+            self._set_status(QMediaPlayer.BufferedMedia)
+        self._next_report_ms = self._clock_ms + self._position_interval_ms
+
+    def pause(self):
+        """
+        Pauses playback.
+        """
+        if self._status in (QMediaPlayer.NoMedia, QMediaPlayer.InvalidMedia):
+            return
+        self._set_state(QMediaPlayer.PausedState)
+
+    def stop(self):
+        """
+        Stops playback, returning to the start.
+        """
+        self._set_state(QMediaPlayer.StoppedState)
+        self._seek_due = None
+        self._set_position(0)
+        if self._load_due is None and self._status in (QMediaPlayer.BufferedMedia, QMediaPlayer.EndOfMedia):
+            self._set_status(QMediaPlayer.LoadedMedia)
+
+    def position(self):
+        """
+        Gets the position in ms.
+        """
+        return int(self._position)
+
+    def setPosition(self, position):
+        """
+        Seeks to a position in ms, once the media is loaded.
+        """
+        if self._load_due is not None or self._status in (QMediaPlayer.NoMedia, QMediaPlayer.InvalidMedia):
+            return
+        position = min(max(0, position), self._duration)
+        if self._status == QMediaPlayer.EndOfMedia and position < self._duration:
+            self._set_status(QMediaPlayer.LoadedMedia)
+        if self._seek_latency_ms <= 0:
+            self._set_position(position)
+            self._next_report_ms = self._clock_ms + self._position_interval_ms
+            return
+        # The position is known straight away, and reported once the seek finishes.
+        self._position = float(position)
+        self._seek_due = self._clock_ms + self._seek_latency_ms
+
+    def duration(self):
+        """
+        Gets the duration of the media in ms, 0 until it is loaded.
+        """
+        return self._duration
+
+    def isSeekable(self):
+        """
+        Determines whether the media can be seeked.
+        """
+        return self._duration > 0
+
+    def playbackState(self):
+        """
+        Gets the playback state.
+        """
+        return self._state
+
+    def mediaStatus(self):
+        """
+        Gets the status of the media.
+        """
+        return self._status
+
+    def playbackRate(self):
+        """
+        Gets the playback rate.
+        """
+        return self._rate
+
+    def setPlaybackRate(self, rate):
+        """
+        Sets the playback rate.
+        """
+        if rate == self._rate:
+            return
+        self._rate = rate
+        self.playbackRateChanged.emit(rate)
+
+    def hasVideo(self):
+        """
+        Determines whether the loaded media has video.
+        """
+        return self._has_loaded_media() and self._media_has_video
+
+    def hasAudio(self):
+        """
+        Determines whether the loaded media has audio.
+        """
+        return self._has_loaded_media() and self._media_has_audio
+
+    def videoTracks(self):
+        """
+        Gets the metadata of each video track of the loaded media.
+        """
+        return [QMediaMetaData()] if self.hasVideo() else []
+
+    def audioTracks(self):
+        """
+        Gets the metadata of each audio track of the loaded media.
+        """
+        return [QMediaMetaData()] if self.hasAudio() else []
+
+    def activeVideoTrack(self):
+        """
+        Gets the index of the video track played, -1 for none.
+        """
+        return self._active_video_track if self.hasVideo() else -1
+
+    def setActiveVideoTrack(self, index):
+        """
+        Sets the index of the video track played, -1 for none.
+        """
+        self._active_video_track = index
+
+    def activeAudioTrack(self):
+        """
+        Gets the index of the audio track played, -1 for none.
+        """
+        return self._active_audio_track if self.hasAudio() else -1
+
+    def setActiveAudioTrack(self, index):
+        """
+        Sets the index of the audio track played, -1 for none.
+        """
+        self._active_audio_track = index
+
+    def videoOutput(self):
+        """
+        Gets the video output, which is never drawn to.
+        """
+        return self._video_output
+
+    def setVideoOutput(self, video_output):
+        """
+        Sets the video output, which is never drawn to.
+        """
+        self._video_output = video_output
+
+    def audioOutput(self):
+        """
+        Gets the audio output, which is never played to.
+        """
+        return self._audio_output
+
+    def setAudioOutput(self, audio_output):
+        """
+        Sets the audio output, which is never played to.
+        """
+        self._audio_output = audio_output
+
+    def error(self):
+        """
+        Gets the last error, which is always none.
+        """
+        return QMediaPlayer.NoError
+
+    def errorString(self):
+        """
+        Gets the description of the last error, which is always empty.
+        """
+        return ""
+
+    def _on_tick(self):
+        """
+        Moves the clock by the real time since the last tick.
+        """
+        self.advance(self._elapsed_timer.restart())
+
+    def _has_loaded_media(self):
+        """
+        Determines whether the source has finished loading.
+        """
+        return self._load_due is None and self._status not in (QMediaPlayer.NoMedia, QMediaPlayer.InvalidMedia)
+
+    def _is_advancing(self):
+        """
+        Determines whether the position moves with the clock.
+        """
+        return self._state == QMediaPlayer.PlayingState and self._load_due is None and self._seek_due is None \
+            and self._status != QMediaPlayer.EndOfMedia and self._rate > 0
+
+    def _move_clock_to(self, clock_ms):
+        """
+        Moves the clock to a time, and the position along with it during playback.
+
+        Parameters:
+            clock_ms - time of the clock in ms.
+        """
+        if self._is_advancing():
+            self._position = min(float(self._duration), self._position + (clock_ms - self._clock_ms) * self._rate)
+        self._clock_ms = clock_ms
+
+    def _finish_loading(self):
+        """
+        Makes the media of the source known, and starts playing it if play()
+        was called while it loaded.
+        """
+        self._load_due = None
+        self._set_duration(self._media_duration)
+        self._set_status(QMediaPlayer.LoadedMedia)
+        self.tracksChanged.emit()
+        self.hasVideoChanged.emit(self.hasVideo())
+        self.hasAudioChanged.emit(self.hasAudio())
+        if self._state == QMediaPlayer.PlayingState:
+            self._set_status(QMediaPlayer.BufferedMedia)
+            self._next_report_ms = self._clock_ms + self._position_interval_ms
+
+    def _finish_seek(self):
+        """
+        Reports the position a seek reached, from which playback carries on.
+        """
+        self._seek_due = None
+        self.positionChanged.emit(int(self._position))
+        self._next_report_ms = self._clock_ms + self._position_interval_ms
+
+    def _finish_media(self):
+        """
+        Stops playback at the end of the media.
+        """
+        self._position = float(self._duration)
+        self.positionChanged.emit(self._duration)
+        self._set_state(QMediaPlayer.StoppedState)
+        self._set_status(QMediaPlayer.EndOfMedia)
+
+    def _report_position(self):
+        """
+        Reports the position during playback.
+        """
+        self._next_report_ms += self._position_interval_ms
+        self.positionChanged.emit(int(self._position))
+
+    def _set_position(self, position):
+        """
+        Sets the position, reporting it if it changed.
+        """
+        changed = int(position) != int(self._position)
+        self._position = float(position)
+        if changed:
+            self.positionChanged.emit(int(position))
+
+    def _set_duration(self, duration):
+        """
+        Sets the duration, reporting it if it changed.
+        """
+        if duration != self._duration:
+            self._duration = duration
+            self.durationChanged.emit(duration)
+
+    def _set_state(self, state):
+        """
+        Sets the playback state, reporting it if it changed.
+        """
+        if state != self._state:
+            self._state = state
+            self.playbackStateChanged.emit(state)
+
+    def _set_status(self, status):
+        """
+        Sets the media status, reporting it if it changed.
+        """
+        if status != self._status:
+            self._status = status
+            self.mediaStatusChanged.emit(status)
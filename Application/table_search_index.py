@@ -0,0 +1,400 @@
+import itertools
+import re
+import shlex
+from bisect import bisect_left
+
+from Application.timecode import parse_time_range, parse_timestamp
+
+# Matches the words of a cell or query, which are searched case-insensitively.
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Prefix of the index entry holding a row's whole cell value, used by "code:" terms.
+# Words never start with it, so cell values and words share one index.
+_CELL_VALUE_PREFIX = "="
+
+
+class SearchQuery:
+    """
+    A parsed search of the encoding table. Rows match when they contain every
+    word, have a cell equal to every code, and have a time within the range.
+    """
+    def __init__(self, words, prefix, codes, time_range):
+        """
+        Constructor - Creates an instance of SearchQuery
+
+        Parameters:
+            words - list of words the row must contain.
+            prefix - start of a word the row must contain, None for no prefix.
+            codes - list of cell values the row must contain.
+            time_range - (first ms, last ms) of the row's time, either may be
+                None for an open range, or None for any time.
+        """
+        self.words = words
+        self.prefix = prefix
+        self.codes = codes
+        self.time_range = time_range
+
+    @classmethod
+    def parse(cls, text):
+        """
+        Parses the text of a search. Terms are separated by spaces and quotes
+        group terms with spaces. "code:<value>" matches a whole cell,
+        "time:<from>-<to>" matches a time range in which either end may be
+        left out, and any other term matches the words of a cell. The last word
+        is matched as a prefix while it is still being typed.
+
+        Parameters:
+            text - text of the search.
+
+        Returns:
+            The query, or None if the text holds no terms.
+        """
+        try:
+            terms = shlex.split(text)
+        except ValueError:
+            terms = text.split()
+
+        words = []
+        codes = []
+        time_range = None
+        ends_with_word = False
+        for term in terms:
+            key, _, value = term.partition(":")
+            key = key.casefold()
+            ends_with_word = False
+            if key == "code" and value:
+                codes.append(value.strip().casefold())
+            elif key == "time" and value:
+                first, _, last = value.replace("..", "-").partition("-")
+                time_range = (parse_timestamp(first.strip()) if first.strip() else None,
+                              parse_timestamp(last.strip()) if last.strip() else None)
+            else:
+                words += _TOKEN_PATTERN.findall(term.casefold())
+                ends_with_word = True
+
+        prefix = None
+        if words and ends_with_word and text[-1:].isalnum():
+            prefix = words.pop()
+        if not (words or prefix or codes or time_range):
+            return None
+        return cls(words, prefix, codes, time_range)
+
+
+class TableSearchIndex:
+    """
+    TableSearchIndex keeps an inverted index from the words and cell values of
+    the encoding table to the rows containing them, so that searches do not
+    scan the table. Every row is identified by a key that stays the same while
+    rows are inserted, removed or moved around it. The index is built on the
+    first search and is then kept up to date from the table model's signals:
+    edited rows are only marked, and are indexed again before the next search.
+    """
+
+    def __init__(self, model):
+        """
+        Constructor - Creates an instance of TableSearchIndex
+
+        Parameters:
+            model - item model of the encoding table.
+        """
+        self._model = model
+        self._built = False
+        self._next_key = itertools.count()
+        self._row_keys = []  # row key of each table row, in table order
+        self._key_rows = None  # row key : table row, None when outdated
+        self._row_entries = {}  # row key : index entries of the row
+        self._row_times = {}  # row key : time of the row in ms, or None
+        self._postings = {}  # index entry : set of row keys
+        self._dirty_keys = set()  # row keys of rows edited since they were indexed
+        self._sorted_entries = None  # sorted index entries for prefix lookups, None when outdated
+
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.rowsMoved.connect(self._on_rows_moved)
+        model.dataChanged.connect(self._on_data_changed)
+        model.columnsInserted.connect(self._on_columns_changed)
+        model.columnsRemoved.connect(self._on_columns_changed)
+        model.modelReset.connect(self._on_layout_changed)
+        model.layoutChanged.connect(self._on_layout_changed)
+
+    def row_key(self, row):
+        """
+        Gets the key of a table row.
+
+        Parameters:
+            row - index of the table row.
+        """
+        self._ensure_built()
+        return self._row_keys[row]
+
+    def row_count(self):
+        """
+        Gets the number of indexed rows.
+        """
+        self._ensure_built()
+        return len(self._row_keys)
+
+    def search(self, query):
+        """
+        Finds the rows matching a query.
+
+        Parameters:
+            query - SearchQuery to run.
+
+        Returns:
+            Set of the row keys of matching rows.
+        """
+        self.update()
+
+        postings = [self._postings.get(word, set()) for word in query.words]
+        postings += [self._postings.get(_CELL_VALUE_PREFIX + code, set()) for code in query.codes]
+        if query.prefix is not None:
+            postings.append(self._prefix_postings(query.prefix))
+
+        if postings:
+            # Intersect starting from the rarest entry to keep intermediate sets small.
+            postings.sort(key=len)
+            matches = set(postings[0])
+            for posting in postings[1:]:
+                if not matches:
+                    break
+                matches &= posting
+        else:
+            matches = set(self._row_times)
+
+        if query.time_range is not None:
+            row_times = self._row_times
+            matches = {key for key in matches if self._in_time_range(row_times[key], query.time_range)}
+        return matches
+
+    def row_matches(self, key, query):
+        """
+        Determines whether a single row matches a query, without searching the
+        whole index.
+
+        Parameters:
+            key - row key of the row.
+            query - SearchQuery to match.
+        """
+        entries = self._row_entries.get(key, ())
+        if any(word not in entries for word in query.words):
+            return False
+        if any(_CELL_VALUE_PREFIX + code not in entries for code in query.codes):
+            return False
+        if query.prefix is not None and not any(entry.startswith(query.prefix) for entry in entries):
+            return False
+        return query.time_range is None or self._in_time_range(self._row_times.get(key), query.time_range)
+
+    def is_outdated(self):
+        """
+        Determines whether rows were edited since they were last indexed.
+        """
+        return bool(self._dirty_keys) or not self._built
+
+    def update(self):
+        """
+        Indexes the rows edited since they were last indexed, building the
+        index if it has not been built yet.
+
+        Returns:
+            Set of the row keys of the rows that were indexed again, or None if
+            the whole index was built.
+        """
+        if not self._built:
+            self._ensure_built()
+            return None
+
+        dirty_keys = self._dirty_keys
+        self._dirty_keys = set()
+        if dirty_keys:
+            keys = list(dirty_keys)
+            rows = list(zip(self._rows_of(keys), keys))
+            for key in dirty_keys:
+                self._unindex_row(key)
+            self._index_rows(rows)
+        return dirty_keys
+
+    def _ensure_built(self):
+        """
+        Builds the index from the whole table on first use.
+        """
+        if self._built:
+            return
+        self._row_keys = [next(self._next_key) for _ in range(self._model.rowCount())]
+        self._key_rows = None
+        self._row_entries = {}
+        self._row_times = {}
+        self._postings = {}
+        self._dirty_keys = set()
+        self._sorted_entries = None
+        self._index_rows(enumerate(self._row_keys))
+        self._built = True
+
+    def _index_rows(self, rows):
+        """
+        Adds the words and cell values of table rows to the index.
+
+        Parameters:
+            rows - iterable of (table row index, row key) pairs.
+        """
+        # Bind the lookups locally, as this loop runs once per cell.
+        model_index = self._model.index
+        columns = range(self._model.columnCount())
+        find_words = _TOKEN_PATTERN.findall
+        postings = self._postings
+        row_entries = self._row_entries
+        row_times = self._row_times
+        added_entries = False
+
+        for row, key in rows:
+            entries = set()
+            time_ms = None
+            for column in columns:
+                text = model_index(row, column).data()
+                if not text:
+                    continue
+                if column == 0:
+                    time_ms = parse_time_range(text)[0]
+                value = text.strip().casefold()
+                entries.add(_CELL_VALUE_PREFIX + value)
+                entries.update(find_words(value))
+
+            for entry in entries:
+                posting = postings.get(entry)
+                if posting is None:
+                    postings[entry] = {key}
+                    added_entries = True
+                else:
+                    posting.add(key)
+            row_entries[key] = entries
+            row_times[key] = time_ms
+
+        if added_entries:
+            self._sorted_entries = None
+
+    def _unindex_row(self, key):
+        """
+        Removes a row from the index.
+
+        Parameters:
+            key - row key of the row.
+        """
+        postings = self._postings
+        for entry in self._row_entries.pop(key, ()):
+            posting = postings[entry]
+            posting.discard(key)
+            if not posting:
+                del postings[entry]
+        self._row_times.pop(key, None)
+
+    def _rows_of(self, keys):
+        """
+        Finds the table rows of row keys.
+
+        Parameters:
+            keys - collection of row keys.
+
+        Returns:
+            List of row indices, in the order of the keys.
+        """
+        if self._key_rows is None:
+            # Kept until rows are inserted, removed or moved, as edits look rows up repeatedly.
+            self._key_rows = {key: row for row, key in enumerate(self._row_keys)}
+        key_rows = self._key_rows
+        return [key_rows[key] for key in keys]
+
+    def _prefix_postings(self, prefix):
+        """
+        Gets the rows containing a word starting with a prefix.
+
+        Parameters:
+            prefix - start of the word.
+
+        Returns:
+            Set of row keys.
+        """
+        if self._sorted_entries is None:
+            self._sorted_entries = sorted(self._postings)
+        sorted_entries = self._sorted_entries
+        matches = set()
+        for ix in range(bisect_left(sorted_entries, prefix), len(sorted_entries)):
+            entry = sorted_entries[ix]
+            if not entry.startswith(prefix):
+                break
+            matches |= self._postings.get(entry, set())
+        return matches
+
+    @staticmethod
+    def _in_time_range(time_ms, time_range):
+        """
+        Determines whether a row's time lies within a time range.
+
+        Parameters:
+            time_ms - time of the row in ms, or None.
+            time_range - (first ms, last ms), either may be None for an open range.
+        """
+        if time_ms is None:
+            return False
+        first, last = time_range
+        return (first is None or time_ms >= first) and (last is None or time_ms <= last)
+
+    def _on_rows_inserted(self, parent, first, last):
+        """
+        Assigns keys to inserted rows. New rows are empty until they are edited.
+        """
+        if not self._built:
+            return
+        new_keys = [next(self._next_key) for _ in range(last - first + 1)]
+        self._row_keys[first:first] = new_keys
+        self._key_rows = None
+        for key in new_keys:
+            self._row_entries[key] = set()
+            self._row_times[key] = None
+
+    def _on_rows_removed(self, parent, first, last):
+        """
+        Removes deleted rows from the index.
+        """
+        if not self._built:
+            return
+        for key in self._row_keys[first:last + 1]:
+            self._unindex_row(key)
+            self._dirty_keys.discard(key)
+        del self._row_keys[first:last + 1]
+        self._key_rows = None
+
+    def _on_rows_moved(self, parent, first, last, destination, destination_row):
+        """
+        Moves the keys of moved rows along with them.
+        """
+        if not self._built:
+            return
+        moved_keys = self._row_keys[first:last + 1]
+        del self._row_keys[first:last + 1]
+        if destination_row > last:
+            destination_row -= len(moved_keys)
+        self._row_keys[destination_row:destination_row] = moved_keys
+        self._key_rows = None
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        """
+        Marks edited rows to be indexed again before the next search.
+        """
+        if not self._built:
+            return
+        self._dirty_keys.update(self._row_keys[top_left.row():bottom_right.row() + 1])
+
+    def _on_columns_changed(self, parent, first, last):
+        """
+        Marks every row to be indexed again after columns were added or removed.
+        """
+        if not self._built:
+            return
+        self._dirty_keys.update(self._row_keys)
+
+    def _on_layout_changed(self, *args):
+        """
+        Discards the index after the rows were reordered or reset. It is built
+        again on the next search.
+        """
+        self._built = False
@@ -0,0 +1,526 @@
+import itertools
+from bisect import bisect_left, bisect_right, insort
+
+from Application.interval_tree import IntervalTree
+from Application.timecode import is_open_time_range, parse_time_range
+
+# Number of edited rows beyond which the index is built again and the whole
+# table is checked for its order, rather than checking every edited row.
+REBUILD_DIRTY_ROWS = 4096
+
+# Number of misplaced rows up to which they are moved one by one, rather than
+# rewriting the table's rows in their new order.
+REORDER_MOVE_LIMIT = 16
+
+
+class TableTimeIndex:
+    """
+    TableTimeIndex keeps the time of every row of the encoding table in
+    milliseconds, so that the row at which a coded event belongs in time order
+    is found by binary search instead of scanning the table. Rows coding a
+    segment, whose time cell holds a start and an end time, are also held in
+    an interval tree, which finds the segments active at a time or overlapping
+    a range without visiting the other rows. The index is built on first use
+    and is then kept up to date from the table model's signals: rows whose
+    time is edited are only marked, and are parsed again, and moved back into
+    time order if needed, before the index is next used.
+    """
+
+    def __init__(self, model, time_column=0):
+        """
+        Constructor - Creates an instance of TableTimeIndex
+
+        Parameters:
+            model - item model of the encoding table.
+            time_column - column holding the time of each row.
+        """
+        self._model = model
+        self._time_column = time_column
+        self._built = False
+        # Whether every row must be checked for its order, rather than only the edited rows.
+        self._check_all_rows = True
+        self._row_times = []  # time of each table row in ms, None for rows without a time
+        self._row_ends = []  # end of each table row's segment in ms, None for rows without an end
+        self._dirty_rows = set()  # rows whose time was edited since they were indexed
+        # Segments are identified by a key of their row that stays the same
+        # while rows are inserted or removed around it.
+        self._next_key = itertools.count()
+        self._row_keys = []  # row key of each table row, in table order
+        self._key_rows = None  # row key : table row, None when outdated
+        self._rows_looked_up = False  # whether rows were looked up by key since _key_rows was outdated
+        self._segments = IntervalTree()  # (start ms, end ms, row key) of every segment
+        self._open_starts = {}  # row key : start ms of each segment whose end has not been coded yet
+        self._sorted_times = None  # sorted (time ms, row key) of every timed row, None until first needed
+
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.rowsMoved.connect(self._on_layout_changed)
+        model.dataChanged.connect(self._on_data_changed)
+        model.columnsInserted.connect(self._on_columns_changed)
+        model.columnsRemoved.connect(self._on_columns_changed)
+        model.modelReset.connect(self._on_layout_changed)
+        model.layoutChanged.connect(self._on_layout_changed)
+
+    def segments_at(self, time_ms):
+        """
+        Finds the rows of the segments active at a time. Segments whose end
+        has not been coded yet are active from their start onwards.
+
+        Parameters:
+            time_ms - time in ms.
+
+        Returns:
+            List of row indices, ordered by the segments' starts.
+        """
+        self._update()
+        keys = [key for _, _, key in self._segments.at(time_ms)]
+        keys += [key for key, start_ms in self._open_starts.items() if start_ms <= time_ms]
+        return self._rows_of(keys)
+
+    def segments_overlapping(self, first_ms, last_ms):
+        """
+        Finds the segments overlapping a range of time.
+
+        Parameters:
+            first_ms - start of the range in ms.
+            last_ms - end of the range in ms.
+
+        Returns:
+            List of (start ms, end ms, row index) ordered by start, with an
+            end of None for segments whose end has not been coded yet.
+        """
+        self._update()
+        segments = self._segments.overlapping(first_ms, last_ms)
+        segments += [(start_ms, None, key) for key, start_ms in self._open_starts.items() if start_ms <= last_ms]
+        rows = self._rows_of([key for _, _, key in segments])
+        return [(start_ms, end_ms, row) for (start_ms, end_ms, _), row in zip(segments, rows)]
+
+    def nearest_row(self, time_ms):
+        """
+        Finds the row whose time is closest to a time, whether or not the
+        table is in time order. The rows' times are kept sorted once this is
+        first used, so that the row is found by binary search.
+
+        Parameters:
+            time_ms - time in ms.
+
+        Returns:
+            Index of the row, the earlier row for two rows equally close, or
+            None if no row has a time.
+        """
+        self._update()
+        if self._sorted_times is None:
+            self._sorted_times = sorted((time, key) for time, key in zip(self._row_times, self._row_keys)
+                                        if time is not None)
+        sorted_times = self._sorted_times
+        if not sorted_times:
+            return None
+        ix = bisect_left(sorted_times, (time_ms,))
+        if ix == len(sorted_times) or (ix > 0 and time_ms - sorted_times[ix - 1][0] <= sorted_times[ix][0] - time_ms):
+            ix -= 1
+        return self._rows_of([sorted_times[ix][1]])[0]
+
+    def open_segment_rows(self):
+        """
+        Finds the rows of the segments whose end has not been coded yet.
+
+        Returns:
+            List of row indices in ascending order.
+        """
+        self._update()
+        return sorted(self._rows_of(list(self._open_starts)))
+
+    def plan_reorder(self):
+        """
+        Finds the rows that are out of time order, and where they belong. Only
+        the rows edited since the last call are checked, unless the whole
+        table has not been checked yet, in which case the fewest rows needed to
+        restore the order are moved. A few misplaced rows are moved one by one,
+        while many are put in place by reordering the table at once.
+
+        Returns:
+            (moves, order) - list of (source row, destination row) moves of
+            single rows, to be applied one after the other, and None; or an
+            empty list and the list of every row in its new order. Both are
+            empty if the table is in time order.
+        """
+        edited_rows = self._update()
+        if self._check_all_rows:
+            misplaced_rows = self._find_unordered_rows()
+            self._check_all_rows = False
+        elif all(self._is_in_order(row) for row in edited_rows):
+            return [], None
+        else:
+            misplaced_rows = self._find_misplaced_rows(edited_rows)
+        if not misplaced_rows:
+            return [], None
+        order = self._plan_order(misplaced_rows)
+        if len(misplaced_rows) > REORDER_MOVE_LIMIT:
+            return [], order
+        return self._plan_moves(order, misplaced_rows), None
+
+    def find_slot(self, time_ms):
+        """
+        Finds the row at which an event belongs in time order: above the first
+        row with a later time, and above any empty rows preceding that row.
+        The table is expected to be in time order, see plan_reorder().
+
+        Parameters:
+            time_ms - time of the event in ms.
+
+        Returns:
+            (row, is_empty) - index of the row, and whether it is an empty row
+            the event can be written to instead of inserting a row.
+        """
+        self._update()
+        row_count = len(self._row_times)
+        row = self._find_slot_in(range(row_count), time_ms)
+        return row, row < row_count and self._is_empty_row(row)
+
+    def _find_slot_in(self, rows, time_ms):
+        """
+        Finds where a row of the given time belongs among rows in time order.
+
+        Parameters:
+            rows - sequence of row indices in time order.
+            time_ms - time in ms.
+
+        Returns:
+            Position within rows, above the first later row and any empty rows preceding it.
+        """
+        position = self._find_first_later(rows, time_ms)
+        while position > 0 and self._row_times[rows[position - 1]] is None and self._is_empty_row(rows[position - 1]):
+            position -= 1
+        return position
+
+    def _find_first_later(self, rows, time_ms):
+        """
+        Binary searches for the first row with a time later than the given
+        time, skipping rows without a time.
+
+        Parameters:
+            rows - sequence of row indices in time order.
+            time_ms - time in ms.
+
+        Returns:
+            Position of the first later row within rows, or the length of rows
+            if no row is later.
+        """
+        row_times = self._row_times
+        low, high = 0, len(rows)
+        while low < high:
+            middle = (low + high) // 2
+            # Rows without a time are ordered by the nearest timed row above them.
+            timed = middle
+            while timed >= low and row_times[rows[timed]] is None:
+                timed -= 1
+            if timed < low or row_times[rows[timed]] <= time_ms:
+                low = middle + 1
+            else:
+                high = timed
+        return low
+
+    def _is_in_order(self, row):
+        """
+        Determines whether a row's time lies between the times of the nearest
+        timed rows above and below it.
+
+        Parameters:
+            row - index of the table row.
+        """
+        row_times = self._row_times
+        time_ms = row_times[row]
+        if time_ms is None:
+            return True
+        above = row - 1
+        while above >= 0 and row_times[above] is None:
+            above -= 1
+        if above >= 0 and row_times[above] > time_ms:
+            return False
+        below = row + 1
+        while below < len(row_times) and row_times[below] is None:
+            below += 1
+        return below >= len(row_times) or time_ms <= row_times[below]
+
+    def _find_misplaced_rows(self, edited_rows):
+        """
+        Finds the rows to move to restore time order after rows were edited.
+        The rows that were not edited are in time order already, so wherever
+        an edited row and another row are out of order, the edited row moves.
+
+        Parameters:
+            edited_rows - set of the rows edited since they were last checked.
+
+        Returns:
+            Set of the rows to move.
+        """
+        row_times = self._row_times
+        kept_rows = []
+        misplaced_rows = set()
+        for row, time_ms in enumerate(row_times):
+            if time_ms is None:
+                continue
+            while kept_rows and row_times[kept_rows[-1]] > time_ms and kept_rows[-1] in edited_rows:
+                misplaced_rows.add(kept_rows.pop())
+            if kept_rows and row_times[kept_rows[-1]] > time_ms:
+                misplaced_rows.add(row)
+            else:
+                kept_rows.append(row)
+        return misplaced_rows
+
+    def _find_unordered_rows(self):
+        """
+        Finds the fewest rows to move to put the whole table in time order,
+        which are the timed rows outside its longest time-ordered sequence.
+
+        Returns:
+            Set of the rows to move.
+        """
+        tail_times = []  # least last time of an ordered sequence of each length
+        tail_rows = []  # last row of that sequence
+        previous_rows = {}  # row : row before it in its ordered sequence
+        for row, time_ms in enumerate(self._row_times):
+            if time_ms is None:
+                continue
+            length = bisect_right(tail_times, time_ms)
+            if length == len(tail_times):
+                tail_times.append(time_ms)
+                tail_rows.append(row)
+            else:
+                tail_times[length] = time_ms
+                tail_rows[length] = row
+            previous_rows[row] = tail_rows[length - 1] if length else None
+
+        ordered_rows = set()
+        row = tail_rows[-1] if tail_rows else None
+        while row is not None:
+            ordered_rows.add(row)
+            row = previous_rows[row]
+        return set(previous_rows) - ordered_rows
+
+    def _plan_order(self, misplaced_rows):
+        """
+        Finds the order of the rows once misplaced rows are back in time order.
+        Each row moves to where it belongs among the rows staying in place, as
+        found by find_slot(). The misplaced rows are sorted once and merged
+        into the rows staying in place in a single pass.
+
+        Parameters:
+            misplaced_rows - set of the rows to move.
+
+        Returns:
+            List of every row in its new order.
+        """
+        row_times = self._row_times
+        kept_rows = [row for row in range(len(row_times)) if row not in misplaced_rows]
+        order = []
+        placed = 0  # number of kept rows added to the order
+        position = 0  # number of kept rows not later than the current misplaced row
+        kept_time = None  # time of the nearest timed kept row above the position
+        for row in sorted(misplaced_rows, key=lambda misplaced_row: (row_times[misplaced_row], misplaced_row)):
+            time_ms = row_times[row]
+            # Rows without a time are ordered by the nearest timed row above them.
+            while position < len(kept_rows):
+                next_time = row_times[kept_rows[position]]
+                if next_time is None:
+                    next_time = kept_time
+                if next_time is not None and next_time > time_ms:
+                    break
+                kept_time = next_time
+                position += 1
+            slot = position
+            while slot > placed and row_times[kept_rows[slot - 1]] is None and self._is_empty_row(kept_rows[slot - 1]):
+                slot -= 1
+            order += kept_rows[placed:slot]
+            order.append(row)
+            placed = slot
+        order += kept_rows[placed:]
+        return order
+
+    def _plan_moves(self, order, misplaced_rows):
+        """
+        Plans the single row moves that put a few misplaced rows in their new
+        order.
+
+        Parameters:
+            order - list of every row in its new order.
+            misplaced_rows - set of the rows to move.
+
+        Returns:
+            List of (source row, destination row) moves, applied one after the other.
+        """
+        # Move the rows from the bottom of the new order up, so that the row
+        # following each moved row has always reached its final place.
+        rows = list(range(len(order)))
+        moves = []
+        for position in range(len(order) - 1, -1, -1):
+            row = order[position]
+            if row not in misplaced_rows:
+                continue
+            source_row = rows.index(row)
+            del rows[source_row]
+            destination_row = rows.index(order[position + 1]) if position + 1 < len(order) else len(rows)
+            rows.insert(destination_row, row)
+            if source_row != destination_row:
+                moves.append((source_row, destination_row))
+        return moves
+
+    def _is_empty_row(self, row):
+        """
+        Determines whether every cell of a table row is empty.
+
+        Parameters:
+            row - index of the table row.
+        """
+        model_index = self._model.index
+        return all(not model_index(row, column).data() for column in range(self._model.columnCount()))
+
+    def _rows_of(self, keys):
+        """
+        Finds the table rows of row keys.
+
+        Parameters:
+            keys - collection of row keys.
+
+        Returns:
+            List of row indices, in the order of the keys.
+        """
+        if self._key_rows is None:
+            if len(keys) <= 16 and not self._rows_looked_up:
+                self._rows_looked_up = True
+                return [self._row_keys.index(key) for key in keys]
+            # Kept until rows are inserted or removed, as playback looks rows up repeatedly.
+            self._key_rows = {key: row for row, key in enumerate(self._row_keys)}
+        key_rows = self._key_rows
+        return [key_rows[key] for key in keys]
+
+    def _index_row(self, row):
+        """
+        Parses the time of a table row, and adds the row to the segments if its
+        time is a segment.
+
+        Parameters:
+            row - index of the table row.
+        """
+        text = self._model.index(row, self._time_column).data()
+        start_ms, end_ms = parse_time_range(text)
+        self._row_times[row] = start_ms
+        self._row_ends[row] = end_ms
+        key = self._row_keys[row]
+        if start_ms is not None and self._sorted_times is not None:
+            insort(self._sorted_times, (start_ms, key))
+        if end_ms is not None:
+            self._segments.add(start_ms, end_ms, key)
+        elif is_open_time_range(text):
+            self._open_starts[key] = start_ms
+
+    def _unindex_row(self, row):
+        """
+        Removes a table row from the segments.
+
+        Parameters:
+            row - index of the table row.
+        """
+        key = self._row_keys[row]
+        if self._row_times[row] is not None and self._sorted_times is not None:
+            del self._sorted_times[bisect_left(self._sorted_times, (self._row_times[row], key))]
+        if self._row_ends[row] is not None:
+            self._segments.remove(self._row_times[row], self._row_ends[row], key)
+        self._open_starts.pop(key, None)
+
+    def _update(self):
+        """
+        Parses the times of the rows edited since they were last indexed,
+        building the index if it has not been built yet.
+
+        Returns:
+            Set of the rows that were parsed again.
+        """
+        if not self._built:
+            row_count = self._model.rowCount()
+            self._row_keys = [next(self._next_key) for _ in range(row_count)]
+            self._key_rows = None
+            self._rows_looked_up = False
+            self._sorted_times = None
+            self._row_times = [None] * row_count
+            self._row_ends = [None] * row_count
+            self._open_starts = {}
+            segments = []
+            model_index = self._model.index
+            for row in range(row_count):
+                text = model_index(row, self._time_column).data()
+                start_ms, end_ms = parse_time_range(text)
+                self._row_times[row] = start_ms
+                self._row_ends[row] = end_ms
+                if end_ms is not None:
+                    segments.append((start_ms, end_ms, self._row_keys[row]))
+                elif is_open_time_range(text):
+                    self._open_starts[self._row_keys[row]] = start_ms
+            # The tree is built from all segments at once, rather than one segment at a time.
+            self._segments = IntervalTree(segments)
+            self._dirty_rows = set()
+            self._check_all_rows = True
+            self._built = True
+            return set()
+
+        dirty_rows = self._dirty_rows
+        self._dirty_rows = set()
+        for row in dirty_rows:
+            self._unindex_row(row)
+            self._index_row(row)
+        return dirty_rows
+
+    def _on_rows_inserted(self, parent, first, last):
+        """
+        Adds inserted rows, which are empty until they are edited.
+        """
+        if not self._built:
+            return
+        count = last - first + 1
+        self._row_times[first:first] = [None] * count
+        self._row_ends[first:first] = [None] * count
+        self._row_keys[first:first] = [next(self._next_key) for _ in range(count)]
+        self._key_rows = None
+        self._rows_looked_up = False
+        self._dirty_rows = {row + count if row >= first else row for row in self._dirty_rows}
+
+    def _on_rows_removed(self, parent, first, last):
+        """
+        Removes deleted rows from the index.
+        """
+        if not self._built:
+            return
+        count = last - first + 1
+        for row in range(first, last + 1):
+            self._unindex_row(row)
+        del self._row_times[first:last + 1]
+        del self._row_ends[first:last + 1]
+        del self._row_keys[first:last + 1]
+        self._key_rows = None
+        self._rows_looked_up = False
+        self._dirty_rows = {row - count if row > last else row for row in self._dirty_rows if not first <= row <= last}
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        """
+        Marks rows whose time was edited to be parsed again when next needed.
+        """
+        if not self._built or not top_left.column() <= self._time_column <= bottom_right.column():
+            return
+        self._dirty_rows.update(range(top_left.row(), bottom_right.row() + 1))
+        if len(self._dirty_rows) > REBUILD_DIRTY_ROWS:
+            self._built = False
+
+    def _on_columns_changed(self, parent, first, last):
+        """
+        Discards the index when columns were added or removed in front of the
+        time column, as every row's time then moved to another column.
+        """
+        if first <= self._time_column:
+            self._built = False
+
+    def _on_layout_changed(self, *args):
+        """
+        Discards the index after the rows were reordered or reset. It is built
+        again on next use, and the whole table is then checked for its order.
+        """
+        self._built = False
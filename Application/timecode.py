@@ -0,0 +1,229 @@
+import math
+import re
+from functools import lru_cache
+
+# Matches "[HH:]MM:SS" with an optional fraction separated by "." or ",".
+_TIMESTAMP_PATTERN = re.compile(r"^\s*(?:(\d+):)?(\d{1,2}):(\d{1,2})(?:[.,](\d{1,3}))?\s*$")
+# Matches an SMPTE "HH:MM:SS:FF" timecode.
+_SMPTE_PATTERN = re.compile(r"^\s*(\d+):(\d{1,2}):(\d{1,2}):(\d{1,3})\s*$")
+
+# Number of distinct timestamp strings whose parsed value is kept. Coded rows
+# often share timestamps, so repeated parsing is served from the cache.
+PARSE_CACHE_SIZE = 65536
+# Number of distinct displayed timestamps whose text is kept, which covers
+# the labels and positions shown while a video plays and is scrubbed.
+FORMAT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_timestamp(text):
+    """
+    Converts a timestamp string to milliseconds. Accepts "HH:MM:SS",
+    "MM:SS", and either form followed by a fraction of a second such as
+    "HH:MM:SS.cc" or "HH:MM:SS,mmm". Results are cached.
+
+    Parameters:
+        text - timestamp string to convert.
+
+    Returns:
+        Time in milliseconds, or None if the text is not a timestamp.
+    """
+    if not text:
+        return None
+    match = _TIMESTAMP_PATTERN.match(text)
+    if match is None:
+        return None
+    hours, minutes, seconds, fraction = match.groups()
+    milliseconds = int(fraction.ljust(3, "0")) if fraction else 0
+    return ((int(hours or 0) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + milliseconds
+
+
+# Separates the start and end times of a coded segment in a time cell.
+TIME_RANGE_SEPARATOR = " - "
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_time_range(text):
+    """
+    Converts the text of a time cell to milliseconds. The cell holds either a
+    single timestamp, or the start and end timestamps of a coded segment
+    separated by "-". A segment whose end has not been coded yet ends with the
+    separator. Results are cached.
+
+    Parameters:
+        text - text of the time cell.
+
+    Returns:
+        (start ms, end ms) - end is None for a single timestamp or a segment
+        without an end, and both are None if the text is not a time.
+    """
+    if not text:
+        return None, None
+    first, separator, last = text.partition("-")
+    start_ms = parse_timestamp(first)
+    if start_ms is None or not separator:
+        return start_ms, None
+    end_ms = parse_timestamp(last)
+    if end_ms is not None and end_ms < start_ms:
+        start_ms, end_ms = end_ms, start_ms
+    return start_ms, end_ms
+
+
+def is_open_time_range(text):
+    """
+    Determines whether the text of a time cell is a segment whose end has not
+    been coded yet.
+
+    Parameters:
+        text - text of the time cell.
+    """
+    return bool(text) and text.rstrip().endswith("-") and parse_time_range(text)[0] is not None
+
+
+def format_timestamp(milliseconds, fraction_separator=".", fraction_digits=3):
+    """
+    Converts milliseconds to a "HH:MM:SS.mmm" timestamp string.
+
+    Parameters:
+        milliseconds - time in milliseconds to convert.
+        fraction_separator - character separating the seconds from their fraction.
+        fraction_digits - number of fraction digits, 0 to omit the fraction.
+    """
+    milliseconds = int(milliseconds)
+    hours, remainder = divmod(milliseconds, 3600000)
+    minutes, remainder = divmod(remainder, 60000)
+    seconds, remainder = divmod(remainder, 1000)
+    timestamp = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    if fraction_digits > 0:
+        fraction = f"{remainder:03d}"[:fraction_digits]
+        timestamp += f"{fraction_separator}{fraction}"
+    return timestamp
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_timestamp_units(units, fraction_separator, fraction_digits):
+    """
+    Converts a time counted in units of the last digit shown to a timestamp
+    string. Results are cached.
+
+    Parameters:
+        units - time in units of 10 ** (3 - fraction_digits) milliseconds.
+        fraction_separator - character separating the seconds from their fraction.
+        fraction_digits - number of fraction digits, 0 to omit the fraction.
+    """
+    return format_timestamp(units * 10 ** (3 - fraction_digits), fraction_separator, fraction_digits)
+
+
+def format_timestamp_cached(milliseconds, fraction_separator=".", fraction_digits=3):
+    """
+    Converts milliseconds to a "HH:MM:SS.mmm" timestamp string, like
+    format_timestamp, for display paths that format the same times over and
+    over. The time is cut to the digits shown before looking it up, so that
+    all the times showing the same text share one cached string.
+
+    Parameters:
+        milliseconds - time in milliseconds to convert.
+        fraction_separator - character separating the seconds from their fraction.
+        fraction_digits - number of fraction digits, 0 to omit the fraction.
+    """
+    return _format_timestamp_units(int(milliseconds) // 10 ** (3 - fraction_digits),
+                                   fraction_separator, fraction_digits)
+
+
+def format_timestamps(milliseconds_list, fraction_separator=".", fraction_digits=3):
+    """
+    Converts many times to timestamp strings, such as the times of an
+    exported table. Times repeated across rows are formatted once.
+
+    Parameters:
+        milliseconds_list - iterable of times in milliseconds, or None.
+        fraction_separator - character separating the seconds from their fraction.
+        fraction_digits - number of fraction digits, 0 to omit the fraction.
+
+    Returns:
+        List of timestamp strings, None where the time is None.
+    """
+    return [None if milliseconds is None
+            else format_timestamp_cached(milliseconds, fraction_separator, fraction_digits)
+            for milliseconds in milliseconds_list]
+
+
+def parse_timestamps(texts):
+    """
+    Converts many timestamp strings to milliseconds, such as the time column
+    of an imported table. Timestamps repeated across rows are parsed once.
+
+    Parameters:
+        texts - iterable of timestamp strings, or None.
+
+    Returns:
+        List of times in milliseconds, None where the text is not a timestamp.
+    """
+    return [parse_timestamp(text) if text else None for text in texts]
+
+
+def _nominal_frame_rate(frames_per_second):
+    """
+    Gets the number of frames counted per second of an SMPTE timecode, such
+    as 30 for 29.97 frames per second.
+
+    Parameters:
+        frames_per_second - frame rate of the video.
+    """
+    return max(1, round(frames_per_second))
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_smpte_frame(frame, nominal_rate):
+    """
+    Converts a frame number to an SMPTE timecode string. Results are cached.
+
+    Parameters:
+        frame - number of the frame, counted from 0.
+        nominal_rate - frames counted per second.
+    """
+    seconds, frames = divmod(frame, nominal_rate)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}"
+
+
+def format_smpte(milliseconds, frames_per_second):
+    """
+    Converts milliseconds to an SMPTE "HH:MM:SS:FF" timecode of the frame
+    showing at that time. Frames are counted without dropping any, so at
+    fractional frame rates such as 29.97 the timecode runs slightly behind
+    the clock.
+
+    Parameters:
+        milliseconds - time in milliseconds to convert.
+        frames_per_second - frame rate of the video.
+    """
+    # The small allowance keeps times at a frame's start from rounding into the frame before.
+    frame = int(milliseconds * frames_per_second / 1000 + 1e-6)
+    return _format_smpte_frame(frame, _nominal_frame_rate(frames_per_second))
+
+
+def parse_smpte(text, frames_per_second):
+    """
+    Converts an SMPTE "HH:MM:SS:FF" timecode to the time in milliseconds at
+    which its frame starts, rounded up into the frame.
+
+    Parameters:
+        text - timecode string to convert.
+        frames_per_second - frame rate of the video.
+
+    Returns:
+        Time in milliseconds, or None if the text is not a timecode of that frame rate.
+    """
+    if not text:
+        return None
+    match = _SMPTE_PATTERN.match(text)
+    if match is None:
+        return None
+    hours, minutes, seconds, frames = (int(group) for group in match.groups())
+    nominal_rate = _nominal_frame_rate(frames_per_second)
+    if frames >= nominal_rate:
+        return None
+    frame = ((hours * 60 + minutes) * 60 + seconds) * nominal_rate + frames
+    return math.ceil(frame * 1000 / frames_per_second - 1e-6)
@@ -0,0 +1,122 @@
+from array import array
+
+from PySide6.QtCore import QObject, QUrl, Signal
+from PySide6.QtMultimedia import QAudioDecoder, QAudioFormat
+
+
+class WaveformBuilder(QObject):
+    """
+    WaveformBuilder decodes the audio of a media file into the peak levels
+    drawn as its waveform, one level per interval. The audio is decoded as
+    a single channel at a low sample rate, which is plenty for a waveform
+    and keeps decoding cheap, and only the peak levels are kept rather than
+    the samples.
+    """
+    PEAK_INTERVAL_MS = 20
+    SAMPLE_RATE = 8000
+    # Partial waveforms are shown after this many decoded buffers.
+    BUFFERS_PER_UPDATE = 50
+
+    # Array codes and full scale of the sample formats the decoder may deliver.
+    _SAMPLE_TYPES = {
+        QAudioFormat.UInt8: ("B", 128),
+        QAudioFormat.Int16: ("h", 32768),
+        QAudioFormat.Int32: ("i", 2147483648),
+        QAudioFormat.Float: ("f", 1.0),
+    }
+
+    peaks_changed = Signal(object)  # array of peak levels from 0 to 1, one per PEAK_INTERVAL_MS
+    finished = Signal(QUrl, object)  # source and its complete array of peak levels
+
+    def __init__(self, parent=None):
+        """
+        Constructor - Creates an instance of WaveformBuilder
+
+        Parameters:
+            parent - owner of the builder.
+        """
+        super().__init__(parent)
+        self._source = QUrl()
+        self._peaks = array("f")
+        self._pending = None  # samples decoded since the last whole interval
+        self._buffer_count = 0
+
+        audio_format = QAudioFormat()
+        audio_format.setSampleRate(self.SAMPLE_RATE)
+        audio_format.setChannelCount(1)
+        audio_format.setSampleFormat(QAudioFormat.Int16)
+        self._decoder = QAudioDecoder(self)
+        self._decoder.setAudioFormat(audio_format)
+        self._decoder.bufferReady.connect(self._on_buffer_ready)
+        self._decoder.finished.connect(self._on_finished)
+        self._decoder.error.connect(lambda error: self._on_finished())
+
+    def source(self):
+        """
+        Gets the source of the waveform being built or last built.
+        """
+        return self._source
+
+    def build(self, source):
+        """
+        Starts decoding the waveform of a media file, dropping any waveform
+        still being built.
+
+        Parameters:
+            source - QUrl of the media file.
+        """
+        self.stop()
+        self._source = source
+        self._peaks = array("f")
+        self._pending = None
+        self._buffer_count = 0
+        self.peaks_changed.emit(self._peaks)
+        self._decoder.setSource(source)
+        self._decoder.start()
+
+    def stop(self):
+        """
+        Stops decoding.
+        """
+        if self._decoder.isDecoding():
+            self._decoder.stop()
+
+    def _on_buffer_ready(self):
+        """
+        Adds the peak level of each whole interval of the decoded samples,
+        keeping the rest of them for the next buffer.
+        """
+        buffer = self._decoder.read()
+        buffer_format = buffer.format()
+        sample_type = self._SAMPLE_TYPES.get(buffer_format.sampleFormat())
+        if not buffer.isValid() or sample_type is None:
+            return
+        type_code, full_scale = sample_type
+        samples = array(type_code, bytes(buffer.constData()))
+        if type_code == "B":
+            # Unsigned samples are centred on the middle of their range.
+            samples = array("h", (sample - 128 for sample in samples))
+        if self._pending is not None and self._pending.typecode == samples.typecode:
+            samples = self._pending + samples
+
+        # Samples of every channel of an interval count towards its peak.
+        interval_samples = max(1, buffer_format.sampleRate() * self.PEAK_INTERVAL_MS // 1000
+                               * buffer_format.channelCount())
+        whole_length = len(samples) - len(samples) % interval_samples
+        for start in range(0, whole_length, interval_samples):
+            interval = samples[start:start + interval_samples]
+            self._peaks.append(min(1.0, max(max(interval), -min(interval)) / full_scale))
+        self._pending = samples[whole_length:]
+
+        self._buffer_count += 1
+        if self._buffer_count % self.BUFFERS_PER_UPDATE == 0:
+            self.peaks_changed.emit(self._peaks)
+
+    def _on_finished(self):
+        """
+        Shows the complete waveform once the whole file is decoded, or as much
+        of it as could be decoded.
+        """
+        self._pending = None
+        self.peaks_changed.emit(self._peaks)
+        self.finished.emit(self._source, self._peaks)
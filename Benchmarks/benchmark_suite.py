@@ -0,0 +1,422 @@
+"""
+Headless benchmarks of the persistence, encoding table and media sync hot paths.
+
+Run from the project directory:
+    python -m Benchmarks.benchmark_suite run --output results.json
+    python -m Benchmarks.benchmark_suite compare baseline.json results.json --threshold 0.1
+
+The benchmarks run offscreen, with QSettings kept in a temporary directory so
+that the user's sessions and settings are never touched. Media plays on a
+SimulatedMediaPlayer, whose clock only moves when a benchmark advances it, so
+no decoder is needed and every run sees the same position updates.
+"""
+import argparse
+import functools
+import json
+import os
+import platform
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import PySide6
+from PySide6.QtCore import QUrl, QEventLoop, qVersion
+from PySide6.QtMultimedia import QMediaPlayer
+from PySide6.QtWidgets import QApplication
+
+from Application.session_manager import SessionManager
+from Application.simulated_media_player import SimulatedMediaPlayer
+from Benchmarks.session_generator import SessionGenerator, use_settings_directory, write_session
+from Controllers.state_controller import StateController
+
+# Number of table cells of each named scale.
+SCALES = {"1k": 1000, "10k": 10000, "100k": 100000, "1m": 1000000}
+DEFAULT_SCALES = ("1k", "10k", "100k")
+COLUMN_COUNT = 10
+
+
+class BenchmarkSuite:
+    """
+    BenchmarkSuite times session persistence, encoding table transfers, table
+    export, coding button clicks, playback position updates and scrubbing on
+    synthetic sessions of each scale.
+    Every benchmark is repeated, and the time of each repetition is kept.
+    """
+    SESSION_ID = "benchmark-session"
+    CLICKS_PER_REPETITION = 20
+    PLAYBACK_PER_REPETITION_MS = 10000
+    SCRUB_STEPS_PER_REPETITION = 50
+    MEDIA_DURATION_MS = 3600000
+
+    def __init__(self, scales=DEFAULT_SCALES, repeat=3, seed=0):
+        """
+        Constructor - Creates an instance of BenchmarkSuite
+
+        Parameters:
+            scales - names of the scales to run, keys of SCALES.
+            repeat - number of repetitions of each benchmark.
+            seed - seed of the synthetic sessions.
+        """
+        self._scales = scales
+        self._repeat = repeat
+        self._seed = seed
+        self._temporary_directory = tempfile.mkdtemp(prefix="qualitative-coding-benchmark-")
+        self._app = None
+        self._state_controller = None
+
+    def run(self, only=None):
+        """
+        Runs the benchmarks at every scale.
+
+        Parameters:
+            only - names of the benchmarks to run, None for all of them.
+
+        Returns:
+            List of result dictionaries.
+        """
+        self._start_application()
+        benchmarks = [
+            ("session_write", self.time_session_write),
+            ("session_load", self.time_session_load),
+            ("table_set_data", self.time_table_set_data),
+            ("table_get_data", self.time_table_get_data),
+            ("save_to_file", self.time_save_to_file),
+            ("dynamic_button_click", self.time_dynamic_button_click),
+            ("playback_position", self.time_playback_position),
+            ("scrub", self.time_scrub),
+        ]
+        results = []
+        for scale in self._scales:
+            cells = SCALES[scale]
+            rows = max(1, cells // COLUMN_COUNT)
+            session_entity = self.create_generator(rows).generate_session(self.SESSION_ID)
+            for name, benchmark in benchmarks:
+                if only and name not in only:
+                    continue
+                seconds = benchmark(session_entity)
+                results.append({
+                    "name": name,
+                    "scale": scale,
+                    "cells": rows * COLUMN_COUNT,
+                    "seconds": seconds,
+                    "min": min(seconds),
+                    "median": statistics.median(seconds),
+                })
+                print(f"{name:>22} {scale:>5}  median {results[-1]['median'] * 1000:10.2f} ms", file=sys.stderr)
+        return results
+
+    def create_generator(self, rows):
+        """
+        Creates the generator of the synthetic sessions of a scale.
+
+        Parameters:
+            rows - number of rows of the table.
+        """
+        return SessionGenerator(self._seed, rows, COLUMN_COUNT)
+
+    def time_session_write(self, session_entity):
+        """
+        Times SessionManager.write_to_settings.
+        """
+        session_manager = SessionManager()
+        session_manager.session_entity = session_entity
+        return self._repeat_timed(session_manager.write_to_settings)
+
+    def time_session_load(self, session_entity):
+        """
+        Times SessionManager.load_existing_session of the session last written.
+        """
+        write_session(session_entity)
+        return self._repeat_timed(lambda: SessionManager().load_existing_session(session_entity.session_id))
+
+    def time_table_set_data(self, session_entity):
+        """
+        Times EncodingTable.set_table_data into an empty table.
+        """
+        table_data = session_entity.table_data
+        table = self._state_controller.window.table_panel.table
+
+        def setup():
+            table.set_row_count(0)
+            table.set_col_count(table_data.column_count())
+            table.set_row_count(len(table_data))
+            self._app.processEvents()
+
+        def set_table_data():
+            table.set_table_data(table_data)
+            self._app.processEvents()
+        return self._repeat_timed(set_table_data, setup)
+
+    def time_table_get_data(self, session_entity):
+        """
+        Times EncodingTable.get_table_data of a filled table.
+        """
+        table = self._load_table(session_entity.table_data)
+        return self._repeat_timed(table.get_table_data)
+
+    def time_save_to_file(self, session_entity):
+        """
+        Times WindowController.save_to_file, from the click until the export
+        thread has written the file. The file dialog is answered with a path
+        in the temporary directory.
+        """
+        self._load_table(session_entity.table_data)
+        window_controller = self._state_controller.window_controller
+        path = os.path.join(self._temporary_directory, "export.csv")
+
+        def save_to_file():
+            with mock.patch("Controllers.window_controller.QFileDialog.getSaveFileName",
+                            return_value=(path, "")):
+                window_controller.save_to_file()
+            while window_controller._export_thread is not None:
+                self._app.processEvents(QEventLoop.AllEvents, 10)
+        return self._repeat_timed(save_to_file)
+
+    def time_dynamic_button_click(self, session_entity):
+        """
+        Times WindowController.dynamic_button_click into a filled table with
+        empty rows below its data, per click.
+        """
+        window_controller = self._state_controller.window_controller
+        self._load_media()
+        _, button_definition = session_entity.button_definitions[0]
+        table_data = session_entity.table_data
+        table = self._state_controller.window.table_panel.table
+
+        def setup():
+            self._load_table(table_data)
+            table.set_row_count(len(table_data) + self.CLICKS_PER_REPETITION)
+
+        def click():
+            for _ in range(self.CLICKS_PER_REPETITION):
+                window_controller.dynamic_button_click(button_definition)
+            self._app.processEvents()
+        return [seconds / self.CLICKS_PER_REPETITION for seconds in self._repeat_timed(click, setup)]
+
+    def time_playback_position(self, session_entity):
+        """
+        Times the handling of the position updates of the media player during
+        playback over a filled table, per update: the scrubber, time label,
+        waveform and playback row all follow the position.
+        """
+        media_player = self._load_media()
+        self._load_table(session_entity.table_data)
+        updates = []
+        media_player.positionChanged.connect(updates.append)
+
+        def setup():
+            media_player.setPosition(0)
+            media_player.play()
+            media_player.advance(0)
+            self._app.processEvents()
+            updates.clear()
+
+        def play():
+            media_player.advance(self.PLAYBACK_PER_REPETITION_MS)
+            self._app.processEvents()
+        seconds = self._repeat_timed(play, setup)
+        media_player.pause()
+        media_player.positionChanged.disconnect(updates.append)
+        return [repetition / max(1, len(updates)) for repetition in seconds]
+
+    def time_scrub(self, session_entity):
+        """
+        Times dragging the scrubber over a filled table, per step of the drag,
+        until the media player reports the position of the step.
+        """
+        media_player = self._load_media()
+        self._load_table(session_entity.table_data)
+        scrubber_bar = self._state_controller.window.media_panel.scalable_scrubber_bar.scrubber_bar
+        step_ms = self.MEDIA_DURATION_MS // (self.SCRUB_STEPS_PER_REPETITION + 1)
+
+        def setup():
+            media_player.pause()
+            media_player.setPosition(0)
+            media_player.advance(0)
+            self._app.processEvents()
+
+        def scrub():
+            scrubber_bar.setSliderDown(True)
+            for step in range(1, self.SCRUB_STEPS_PER_REPETITION + 1):
+                scrubber_bar.setSliderPosition(step * step_ms)
+                media_player.advance(0)
+                self._app.processEvents()
+            scrubber_bar.setSliderDown(False)
+            self._app.processEvents()
+        return [seconds / self.SCRUB_STEPS_PER_REPETITION for seconds in self._repeat_timed(scrub, setup)]
+
+    def _repeat_timed(self, function, setup=None):
+        """
+        Times repetitions of a function.
+
+        Parameters:
+            function - function to time.
+            setup - function called untimed before each repetition, or None.
+
+        Returns:
+            List of the seconds taken by each repetition.
+        """
+        seconds = []
+        for _ in range(self._repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            function()
+            seconds.append(time.perf_counter() - start)
+        return seconds
+
+    def _load_table(self, table_data):
+        """
+        Loads a table into the encoding table of the window.
+
+        Parameters:
+            table_data - TableDataEntity to load.
+        """
+        table = self._state_controller.window.table_panel.table
+        table.set_row_count(0)
+        table.set_col_count(table_data.column_count())
+        table.set_row_count(len(table_data))
+        table.set_table_data(table_data)
+        self._app.processEvents()
+        return table
+
+    def _load_media(self):
+        """
+        Loads media into the simulated media player, since codes are only
+        inserted while media is loaded.
+
+        Returns:
+            The SimulatedMediaPlayer of the window.
+        """
+        media_player = self._state_controller.window_controller._media_player
+        if media_player.mediaStatus() == QMediaPlayer.NoMedia:
+            media_player.setSource(QUrl.fromLocalFile(os.path.join(self._temporary_directory, "benchmark.mp4")))
+            media_player.advance(0)
+            self._app.processEvents()
+        return media_player
+
+    def _start_application(self):
+        """
+        Starts the application offscreen, with QSettings kept in the
+        temporary directory.
+        """
+        if self._app is not None:
+            return
+        use_settings_directory(self._temporary_directory, "QualitativeCodingBenchmark", "Benchmark")
+        self._app = QApplication.instance() or QApplication([])
+
+        # The simulated media clock only moves when a benchmark advances it.
+        self._state_controller = StateController(functools.partial(
+            SimulatedMediaPlayer, duration=self.MEDIA_DURATION_MS, real_time=False))
+        self._state_controller.create_new_window(self.SESSION_ID, "Benchmark")
+        # The window's closing would write the session again.
+        self._state_controller.window.closing.disconnect()
+        self._app.processEvents()
+
+
+def get_machine_metadata():
+    """
+    Gets a description of the machine and software the benchmarks ran on.
+    """
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "pyside": PySide6.__version__,
+        "qt": qVersion(),
+        "qpa_platform": os.environ.get("QT_QPA_PLATFORM"),
+    }
+
+
+def compare_results(baseline, current, threshold):
+    """
+    Compares the median times of two benchmark runs.
+
+    Parameters:
+        baseline - results dictionary of the earlier run.
+        current - results dictionary of the later run.
+        threshold - share by which a median may grow before it counts as a regression.
+
+    Returns:
+        List of (name, scale, baseline median, current median, change, is regression),
+        for the benchmarks found in both runs.
+    """
+    baseline_medians = {(result["name"], result["scale"]): result["median"] for result in baseline["results"]}
+    comparisons = []
+    for result in current["results"]:
+        key = (result["name"], result["scale"])
+        if key not in baseline_medians:
+            continue
+        before = baseline_medians[key]
+        change = (result["median"] - before) / before if before > 0 else 0.0
+        comparisons.append((result["name"], result["scale"], before, result["median"], change, change > threshold))
+    return comparisons
+
+
+def main(arguments=None):
+    """
+    Runs the benchmarks or compares two runs, from the command line.
+
+    Parameters:
+        arguments - command line arguments, None for sys.argv.
+
+    Returns:
+        Exit status, 1 if a comparison found a regression.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--scales", default=",".join(DEFAULT_SCALES),
+                            help=f"comma separated scales, of {', '.join(SCALES)}")
+    run_parser.add_argument("--repeat", type=int, default=3, help="repetitions of each benchmark")
+    run_parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic sessions")
+    run_parser.add_argument("--only", help="comma separated names of the benchmarks to run")
+    run_parser.add_argument("--output", help="JSON file to write the results to")
+    compare_parser = commands.add_parser("compare", help="compare two runs, flagging regressions")
+    compare_parser.add_argument("baseline", help="JSON results of the earlier run")
+    compare_parser.add_argument("current", help="JSON results of the later run")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="share by which a median may grow before it is flagged, 0.1 for 10%%")
+    options = parser.parse_args(arguments)
+
+    if options.command == "compare":
+        with open(options.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        with open(options.current, encoding="utf-8") as current_file:
+            current = json.load(current_file)
+        regressions = 0
+        for name, scale, before, after, change, is_regression in compare_results(baseline, current, options.threshold):
+            flag = "REGRESSION" if is_regression else ""
+            print(f"{name:>22} {scale:>5} {before * 1000:10.2f} ms -> {after * 1000:10.2f} ms {change:+8.1%} {flag}")
+            regressions += is_regression
+        return 1 if regressions else 0
+
+    scales = [scale.strip() for scale in options.scales.split(",") if scale.strip()]
+    unknown_scales = [scale for scale in scales if scale not in SCALES]
+    if unknown_scales:
+        parser.error(f"unknown scales: {', '.join(unknown_scales)}")
+    only = set(options.only.split(",")) if options.only else None
+    suite = BenchmarkSuite(scales, options.repeat, options.seed)
+    report = {"metadata": get_machine_metadata(), "results": suite.run(only)}
+    report["metadata"].update({"repeat": options.repeat, "seed": options.seed})
+    output = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
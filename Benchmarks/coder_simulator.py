@@ -0,0 +1,418 @@
+"""
+Simulates a coder pressing encoding button hotkeys while a video plays and is
+scrubbed, measuring how long each press takes to reach the table.
+
+Run from the project directory:
+    python -m Benchmarks.coder_simulator --rates 1,2,5,10 --duration 10 --output latency.json
+
+For each rate, in presses per second, hotkeys are pressed at random moments
+for the given duration, while the video plays and is dragged to random
+positions now and then. Each press is timed from the moment it was due, so
+that a busy event loop delaying the press counts towards its latency, until
+its code is committed to the table. Presses whose code never reaches the
+table are dropped, and codes reaching the table before those of earlier
+presses are misordered.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEventLoop, QTimer, QUrl, Qt
+from PySide6.QtGui import QColor, QFont, QImage, QKeySequence, QPainter
+from PySide6.QtMultimedia import QMediaCaptureSession, QMediaFormat, QMediaPlayer, QMediaRecorder, QVideoFrame, \
+    QVideoFrameInput
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+from Benchmarks.benchmark_suite import get_machine_metadata
+from Benchmarks.session_generator import SessionGenerator, use_settings_directory, write_session
+from Controllers.state_controller import StateController
+from Models.playlist_entry_entity import PlaylistEntryEntity
+
+
+def write_test_pattern_video(path, duration_ms, frame_rate=25, width=320, height=240):
+    """
+    Writes an MP4 video of frames in changing colours, each showing its frame
+    number, through Qt's own media recorder.
+
+    Parameters:
+        path - path of the video file.
+        duration_ms - duration of the video in ms.
+        frame_rate - frames per second.
+        width - width of the frames in pixels.
+        height - height of the frames in pixels.
+    Exception:
+        RuntimeError - the video could not be recorded.
+    """
+    app = QApplication.instance() or QApplication([])
+    frame_count = max(1, duration_ms * frame_rate // 1000)
+    frame_duration_us = 1000000 // frame_rate
+    media_format = QMediaFormat(QMediaFormat.MPEG4)
+    media_format.setVideoCodec(QMediaFormat.VideoCodec.H264)
+
+    capture_session = QMediaCaptureSession()
+    frame_input = QVideoFrameInput()
+    capture_session.setVideoFrameInput(frame_input)
+    recorder = QMediaRecorder()
+    capture_session.setRecorder(recorder)
+    recorder.setMediaFormat(media_format)
+    recorder.setOutputLocation(QUrl.fromLocalFile(path))
+    recorder.setVideoFrameRate(frame_rate)
+    recorder.setVideoResolution(width, height)
+    errors = []
+    recorder.errorOccurred.connect(lambda error, error_string: errors.append(error_string))
+
+    font = QFont()
+    font.setPixelSize(height // 4)
+    frames_sent = 0
+
+    def send_frames():
+        nonlocal frames_sent
+        while frames_sent < frame_count:
+            image = QImage(width, height, QImage.Format_RGB32)
+            image.fill(QColor.fromHsv(frames_sent * 7 % 360, 160, 220))
+            painter = QPainter(image)
+            painter.setFont(font)
+            painter.drawText(image.rect(), Qt.AlignCenter, str(frames_sent))
+            painter.end()
+            frame = QVideoFrame(image)
+            frame.setStartTime(frames_sent * frame_duration_us)
+            frame.setEndTime((frames_sent + 1) * frame_duration_us)
+            # The recorder asks for more frames once it is ready for them.
+            if not frame_input.sendVideoFrame(frame):
+                return
+            frames_sent += 1
+        recorder.stop()
+
+    frame_input.readyToSendVideoFrame.connect(send_frames)
+    recorder.record()
+    send_frames()
+    while not errors and (frames_sent < frame_count or recorder.recorderState() != QMediaRecorder.StoppedState):
+        app.processEvents(QEventLoop.AllEvents, 50)
+    if errors or not os.path.exists(path):
+        raise RuntimeError(f"Unable to record the test pattern video: {'; '.join(errors) or 'no file written'}")
+
+
+class KeyPress:
+    """
+    A hotkey press of the simulated coder, with the perf_counter times it was
+    due, sent and committed to the table.
+    """
+    def __init__(self, due, button_id, hotkey):
+        """
+        Constructor - Creates an instance of KeyPress
+
+        Parameters:
+            due - time the press is due.
+            button_id - code of the button pressed.
+            hotkey - hotkey of the button.
+        """
+        self.due = due
+        self.button_id = button_id
+        self.hotkey = hotkey
+        self.sent = None  # None until the press is sent
+        self.committed = None  # None until its code is committed to the table
+
+
+class CoderSimulator:
+    """
+    CoderSimulator loads a generated session, with a video in its playlist,
+    into a main window shown offscreen, plays the video, and presses the
+    hotkeys of the session's encoding buttons at each rate in turn. Codes
+    are recognised as committed when the table's undo history gains their
+    "Insert code" edit.
+    """
+    SESSION_ID = "coder-simulation"
+    INSERT_CODE_PREFIX = 'Insert code "'
+    # A scrub drags the scrubber in this many steps, this many ms apart.
+    SCRUB_STEPS = 5
+    SCRUB_STEP_MS = 30
+
+    def __init__(self, rates, duration_s=10, scrub_rate=0.5, seed=0, rows=1000, video_path=None, settle_s=2):
+        """
+        Constructor - Creates an instance of CoderSimulator
+
+        Parameters:
+            rates - hotkey presses per second of each run.
+            duration_s - duration of each run in seconds.
+            scrub_rate - scrubs per second, 0 for none.
+            seed - seed of the session, the presses and the scrubs.
+            rows - rows already coded in the session's table.
+            video_path - video to play, None for a generated test pattern.
+            settle_s - seconds waited after a run for codes still on their way.
+        """
+        self._rates = rates
+        self._duration_s = duration_s
+        self._scrub_rate = scrub_rate
+        self._seed = seed
+        self._rows = rows
+        self._video_path = video_path
+        self._settle_s = settle_s
+        self._temporary_directory = tempfile.mkdtemp(prefix="qualitative-coding-simulation-")
+        self._app = None
+        self._state_controller = None
+        self._media_player = None
+        self._presses = []
+
+    def run(self):
+        """
+        Runs the simulation at every rate.
+
+        Returns:
+            List of result dictionaries.
+        """
+        self._start_application()
+        results = []
+        for run_ix, rate in enumerate(self._rates):
+            results.append(self.simulate(rate, random.Random(f"{self._seed}:{run_ix}")))
+            result = results[-1]
+            print(f"{rate:6.1f}/s  {result['presses']:5} presses  latency median {result['latency_median_ms']:8.1f} ms"
+                  f"  p95 {result['latency_p95_ms']:8.1f} ms  dropped {result['dropped']:4}"
+                  f"  misordered {result['misordered']:4}", file=sys.stderr)
+        return results
+
+    def simulate(self, rate, generator):
+        """
+        Presses hotkeys at a rate while the video plays and is scrubbed.
+
+        Parameters:
+            rate - hotkey presses per second.
+            generator - random sequence of the presses and scrubs.
+
+        Returns:
+            Result dictionary.
+        """
+        window = self._state_controller.window
+        buttons = self._state_controller.session_manager.session_entity.button_definitions
+        start = time.perf_counter() + 0.1
+        end = start + self._duration_s
+
+        self._presses = []
+        due = start + generator.expovariate(rate)
+        while due < end:
+            hotkey, button_definition = generator.choice(buttons)
+            self._presses.append(KeyPress(due, button_definition.button_id, hotkey))
+            due += generator.expovariate(rate)
+        scrub_steps = []  # (due time, position, whether the drag ends)
+        due = start + (generator.expovariate(self._scrub_rate) if self._scrub_rate > 0 else self._duration_s)
+        while due < end:
+            origin = self._media_player.position()
+            target = generator.randrange(max(1, self._media_player.duration()))
+            for step in range(1, self.SCRUB_STEPS + 1):
+                scrub_steps.append((due + step * self.SCRUB_STEP_MS / 1000,
+                                    origin + (target - origin) * step // self.SCRUB_STEPS, step == self.SCRUB_STEPS))
+            due += generator.expovariate(self._scrub_rate)
+
+        # Every press gets an empty row to land in.
+        table = window.table_panel.table
+        table.set_row_count(table.rowCount() + len(self._presses))
+        if self._media_player.playbackState() != QMediaPlayer.PlayingState:
+            window.media_panel.media_control_panel.play_pause_button.click()
+
+        loop = QEventLoop()
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.setTimerType(Qt.PreciseTimer)
+        next_press = 0
+        next_scrub = 0
+
+        def act():
+            nonlocal next_press, next_scrub
+            now = time.perf_counter()
+            while next_scrub < len(scrub_steps) and scrub_steps[next_scrub][0] <= now:
+                _, position, drag_ends = scrub_steps[next_scrub]
+                self._scrub(position, drag_ends)
+                next_scrub += 1
+            while next_press < len(self._presses) and self._presses[next_press].due <= now:
+                self._press(self._presses[next_press])
+                next_press += 1
+            upcoming = [self._presses[next_press].due] if next_press < len(self._presses) else []
+            if next_scrub < len(scrub_steps):
+                upcoming.append(scrub_steps[next_scrub][0])
+            if upcoming:
+                timer.start(max(0, int((min(upcoming) - time.perf_counter()) * 1000)))
+            else:
+                QTimer.singleShot(int(self._settle_s * 1000), loop.quit)
+
+        timer.timeout.connect(act)
+        history = table.undo_history
+        history.indexChanged.connect(self._on_history_index_changed)
+        timer.start(max(0, int((start - time.perf_counter()) * 1000)))
+        loop.exec()
+        history.indexChanged.disconnect(self._on_history_index_changed)
+        return self._summarize(rate)
+
+    def _press(self, key_press):
+        """
+        Presses a hotkey on the main window.
+
+        Parameters:
+            key_press - KeyPress to send.
+        """
+        key_combination = QKeySequence(key_press.hotkey)[0]
+        key_press.sent = time.perf_counter()
+        QTest.keyClick(self._state_controller.window, key_combination.key(), key_combination.keyboardModifiers())
+
+    def _scrub(self, position, drag_ends):
+        """
+        Drags the scrubber to a position, as the mouse would.
+
+        Parameters:
+            position - position in ms.
+            drag_ends - whether the scrubber is released there.
+        """
+        scrubber_bar = self._state_controller.window.media_panel.scalable_scrubber_bar.scrubber_bar
+        scrubber_bar.setSliderDown(True)
+        scrubber_bar.setSliderPosition(position)
+        if drag_ends:
+            scrubber_bar.setSliderDown(False)
+
+    def _on_history_index_changed(self, index):
+        """
+        Matches a code committed to the table with the earliest press of its
+        button still waiting for it.
+        """
+        history = self._state_controller.window.table_panel.table.undo_history
+        if index == 0 or index != history.count():
+            return
+        text = history.command(index - 1).text()
+        if not text.startswith(self.INSERT_CODE_PREFIX):
+            return
+        button_id = text[len(self.INSERT_CODE_PREFIX):-1]
+        now = time.perf_counter()
+        for key_press in self._presses:
+            if key_press.sent is not None and key_press.committed is None and key_press.button_id == button_id:
+                key_press.committed = now
+                return
+
+    def _summarize(self, rate):
+        """
+        Summarizes the presses of a run.
+
+        Parameters:
+            rate - hotkey presses per second of the run.
+        """
+        latencies = sorted((key_press.committed - key_press.due) * 1000
+                           for key_press in self._presses if key_press.committed is not None)
+        send_lags = sorted((key_press.sent - key_press.due) * 1000
+                           for key_press in self._presses if key_press.sent is not None)
+        # A press is misordered when its code reached the table before that of an earlier press.
+        misordered = 0
+        latest_commit = 0
+        for key_press in self._presses:
+            if key_press.committed is not None:
+                misordered += key_press.committed < latest_commit
+                latest_commit = max(latest_commit, key_press.committed)
+        return {
+            "rate": rate,
+            "duration_s": self._duration_s,
+            "scrub_rate": self._scrub_rate,
+            "presses": len(self._presses),
+            "committed": len(latencies),
+            "dropped": sum(key_press.committed is None for key_press in self._presses),
+            "misordered": misordered,
+            "latency_median_ms": statistics.median(latencies) if latencies else 0.0,
+            "latency_p95_ms": _percentile(latencies, 0.95),
+            "latency_p99_ms": _percentile(latencies, 0.99),
+            "latency_max_ms": latencies[-1] if latencies else 0.0,
+            "send_lag_median_ms": statistics.median(send_lags) if send_lags else 0.0,
+            "send_lag_max_ms": send_lags[-1] if send_lags else 0.0,
+        }
+
+    def _start_application(self):
+        """
+        Starts the application offscreen, with QSettings kept in the temporary
+        directory, and loads a generated session playing the video.
+        """
+        use_settings_directory(self._temporary_directory, "QualitativeCodingSimulation", "Simulation")
+        self._app = QApplication.instance() or QApplication([])
+        video_path = self._video_path
+        if video_path is None:
+            video_path = os.path.join(self._temporary_directory, "test-pattern.mp4")
+            # Long enough to play through every run.
+            write_test_pattern_video(video_path, int((self._duration_s + self._settle_s + 1) * len(self._rates) * 1000))
+
+        session_entity = SessionGenerator(self._seed, self._rows).generate_session(self.SESSION_ID)
+        session_entity.playlist = [PlaylistEntryEntity(os.path.abspath(video_path))]
+        session_entity.playlist_index = 0
+        write_session(session_entity)
+
+        self._state_controller = StateController()
+        self._state_controller.load_session(self.SESSION_ID)
+        window = self._state_controller.window
+        # The window's closing would write the session again.
+        window.closing.disconnect()
+        window.activateWindow()
+        self._media_player = self._state_controller.window_controller._media_player
+        # Scrubbing may reach the end of the video, which then starts over.
+        self._media_player.mediaStatusChanged.connect(self._on_media_status_changed)
+        deadline = time.monotonic() + 10
+        while self._media_player.mediaStatus() not in (QMediaPlayer.LoadedMedia, QMediaPlayer.InvalidMedia) \
+                and time.monotonic() < deadline:
+            self._app.processEvents(QEventLoop.AllEvents, 50)
+        if self._media_player.mediaStatus() != QMediaPlayer.LoadedMedia:
+            raise RuntimeError(f"Unable to load the video {video_path}")
+
+    def _on_media_status_changed(self, status):
+        """
+        Plays the video again from its start once it ends.
+        """
+        if status == QMediaPlayer.EndOfMedia:
+            self._media_player.setPosition(0)
+            self._media_player.play()
+
+
+def _percentile(sorted_values, share):
+    """
+    Gets the nearest-rank percentile of sorted values, 0 for none.
+
+    Parameters:
+        sorted_values - values in increasing order.
+        share - share of the values at or below the percentile, from 0 to 1.
+    """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, int(share * len(sorted_values) + 0.5) - 1))]
+
+
+def main(arguments=None):
+    """
+    Runs the coder simulation from the command line.
+
+    Parameters:
+        arguments - command line arguments, None for sys.argv.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rates", default="1,2,5,10", help="comma separated hotkey presses per second of each run")
+    parser.add_argument("--duration", type=float, default=10, help="seconds of each run")
+    parser.add_argument("--scrub-rate", type=float, default=0.5, help="scrubs per second, 0 for none")
+    parser.add_argument("--rows", type=int, default=1000, help="rows already coded in the session's table")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the session, the presses and the scrubs")
+    parser.add_argument("--video", help="video to play, instead of a generated test pattern")
+    parser.add_argument("--output", help="JSON file to write the results to")
+    options = parser.parse_args(arguments)
+
+    rates = [float(rate) for rate in options.rates.split(",") if rate.strip()]
+    if not rates or min(rates) <= 0:
+        parser.error("rates must be positive")
+    simulator = CoderSimulator(rates, options.duration, options.scrub_rate, options.seed, options.rows, options.video)
+    report = {"metadata": get_machine_metadata(), "results": simulator.run()}
+    report["metadata"].update({"seed": options.seed, "rows": options.rows, "video": options.video})
+    output = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+"""
+Generates synthetic sessions and codebooks for load testing.
+
+Run from the project directory to write a generated session and codebook
+into the application's settings, where they can be loaded like any other:
+    python -m Benchmarks.session_generator --session-id load-test --rows 100000 --codes 400 --child-codes 20
+
+The same seed always generates the same session and codebook, so that a
+slow session load or button panel can be reproduced without participant data.
+"""
+import argparse
+import random
+import sys
+
+from PySide6.QtCore import QCoreApplication, QSettings
+
+from Application.global_settings_manager import GlobalSettingsManager
+from Application.session_manager import SessionManager
+from Application.timecode import format_timestamp
+from Models.button_definition_entity import ButtonDefinitionEntity
+from Models.global_settings_entity import GlobalSettingsEntity
+from Models.session_entity import SessionEntity
+from Models.table_data_entity import TableDataEntity
+
+# Syllables that generated code names, headers and notes are made of.
+SYLLABLES = ("ka", "lo", "mi", "nu", "pe", "ra", "si", "to", "ve", "zo", "bri", "dan", "fel", "gor", "hin", "tes")
+# Hotkeys given to the generated buttons, in order.
+HOTKEYS = [f"F{number}" for number in range(1, 13)]
+# Encoding buttons a session can hold, as many as fit in the 3x3 grid of the button panel.
+SESSION_BUTTON_LIMIT = 9
+
+
+def use_settings_directory(directory, organization_name, application_name):
+    """
+    Keeps QSettings in INI files within a directory, such as a temporary one,
+    instead of the user's settings.
+
+    Parameters:
+        directory - directory to keep the settings in.
+        organization_name - organization name of the settings.
+        application_name - application name of the settings.
+    """
+    QSettings.setDefaultFormat(QSettings.IniFormat)
+    QSettings.setPath(QSettings.IniFormat, QSettings.UserScope, directory)
+    QCoreApplication.setOrganizationName(organization_name)
+    QCoreApplication.setApplicationName(application_name)
+
+
+class SessionGenerator:
+    """
+    SessionGenerator fabricates a session, as a SessionEntity, and a codebook
+    with user settings, as a GlobalSettingsEntity. Each part is drawn from
+    its own random sequence derived from the seed, so that changing the
+    number of rows leaves the codebook as it was, and the other way round.
+
+    The table has a time column in increasing order, followed by columns of
+    codes and columns of notes. Each row holds the data of one code, as when
+    its button was clicked, and some of the rows have notes.
+    """
+
+    def __init__(self, seed=0, rows=1000, columns=10, header_length=12, code_count=20, child_code_count=0,
+                 button_count=SESSION_BUTTON_LIMIT, note_length=40, note_share=0.3):
+        """
+        Constructor - Creates an instance of SessionGenerator
+
+        Parameters:
+            seed - seed of the generated data.
+            rows - number of rows of the table.
+            columns - number of columns of the table, including the time column.
+            header_length - number of characters of each column header.
+            code_count - number of top-level codes in the codebook, used throughout the table.
+            child_code_count - number of codes nested beneath each top-level code.
+            button_count - number of encoding buttons of the session, at most code_count and
+                SESSION_BUTTON_LIMIT.
+            note_length - number of characters of each note.
+            note_share - share of the rows that have notes, from 0 to 1.
+        """
+        self.seed = seed
+        self.rows = rows
+        self.columns = max(1, columns)
+        self.header_length = header_length
+        self.code_count = max(1, code_count)
+        self.child_code_count = child_code_count
+        self.button_count = min(button_count, self.code_count, SESSION_BUTTON_LIMIT)
+        self.note_length = note_length
+        self.note_share = note_share
+
+    def generate_session(self, session_id):
+        """
+        Generates a session.
+
+        Parameters:
+            session_id - identifier of the session.
+
+        Returns:
+            SessionEntity of the session.
+        """
+        session_entity = SessionEntity()
+        session_entity.session_id = session_id
+        session_entity.table_name = self._words(self._random("table-name"), 24).capitalize()
+        session_entity.table_row_count = self.rows
+        session_entity.table_col_count = self.columns
+        session_entity.table_headers = self.generate_headers()
+        session_entity.table_data = self.generate_table_data()
+        code_definitions = self.generate_code_definitions()
+        session_entity.button_definitions = [
+            (self.get_hotkey(button_ix), code_definitions[button_ix]) for button_ix in range(self.button_count)]
+        return session_entity
+
+    def generate_global_settings(self):
+        """
+        Generates a codebook of every code, with the nested codes beneath
+        them, along with the user settings.
+
+        Returns:
+            GlobalSettingsEntity of the codebook and settings.
+        """
+        global_settings_entity = GlobalSettingsEntity()
+        code_definitions = self.generate_code_definitions()
+        global_settings_entity.button_definitions = code_definitions
+        generator = self._random("child-codes")
+        for parent in code_definitions if self.child_code_count > 0 else []:
+            names = self._unique_names(generator, self.child_code_count, 10)
+            global_settings_entity.child_button_definitions[parent.button_id] = [
+                ButtonDefinitionEntity(f"{parent.button_id} / {name}", [name] + parent.data[1:], parent.button_id)
+                for name in names]
+        global_settings_entity.table_padding = 5
+        global_settings_entity.table_cell_size = [100, 30]
+        global_settings_entity.table_maximum_width = 400
+        return global_settings_entity
+
+    def generate_headers(self):
+        """
+        Generates the column headers: "Time", followed by headers of
+        header_length characters.
+        """
+        generator = self._random("headers")
+        names = self._unique_names(generator, self.columns - 1, self.header_length)
+        return ["Time"] + [name.capitalize() for name in names]
+
+    def generate_code_definitions(self):
+        """
+        Generates the definition of each top-level code. Its data fills the
+        code columns of a row: the code's name, then the names of related
+        codes.
+        """
+        generator = self._random("codes")
+        names = self._unique_names(generator, self.code_count, 8)
+        definitions = []
+        for name in names:
+            related = [generator.choice(names) for _ in range(len(self._code_columns()) - 1)]
+            definitions.append(ButtonDefinitionEntity(name, [name] + related))
+        return definitions
+
+    def generate_table_data(self):
+        """
+        Generates the table data: increasing times, the data of a code per
+        row, and notes in some of the rows.
+
+        Returns:
+            TableDataEntity holding the table data.
+        """
+        generator = self._random("table-data")
+        code_columns = self._code_columns()
+        note_columns = self._note_columns()
+        code_data = [definition.data for definition in self.generate_code_definitions()]
+        table_data = TableDataEntity(self.columns)
+        time_ms = 0
+        for _ in range(self.rows):
+            time_ms += generator.randint(200, 5000)
+            row = [None] * self.columns
+            row[0] = format_timestamp(time_ms)
+            for column, data_item in zip(code_columns, generator.choice(code_data)):
+                row[column] = data_item
+            if note_columns and generator.random() < self.note_share:
+                row[generator.choice(note_columns)] = self._words(generator, self.note_length).capitalize()
+            table_data.append_row(row)
+        return table_data
+
+    @staticmethod
+    def get_hotkey(button_ix):
+        """
+        Gets the hotkey of a generated button.
+
+        Parameters:
+            button_ix - index of the button.
+        """
+        return HOTKEYS[button_ix] if button_ix < len(HOTKEYS) else ""
+
+    def _code_columns(self):
+        """
+        Gets the columns filled with codes: two thirds of the columns after
+        the time column, which the data of a code fills from the left, as
+        when its button is clicked.
+        """
+        return list(range(1, 1 + -(-2 * (self.columns - 1) // 3)))
+
+    def _note_columns(self):
+        """
+        Gets the columns filled with notes: those after the code columns.
+        """
+        return list(range(1 + len(self._code_columns()), self.columns))
+
+    def _random(self, part):
+        """
+        Gets the random sequence of a part of the generated data.
+
+        Parameters:
+            part - name of the part.
+        """
+        return random.Random(f"{self.seed}:{part}")
+
+    @staticmethod
+    def _words(generator, length):
+        """
+        Generates text of made-up words, as long as the given length allows.
+
+        Parameters:
+            generator - random sequence to draw from.
+            length - greatest number of characters of the text.
+        """
+        text = ""
+        while True:
+            word = "".join(generator.choice(SYLLABLES) for _ in range(generator.randint(1, 3)))
+            longer_text = f"{text} {word}" if text else word
+            if len(longer_text) > length:
+                return text or word[:max(1, length)]
+            text = longer_text
+
+    @classmethod
+    def _unique_names(cls, generator, count, length):
+        """
+        Generates distinct names of up to about the given length, numbering
+        any that would repeat an earlier one.
+
+        Parameters:
+            generator - random sequence to draw from.
+            count - number of names.
+            length - number of characters of each name.
+        """
+        names = []
+        taken = set()
+        for _ in range(count):
+            name = cls._words(generator, length)
+            if name in taken:
+                name = f"{name[:max(1, length - len(str(len(names))) - 1)]} {len(names)}"
+            taken.add(name)
+            names.append(name)
+        return names
+
+
+def write_session(session_entity, session_manager=None):
+    """
+    Writes a session to its backend, replacing any session of the same id.
+
+    Parameters:
+        session_entity - SessionEntity to write.
+        session_manager - SessionManager, or any manager with its session_entity
+            and write_to_settings(), None for a SessionManager.
+
+    Returns:
+        The session manager written with.
+    """
+    if session_manager is None:
+        session_manager = SessionManager()
+    session_manager.session_entity = session_entity
+    session_manager.write_to_settings()
+    return session_manager
+
+
+def write_global_settings(global_settings_entity, global_settings_manager=None):
+    """
+    Writes a codebook and user settings to their backend, replacing the
+    previous ones.
+
+    Parameters:
+        global_settings_entity - GlobalSettingsEntity to write.
+        global_settings_manager - GlobalSettingsManager, None for a new one.
+
+    Returns:
+        The global settings manager written with.
+    """
+    if global_settings_manager is None:
+        global_settings_manager = GlobalSettingsManager()
+    global_settings_manager.replace_global_settings(global_settings_entity)
+    return global_settings_manager
+
+
+def main(arguments=None):
+    """
+    Generates a session and codebook and writes them to the settings, from
+    the command line.
+
+    Parameters:
+        arguments - command line arguments, None for sys.argv.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--session-id", default="generated-session", help="identifier of the generated session")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated data")
+    parser.add_argument("--rows", type=int, default=1000, help="rows of the table")
+    parser.add_argument("--columns", type=int, default=10, help="columns of the table, including the time column")
+    parser.add_argument("--header-length", type=int, default=12, help="characters of each column header")
+    parser.add_argument("--codes", type=int, default=20, help="top-level codes of the codebook")
+    parser.add_argument("--child-codes", type=int, default=0, help="codes nested beneath each top-level code")
+    parser.add_argument("--buttons", type=int, default=SESSION_BUTTON_LIMIT,
+                        help=f"encoding buttons of the session, at most {SESSION_BUTTON_LIMIT}")
+    parser.add_argument("--note-length", type=int, default=40, help="characters of each note")
+    parser.add_argument("--note-share", type=float, default=0.3, help="share of the rows that have notes")
+    parser.add_argument("--no-codebook", action="store_true", help="leave the codebook and user settings as they are")
+    parser.add_argument("--settings-dir", help="directory to write INI settings to, instead of the application's")
+    options = parser.parse_args(arguments)
+
+    if options.settings_dir:
+        use_settings_directory(options.settings_dir, "QualitativeCodingGenerated", "Generated")
+    else:
+        # The application's own settings, as named in main.py.
+        QCoreApplication.setOrganizationName("Capstone")
+        QCoreApplication.setApplicationName("Qualitative-Coding-Desktop-Application")
+
+    generator = SessionGenerator(options.seed, options.rows, options.columns, options.header_length, options.codes,
+                                 options.child_codes, options.buttons, options.note_length, options.note_share)
+    write_session(generator.generate_session(options.session_id))
+    if not options.no_codebook:
+        write_global_settings(generator.generate_global_settings())
+    QSettings().sync()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
-from PySide6.QtCore import Slot, QSettings
+from PySide6.QtCore import Slot, QSettings, QTimer
+from PySide6.QtMultimedia import QMediaPlayer
 
 from Controllers.project_management_controller import ProjectManagementController
 from Controllers.user_settings_controller import UserSettingsController
@@ -9,6 +10,7 @@ from View.project_management_window import ProjectManagementWindow
 
 from Application.session_manager import SessionManager
 from Application.global_settings_manager import GlobalSettingsManager
+from Application.media_format_catalog import MediaFormatCatalog
 
 
 class StateController:
@@ -18,10 +20,14 @@ class StateController:
     running, and responding to events dependent on program state.
     """
 
-    def __init__(self):
+    def __init__(self, media_player_factory=QMediaPlayer):
         """
         Constructs an instance of the state controller, initializing
         the state appropriate for an unstarted project.
+
+        Parameters:
+            media_player_factory - function creating the media players of the windows, QMediaPlayer
+                by default, or SimulatedMediaPlayer to play without decoding, as in benchmarks.
         """
         self.program_running = False
         self.window = None
@@ -30,6 +36,8 @@ class StateController:
         self.session_manager = SessionManager()
         self.global_settings_manager = GlobalSettingsManager()
         self.user_settings_controller = UserSettingsController(self.global_settings_manager)
+        self.media_format_catalog = MediaFormatCatalog()
+        self.media_player_factory = media_player_factory
 
     def create_new_window(self, session_name, table_name="Default Title", video=None):
         """
@@ -46,24 +54,35 @@ class StateController:
 
         self.window = MainWindow()
         self.window_controller = WindowController(self.window, self.global_settings_manager,
-                                                  self.user_settings_controller)
+                                                  self.user_settings_controller, self.media_format_catalog,
+                                                  self.media_player_factory)
         self.window.show()
+        # Discovers the playable media formats in the background once the window is up.
+        QTimer.singleShot(0, self.media_format_catalog.start)
 
         settings = QSettings()
         if "global-settings" in settings.childGroups():
             self.global_settings_manager.load_global_settings()
 
-            # After loading the values from QSettings, adjusts the table format according to the global user settings.
-            if self.global_settings_manager.global_settings_entity.table_cell_size[0] != -1:
-                self.window.table_panel.table.set_table_width(self.global_settings_manager.global_settings_entity.table_cell_size[0])
-            if self.global_settings_manager.global_settings_entity.table_cell_size[1] != -1:
-                self.window.table_panel.table.set_table_height(self.global_settings_manager.global_settings_entity.table_cell_size[1])
-            if self.global_settings_manager.global_settings_entity.table_maximum_width != -1:
-                self.window.table_panel.table.set_maximum_width(
-                    self.global_settings_manager.global_settings_entity.table_maximum_width)
-            if self.global_settings_manager.global_settings_entity.table_padding != -1:
-                self.window.table_panel.table.set_padding(
-                    str(self.global_settings_manager.global_settings_entity.table_padding))
+            # After loading the values from QSettings, adjusts the table format according to the global user
+            # settings, laying the table out only once.
+            global_settings_entity = self.global_settings_manager.global_settings_entity
+            self.window.table_panel.table.apply_cell_settings(
+                minimum_width=self._setting_or_none(global_settings_entity.table_cell_size[0]),
+                minimum_height=self._setting_or_none(global_settings_entity.table_cell_size[1]),
+                maximum_width=self._setting_or_none(global_settings_entity.table_maximum_width),
+                padding=self._setting_or_none(global_settings_entity.table_padding))
+            if global_settings_entity.table_row_height_mode != -1:
+                self.window.table_panel.table.set_row_height_mode(global_settings_entity.table_row_height_mode)
+            if global_settings_entity.table_auto_sort:
+                self.window.set_auto_sort_checked(True)
+            if global_settings_entity.table_segment_coding:
+                self.window.set_segment_coding_checked(True)
+            if global_settings_entity.table_follow_playback:
+                self.window.set_follow_playback_checked(True)
+            if self.global_settings_manager.global_settings_entity.undo_memory_budget != -1:
+                self.window.table_panel.table.set_undo_memory_budget(
+                    self.global_settings_manager.global_settings_entity.undo_memory_budget * 1024 * 1024)
 
         self.window.closing.connect(lambda: self.write_session_slot(session_name))
         self.window_controller.establish_table_title(table_name)
@@ -73,6 +92,16 @@ class StateController:
         self.program_running = True
         self.window.show()
 
+    @staticmethod
+    def _setting_or_none(value):
+        """
+        Maps a global setting to None if it was never set.
+
+        Parameters:
+            value - value of the setting, -1 if it was never set.
+        """
+        return None if value == -1 else value
+
     def exec_start(self):
         """
         Starts the application, displaying the session management window.
@@ -104,6 +133,9 @@ class StateController:
         for hotkey, definition in button_data:
             self.window_controller.create_button(hotkey, definition)
 
+        self.window_controller.load_playlist(self.session_manager.session_entity.playlist,
+                                             self.session_manager.session_entity.playlist_index)
+
     @Slot()
     def open_session_creator_page(self):
         """
@@ -151,5 +183,8 @@ class StateController:
         button_definitions = self.window_controller.button_manager.get_button_data()
         self.session_manager.set_button_definitions(button_definitions)
 
+        playlist, playlist_index = self.window_controller.get_playlist()
+        self.session_manager.set_playlist(playlist, playlist_index)
+
         # Call function to write everything to QSettings.
         self.session_manager.write_to_settings()
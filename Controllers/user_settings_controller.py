@@ -1,5 +1,5 @@
 from PySide6.QtCore import Slot
-from PySide6.QtWidgets import QMessageBox
+from PySide6.QtWidgets import QMessageBox, QTreeWidgetItem, QFileDialog
 
 from Models.button_definition_entity import ButtonDefinitionEntity
 from View.edit_coding_assistance_button_dialog import EditCodingAssistanceButtonDialog
@@ -8,6 +8,9 @@ from View.select_edit_button_dialog import SelectEditButtonDialog
 from View.user_settings_dialog import UserSettingsDialog
 from View.button_definition_list_element import ButtonDefinitionListElement
 
+# File dialog filter of the supported codebook formats.
+CODEBOOK_FILE_FILTER = "Codebooks (*.csv *.json *.jsonl *.qdc *.xml)"
+
 
 class UserSettingsController:
     """
@@ -46,19 +49,23 @@ class UserSettingsController:
         new_button_definition = ButtonDefinitionEntity(button_id, data)
         new_button_definition_element = ButtonDefinitionListElement(new_button_definition)
 
+        # Edit button definition in global settings
+        old_button_definition = self.global_settings_manager.find_button_definition(edit_button_id)
+        if old_button_definition is None:
+            return
+        self.global_settings_manager.replace_button_definition(old_button_definition, new_button_definition)
+
         # Edit button definition in dialog list
-        for i in range(button_definition_list.count()):
-            element = button_definition_list.itemAt(i)
-            if element and element.widget():
-                if element.widget().element_id == edit_button_id:
-                    element.widget().deleteLater()
-                    button_definition_list.addWidget(new_button_definition_element)
+        if new_button_definition.parent_id is None:
+            for i in range(button_definition_list.count()):
+                element = button_definition_list.itemAt(i)
+                if element and element.widget():
+                    if element.widget().element_id == edit_button_id:
+                        element.widget().deleteLater()
+                        button_definition_list.addWidget(new_button_definition_element)
 
-        # Edit button definition in global settings
-        for button_definition in self.global_settings_manager.global_settings_entity.button_definitions:
-            if edit_button_id == button_definition.button_id:
-                self.global_settings_manager.remove_button_definition(button_definition)
-                self.global_settings_manager.add_button_definition(new_button_definition)
+        # Edit button definition in the codebook tree
+        self.user_settings.codebook_tree.update_definition_item(edit_button_id, new_button_definition)
 
     @Slot()
     def open_edit_coding_assistance_button_dialog(self):
@@ -98,11 +105,11 @@ class UserSettingsController:
                 if element.widget().element_id == button_id:
                     element.widget().deleteLater()
 
-        # Remove button definition from global settings
-        for button_definition in self.global_settings_manager.global_settings_entity.button_definitions:
-            if button_id == button_definition.button_id:
-                self.global_settings_manager.remove_button_definition(button_definition)
-                self.global_settings_manager.save_encoding_button_definitions()
+        # Remove button definition, and the codes nested beneath it, from global settings
+        button_definition = self.global_settings_manager.find_button_definition(button_id)
+        if button_definition is not None:
+            self.global_settings_manager.remove_button_definition(button_definition)
+        self.user_settings.codebook_tree.remove_definition_item(button_id)
 
     @Slot()
     def open_remove_button_definition_dialog(self):
@@ -142,8 +149,70 @@ class UserSettingsController:
                 element = button_definition_list.takeAt(0)
                 if element and element.widget():
                     element.widget().deleteLater()
+            for button_definition in self.global_settings_manager.global_settings_entity.button_definitions:
+                self.global_settings_manager.remove_child_button_definitions(button_definition.button_id)
             self.global_settings_manager.global_settings_entity.button_definitions.clear()
             self.global_settings_manager.save_encoding_button_definitions()
+            self.user_settings.codebook_tree.clear()
+
+    @Slot()
+    def import_codebook(self):
+        """
+        Opens a file dialog to select a codebook file, and imports all of its
+        button definitions into global settings in one operation.
+        """
+        path, _ = QFileDialog.getOpenFileName(self.user_settings, "Import Codebook", "", CODEBOOK_FILE_FILTER)
+        if path == "":
+            return
+
+        button_definitions = self.global_settings_manager.global_settings_entity.button_definitions
+        top_level_count = len(button_definitions)
+        try:
+            imported_count, skipped_count = self.global_settings_manager.import_codebook(path)
+        except (OSError, ValueError) as error:
+            QMessageBox.warning(self.user_settings, "Import Codebook", str(error))
+            return
+
+        # Show the newly imported top-level definitions in the dialog.
+        new_button_definitions = button_definitions[top_level_count:]
+        self.user_settings.add_button_definition_elements(new_button_definitions)
+        self.user_settings.codebook_tree.add_definitions(
+            new_button_definitions, self.global_settings_manager.has_child_button_definitions)
+
+        msg_box = QMessageBox(self.user_settings)
+        msg_box.setText(f"Imported {imported_count} button definitions.\n"
+                        f"Skipped {skipped_count} duplicate or invalid definitions.")
+        msg_box.exec()
+
+    @Slot()
+    def export_codebook(self):
+        """
+        Opens a file dialog to choose a destination, and exports all saved
+        button definitions as a codebook file.
+        """
+        path, _ = QFileDialog.getSaveFileName(self.user_settings, "Export Codebook", "codebook.csv",
+                                              CODEBOOK_FILE_FILTER)
+        if path == "":
+            return
+
+        try:
+            self.global_settings_manager.export_codebook(path)
+        except (OSError, ValueError) as error:
+            QMessageBox.warning(self.user_settings, "Export Codebook", str(error))
+
+    @Slot(QTreeWidgetItem)
+    def expand_codebook_subtree(self, item):
+        """
+        Loads the nested codes of an expanded codebook tree item.
+
+        Parameters:
+            item - the expanded tree item
+        """
+        codebook_tree = self.user_settings.codebook_tree
+        if codebook_tree.is_populated(item):
+            return
+        children = self.global_settings_manager.get_child_button_definitions(codebook_tree.button_id(item))
+        codebook_tree.populate_item(item, children, self.global_settings_manager.has_child_button_definitions)
 
     def open_settings_dialog(self, window_controller=None):
         """
@@ -156,15 +225,29 @@ class UserSettingsController:
         self.user_settings = UserSettingsDialog(self.global_settings_manager.global_settings_entity.button_definitions)
         self._window_controller = window_controller
 
+        self.user_settings.codebook_tree.add_definitions(
+            self.global_settings_manager.global_settings_entity.button_definitions,
+            self.global_settings_manager.has_child_button_definitions)
+        self.user_settings.codebook_tree.connect_expand_to_slot(self.expand_codebook_subtree)
+
         self.user_settings.connect_remove_button_to_slot(self.open_remove_button_definition_dialog)
+        self.user_settings.connect_import_codebook_to_slot(self.import_codebook)
+        self.user_settings.connect_export_codebook_to_slot(self.export_codebook)
         if window_controller:
             self.user_settings.connect_edit_button_to_slot(self.open_select_edit_button_dialog)
             self.user_settings.connect_cell_size_to_slot(window_controller.set_cell_size)
             self.user_settings.connect_maximum_size_to_slot(window_controller.set_maximum_width)
             self.user_settings.connect_padding_to_slot(window_controller.set_padding)
+            self.user_settings.connect_undo_memory_to_slot(window_controller.set_undo_memory_budget)
+            self.user_settings.connect_row_height_to_slot(window_controller.set_row_height_mode)
+            self.user_settings.connect_seek_preroll_to_slot(window_controller.set_seek_preroll)
         else:
             self.user_settings.edit_button.setEnabled(False)
 
+        if self.global_settings_manager.global_settings_entity.table_row_height_mode != -1:
+            self.user_settings.row_height_combo_box.setCurrentIndex(
+                self.global_settings_manager.global_settings_entity.table_row_height_mode)
+
         self.user_settings.exec()
 
         # Gets the table cell attributes from the text boxes in user settings.
@@ -187,4 +270,14 @@ class UserSettingsController:
             padding = int(padding)
             self.global_settings_manager.set_table_padding(padding)
 
+        undo_memory_budget = self.user_settings.undo_memory_text_box.text()
+        if undo_memory_budget.isdigit():
+            self.global_settings_manager.set_undo_memory_budget(int(undo_memory_budget))
+
+        self.global_settings_manager.set_table_row_height_mode(self.user_settings.row_height_combo_box.currentIndex())
+
+        seek_preroll = self.user_settings.seek_preroll_text_box.text()
+        if seek_preroll.isdigit():
+            self.global_settings_manager.set_seek_preroll(int(seek_preroll))
+
         self.global_settings_manager.save_user_settings()
@@ -1,15 +1,26 @@
-import io
-import csv
 import math
-import sys
 
-from PySide6.QtCore import Slot, QMimeDatabase, QByteArray
+from PySide6.QtCore import Slot, QThread, Qt, QTimer, QUrl
 from PySide6.QtGui import QFontMetrics, QKeySequence
-from PySide6.QtMultimedia import QMediaFormat, QMediaPlayer
-from PySide6.QtWidgets import QFileDialog, QDialog, QStyle, QInputDialog, QLineEdit, QPushButton, QTableWidgetItem, \
-    QMessageBox, QWidget
+from PySide6.QtMultimedia import QMediaPlayer, QVideoFrame
+from PySide6.QtWidgets import QFileDialog, QDialog, QStyle, QInputDialog, QLineEdit, QPushButton, \
+    QMessageBox, QWidget, QProgressDialog
 
 from Application.button_manager import ButtonManager
+from Application.Exporters.exporter_registry import create_exporter, get_export_formats
+from Application.Exporters.export_worker import ExportWorker
+from Application.Importers.import_worker import ImportWorker
+from Application.Importers.importer_registry import create_importer, get_import_file_filter
+from Application.media_playlist import MediaPlaylist
+from Application.multi_angle_sync import MultiAngleSync
+from Application.playback_loop import PlaybackLoop
+from Application.playback_shuttle import PlaybackShuttle
+from Application.seek_cache import SeekCache
+from Application.table_search_index import SearchQuery, TableSearchIndex
+from Application.table_time_index import TableTimeIndex
+from Application.timecode import TIME_RANGE_SEPARATOR, format_timestamp, format_timestamp_cached, parse_time_range
+from Application.waveform_builder import WaveformBuilder
+from View.encoding_table_filter_model import EncodingTableFilterModel
 from View.button_definition_list_element import ButtonDefinitionListElement
 from View.edit_coding_assistance_button_dialog import EditCodingAssistanceButtonDialog
 from View.load_coding_assistance_button_dialog import LoadCodingAssistanceButtonDialog
@@ -24,30 +35,18 @@ from Models.button_definition_entity import ButtonDefinitionEntity
 from Controllers.project_management_controller import ProjectManagementController
 
 
-def get_supported_mime_types():
-    """
-    get_supported_mime_types() - This returns a list of supported
-    mime types for the specific OS. It is used to set a filter on files so
-    only media files can be played.
-
-    Return:
-        result - A list of all supported media file types
-    """
-    result = []
-    for f in QMediaFormat().supportedFileFormats(QMediaFormat.Decode):
-        mime_type = QMediaFormat(f).mimeType()
-        result.append(mime_type.name())
-    return result
-
-
 class WindowController:
     """
     The WindowController responds to input events from the Window. The Controller
     handles the main logic of the application.
     """
     DEFAULT_FRAMES_PER_SECOND = 30
+    DEFAULT_SEEK_PREROLL_MS = 2000
+    # Frames further than this from a seek target were decoded before the seek took effect.
+    SEEK_FRAME_TOLERANCE_MS = 500
 
-    def __init__(self, window, global_settings_manager, user_settings_controller):
+    def __init__(self, window, global_settings_manager, user_settings_controller, media_format_catalog,
+                 media_player_factory=QMediaPlayer):
         """
         Constructor - Initializes the Controller instance.
 
@@ -55,19 +54,80 @@ class WindowController:
             window (MainWindow): the main Window of the application
             global_settings_manager - reference to the global settings manager.
             user_settings_controller - reference to the user settings controller
+            media_format_catalog - reference to the catalog of playable media formats.
+            media_player_factory - function creating a media player with an optional parent,
+                QMediaPlayer or a stand-in such as SimulatedMediaPlayer.
         """
         self._window = window
+        self._media_format_catalog = media_format_catalog
 
         self.global_settings_manager = global_settings_manager
         self.user_settings_controller = user_settings_controller
         self.button_manager = ButtonManager()
 
-        self._media_player = QMediaPlayer()
+        self._media_player_factory = media_player_factory
+        self._media_player = media_player_factory()
         self._media_player.setVideoOutput(
             self._window.media_panel.video_widget)
         self._media_player.setAudioOutput(
             self._window.media_panel.audio_widget)
 
+        # Seeks to double-clicked rows, showing the frames of recent seek targets straight away.
+        self._seek_cache = SeekCache()
+        self._pending_seek_target = None  # seek target whose first frame is still to be kept
+        self._media_player.sourceChanged.connect(lambda source: self._seek_cache.clear())
+        self._window.media_panel.video_widget.connect_frame_to_slot(self.keep_seek_frame)
+        self._window.table_panel.connect_row_double_click_to_slot(self.seek_to_row)
+
+        # Reviews the video with an A-B loop, frame steps and J/K/L shuttle controls.
+        self._playback_loop = PlaybackLoop(self._media_player)
+        self._playback_shuttle = PlaybackShuttle(self._media_player)
+        self._window.media_panel.video_widget.connect_frame_to_slot(self._playback_shuttle.observe_frame)
+        self._playback_loop.loop_changed.connect(self.show_playback_loop)
+        self._playback_shuttle.speed_changed.connect(self.on_shuttle_speed_changed)
+        media_control_panel = self._window.media_panel.media_control_panel
+        media_control_panel.loop_button.clicked.connect(self._playback_loop.mark)
+        media_control_panel.frame_back_button.clicked.connect(lambda: self._playback_shuttle.step_frames(-1))
+        media_control_panel.frame_forward_button.clicked.connect(lambda: self._playback_shuttle.step_frames(1))
+        self._window.connect_playback_to_slot("play_backward", self._playback_shuttle.backward)
+        self._window.connect_playback_to_slot("pause", self._playback_shuttle.stop)
+        self._window.connect_playback_to_slot("play_forward", self._playback_shuttle.forward)
+        self._window.connect_playback_to_slot("previous_frame", lambda: self._playback_shuttle.step_frames(-1))
+        self._window.connect_playback_to_slot("next_frame", lambda: self._playback_shuttle.step_frames(1))
+        self._window.connect_playback_to_slot("mark_loop", self._playback_loop.mark)
+
+        # Plays further camera angles in step with the main video, whose clock times the codes.
+        self._angle_sync = MultiAngleSync(self._media_player, self._window.media_panel.audio_widget)
+        self._angle_views = {}  # angle id : AngleView
+        self._window.connect_add_angle_to_slot(self.open_angle_file_dialog)
+
+        # Plays audio-only recordings, or the audio of a video the user chose to
+        #   code by ear, without decoding video, showing their waveform instead.
+        self._audio_only = False
+        self._audio_only_detected = False  # whether audio only was chosen for media without video
+        self._waveform_builder = WaveformBuilder()
+        self._waveform_peaks = None  # peaks of the waveform builder's source, None until built
+        self._waveform_builder.peaks_changed.connect(self.show_waveform_peaks)
+        self._waveform_builder.finished.connect(self.keep_waveform)
+        self._window.connect_audio_only_to_slot(self.set_audio_only)
+        self._media_player.mediaStatusChanged.connect(self.on_media_status_changed)
+        self._media_player.sourceChanged.connect(lambda source: self.update_waveform())
+        self._media_player.positionChanged.connect(self._window.media_panel.waveform_view.set_position)
+        self._media_player.durationChanged.connect(self._window.media_panel.waveform_view.set_duration)
+        self._window.media_panel.waveform_view.connect_seek_to_slot(self.update_video_on_progres_bar_movement)
+
+        # Plays the media files of the session in order, resuming each where it was left.
+        self._playlist = MediaPlaylist(self._media_player, media_player_factory)
+        self._playlist.entries_changed.connect(self.show_playlist)
+        self._playlist.current_changed.connect(lambda index: self.show_playlist())
+        self._window.media_panel.media_control_panel.connect_playlist_to_slot(self.open_playlist_media)
+        self._window.connect_add_media_to_slot(self.open_add_media_dialog)
+        self._window.connect_remove_media_to_slot(self.remove_playlist_media)
+        self._window.connect_playback_to_slot("previous_media", self._playlist.previous)
+        self._window.connect_playback_to_slot("next_media", self._playlist.next)
+        self._window.media_panel.set_drop_filter(self._media_format_catalog.is_supported_file)
+        self._window.media_panel.connect_media_dropped_to_slot(self.open_dropped_media)
+
         self._window.connect_load_video_to_slot(self.open_file_dialog)
         self._window.connect_settings_to_slot(self.open_settings_dialog)
 
@@ -86,6 +146,8 @@ class WindowController:
 
         self._window.media_panel.scalable_scrubber_bar.scrubber_bar.sliderMoved.connect(
             self.update_video_on_progres_bar_movement)
+        # The bars label their times with the shared timecode formatting.
+        self._window.media_panel.scalable_scrubber_bar.set_timestamp_formatter(format_timestamp_cached)
 
         self._media_player.positionChanged.connect(self.update_progress_bar_on_video_position_changed)
         self._media_player.durationChanged.connect(self.on_video_duration_changed)
@@ -100,10 +162,83 @@ class WindowController:
 
         self._window.table_panel.add_col_button.clicked.connect(self.add_col_to_encoding_table)
         self._window.table_panel.add_row_button.clicked.connect(self.add_row_to_encoding_table)
-        self._window.table_panel.delete_col_button.clicked.connect(self.del_current_column)
-        self._window.table_panel.delete_row_button.clicked.connect(self.del_current_row)
-
+        self._window.table_panel.delete_col_button.clicked.connect(self.delete_selected_columns)
+        self._window.table_panel.delete_row_button.clicked.connect(self.delete_selected_rows)
+        self._window.connect_table_edit_to_slot("insert_rows", self.insert_rows_above_selection)
+        self._window.connect_table_edit_to_slot("duplicate_rows", self.duplicate_selected_rows)
+        self._window.connect_table_edit_to_slot("delete_rows", self.delete_selected_rows)
+        self._window.connect_table_edit_to_slot("move_rows_up", lambda: self.move_selected_rows(-1))
+        self._window.connect_table_edit_to_slot("move_rows_down", lambda: self.move_selected_rows(1))
+        self._window.connect_table_edit_to_slot("insert_columns", self.insert_columns_left_of_selection)
+        self._window.connect_table_edit_to_slot("delete_columns", self.delete_selected_columns)
+
+        self._search_index = TableSearchIndex(self._window.table_panel.table.model())
+        self._filter_model = EncodingTableFilterModel(self._search_index, self._window.table_panel.table.model())
+        self._window.table_panel.set_filter_model(self._filter_model)
+        # Searches run once typing pauses.
+        self._search_timer = QTimer()
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.apply_table_search)
+        self._window.table_panel.connect_search_to_slot(lambda text: self._search_timer.start())
+        # The search results catch up once per batch of table edits.
+        self._window.table_panel.table.batch_started.connect(self._filter_model.begin_batch)
+        self._window.table_panel.table.batch_finished.connect(self._filter_model.end_batch)
+        self._window.table_panel.table.batch_finished.connect(self.update_search_result_count)
+
+        # Finds where coded events belong while the rows are kept in time order.
+        self._time_index = TableTimeIndex(self._window.table_panel.table.model())
+        self._keep_rows_in_time_order = False
+        self._window.connect_auto_sort_to_slot(self.set_keep_rows_in_time_order)
+        # Codes start and end segments, which are highlighted while they play and drawn on the scrubber.
+        self._code_segments = False
+        self._window.connect_segment_coding_to_slot(self.set_code_segments)
+        # Marks the row at the video's position, looked up at most once per
+        #   interval however often the position changes.
+        self._follow_playback = False
+        self._window.connect_follow_playback_to_slot(self.set_follow_playback)
+        self._playback_row_timer = QTimer()
+        self._playback_row_timer.setSingleShot(True)
+        self._playback_row_timer.setInterval(100)
+        self._playback_row_timer.timeout.connect(self.update_playback_row)
+        self._media_player.positionChanged.connect(self.schedule_playback_row_update)
+        # The views of times catch up once table edits pause.
+        self._time_view_timer = QTimer()
+        self._time_view_timer.setSingleShot(True)
+        self._time_view_timer.setInterval(100)
+        self._time_view_timer.timeout.connect(self.update_segment_views)
+        self._time_view_timer.timeout.connect(lambda: self.update_playback_row(scroll=False))
+        table_model = self._window.table_panel.table.model()
+        table_model.dataChanged.connect(lambda *args: self._time_view_timer.start())
+        table_model.rowsInserted.connect(lambda *args: self._time_view_timer.start())
+        table_model.rowsRemoved.connect(lambda *args: self._time_view_timer.start())
+        table_model.rowsMoved.connect(lambda *args: self._time_view_timer.start())
+        table_model.modelReset.connect(self._time_view_timer.start)
+        self._media_player.positionChanged.connect(self.update_segment_highlight)
+        self._window.media_panel.scalable_scrubber_bar.connect_visible_range_to_slot(
+            lambda visible_range: self.update_scrubber_segments())
+
+        table = self._window.table_panel.table
+        self._window.connect_undo_to_slot(table.undo)
+        self._window.connect_redo_to_slot(table.redo)
+        table.undo_state_changed.connect(self._window.set_undo_redo_enabled)
+        self._window.set_undo_redo_enabled(False, False)
+
+        # Holds the running table import, if any.
+        self._import_thread = None
+        self._import_worker = None
+        self._import_progress_dialog = None
+        self._import_undo_state = None
+        self._window.connect_import_file_to_slot(self.import_from_file)
+
+        # Holds the running table export, if any.
+        self._export_thread = None
+        self._export_worker = None
+        self._export_progress_dialog = None
         self._window.connect_export_file_to_slot(self.save_to_file)
+        for format_id, format_name in get_export_formats():
+            self._window.add_export_format_action(
+                format_name, lambda checked=False, format_id=format_id: self.export_table(format_id))
 
         self._window.coding_assistance_panel.button_panel.connect_add_button_to_slot(self.open_add_coding_assistance_button_dialog)
         self._window.coding_assistance_panel.button_panel.connect_delete_button_to_slot(self.open_delete_coding_assistance_button_dialog)
@@ -124,14 +259,44 @@ class WindowController:
         self._window.table_panel.table.add_row()
 
     @Slot()
-    def del_current_column(self):
-        """ Command the table widget to delete current selected column"""
-        self._window.table_panel.table.del_column()
+    def delete_selected_columns(self):
+        """ Command the table widget to delete the selected columns. """
+        table_panel = self._window.table_panel
+        table_panel.table.remove_columns(table_panel.selected_columns())
+
+    @Slot()
+    def delete_selected_rows(self):
+        """ Command the table widget to delete the selected rows. """
+        table_panel = self._window.table_panel
+        table_panel.table.remove_rows(table_panel.selected_rows())
+
+    @Slot()
+    def insert_rows_above_selection(self):
+        """ Command the table widget to insert empty rows above the selected rows. """
+        table_panel = self._window.table_panel
+        table_panel.table.insert_rows(table_panel.selected_rows())
+
+    @Slot()
+    def duplicate_selected_rows(self):
+        """ Command the table widget to duplicate the selected rows. """
+        table_panel = self._window.table_panel
+        table_panel.table.duplicate_rows(table_panel.selected_rows())
+
+    def move_selected_rows(self, offset):
+        """
+        Command the table widget to move the selected rows by one row.
+
+        Parameters:
+            offset - -1 to move the rows up, 1 to move them down.
+        """
+        table_panel = self._window.table_panel
+        table_panel.table.move_rows(table_panel.selected_rows(), offset)
 
     @Slot()
-    def del_current_row(self):
-        """ Command the table widget to delete current selected row"""
-        self._window.table_panel.table.del_row()
+    def insert_columns_left_of_selection(self):
+        """ Command the table widget to insert empty columns left of the selected columns. """
+        table_panel = self._window.table_panel
+        table_panel.table.insert_columns(table_panel.selected_columns())
 
     @Slot()
     def change_font_of_encoding_table(self):
@@ -181,47 +346,14 @@ class WindowController:
     def get_video_time_total(self):
         """
         get_video_time_total() - Slot function that will act as a handler whenever a video
-        is loaded in order to get the time in hr, mins, sec, frames.
+        is loaded in order to get the time in hours, minutes and seconds.
         """
-        # Get the total time of the video in milliseconds.
-        total_in_ms = self._media_player.duration()
         self.current_time = self._media_player.position()
 
-        # This convert to seconds, minutes, hours, and frames
-        # and rounds down to the nearest value.
-        sec_rounded_down = 0
-        minutes_rounded_down = 0
-        hours_rounded_down = 0
-        total_time_str = ""
-
-        if total_in_ms > 1000:
-            sec = total_in_ms / 1000
-            sec_rounded_down = int(sec)
-        if sec_rounded_down > 60:
-            minutes = sec_rounded_down / 60
-            minutes_rounded_down = int(minutes)
-            sec_rounded_down -= (minutes_rounded_down * 60)
-        if minutes_rounded_down > 60:
-            hours = minutes_rounded_down / 60
-            hours_rounded_down = int(hours)
-            minutes_rounded_down -= (hours_rounded_down * 60)
-        ms = total_in_ms % 1000
-
-        # This formats the time in the hr:min:sec:frame format.
-        total_time_str = f"{hours_rounded_down:02d}:{minutes_rounded_down:02d}:{sec_rounded_down:02d}"
-
-        # This gets the current time in seconds.
-        current_seconds = (self.current_time / 1000) % 60
-        current_seconds = int(current_seconds)
-        current_minutes = (self.current_time / (1000 * 60)) % 60
-        current_minutes = int(current_minutes)
-        current_hours = (self.current_time / (1000 * 60 * 60)) % 24
-        current_hours = int(current_hours)
-
         # Formats the time displaying current time/ total time
         # and then sets the text label in the media control panel.
-        time_str_formatted = f"{current_hours:02d}:{current_minutes:02d}:{current_seconds:02d}" \
-                             f"/{total_time_str}"
+        time_str_formatted = f"{format_timestamp_cached(self.current_time, fraction_digits=0)}" \
+                             f"/{format_timestamp_cached(self._media_player.duration(), fraction_digits=0)}"
         self._window.media_panel.media_control_panel.time_stamp.setText(time_str_formatted)
 
     @Slot()
@@ -230,52 +362,268 @@ class WindowController:
         load_video_handler() - Slot function that will act as a handler whenever the
         load video button is clicked.
         """
-        # Variables for AVI and MP4 video files.
-        avi_video_file = "video/x-msvideo"
-        mp4_video_file = "video/mp4"
+        file_dialog = self.create_video_file_dialog()
+
+        # This checks if a file to play has been selected.
+        if file_dialog.exec() == QDialog.Accepted:
+            url = file_dialog.selectedUrls()[0]
+            self._playlist.open(self._playlist.add(url))
+            self.toggle_play_pause_icon()
+
+    @Slot()
+    def open_add_media_dialog(self):
+        """
+        Lets the user pick media files to add at the end of the playlist.
+        """
+        file_dialog = self.create_video_file_dialog()
+        file_dialog.setFileMode(QFileDialog.ExistingFiles)
+        if file_dialog.exec() == QDialog.Accepted:
+            for url in file_dialog.selectedUrls():
+                self._playlist.add(url)
+            if self._playlist.current_index() < 0:
+                self._playlist.open(0, play=False)
+
+    @Slot(list)
+    def open_dropped_media(self, urls):
+        """
+        Adds media files dropped onto the media panel to the playlist, and
+        plays the first of them.
+
+        Parameters:
+            urls - list of QUrl of the media files.
+        """
+        indexes = [self._playlist.add(url) for url in urls]
+        if indexes:
+            self._playlist.open(indexes[0])
+            self.toggle_play_pause_icon()
+
+    @Slot(int)
+    def open_playlist_media(self, index):
+        """
+        Opens a media file picked from the playlist, carrying on playing if
+        the current one is.
+
+        Parameters:
+            index - index of the media file.
+        """
+        if index != self._playlist.current_index():
+            self._playlist.open(index, play=self._media_player.playbackState() == QMediaPlayer.PlayingState)
+
+    @Slot()
+    def remove_playlist_media(self):
+        """
+        Removes the media file playing from the playlist.
+        """
+        if self._playlist.current_index() >= 0:
+            self._playlist.remove(self._playlist.current_index())
+            self.toggle_play_pause_icon()
+
+    def show_playlist(self):
+        """
+        Shows the media files of the playlist with their durations, once
+        probed, and whether they could not be loaded.
+        """
+        titles = []
+        for entry in self._playlist.entries():
+            title = QUrl.fromUserInput(entry.path).fileName()
+            if not entry.playable:
+                title += " (cannot be played)"
+            elif entry.duration:
+                title += f" ({format_timestamp(entry.duration, fraction_digits=0)})"
+            titles.append(title)
+        self._window.media_panel.media_control_panel.set_playlist(titles, self._playlist.current_index())
+
+    def get_playlist(self):
+        """
+        Gets the media files of the playlist, to be saved with the session.
+
+        Returns:
+            (list of PlaylistEntryEntity, index of the media file playing or -1)
+        """
+        return self._playlist.entries(), self._playlist.current_index()
+
+    def load_playlist(self, entries, current_index):
+        """
+        Restores the playlist of a session, opening the media file last played
+        at the position it was left.
 
+        Parameters:
+            entries - list of PlaylistEntryEntity, in order.
+            current_index - index of the media file last played, -1 for none.
+        """
+        self._playlist.set_entries(entries, current_index)
+
+    @Slot()
+    def open_angle_file_dialog(self):
+        """
+        Lets the user pick the video of a further camera angle, which is then
+        played alongside the main video.
+        """
+        file_dialog = self.create_video_file_dialog()
+        if file_dialog.exec() == QDialog.Accepted:
+            self.add_angle(file_dialog.selectedUrls()[0])
+
+    def create_video_file_dialog(self):
+        """
+        Creates a file dialog filtered to the media formats the system can play.
+        """
         # Opens the file browser, doesn't need any arguments as the window calls this.
         file_dialog = QFileDialog()
 
         # Opens file browser with qt specific file browser instead of os specific.
         file_dialog.setOption(QFileDialog.DontUseNativeDialog)
 
-        # This gets the mime_types for the specific system and sets a filter.
-        is_windows = sys.platform == 'win32'
-        mime_types = get_supported_mime_types()
-
-        # Adds AVI and MP4 if they were not supported.
-        if is_windows and avi_video_file not in mime_types:
-            mime_types.append(avi_video_file)
-        elif mp4_video_file not in mime_types:
-            mime_types.append(mp4_video_file)
-
-        # Store all the supported mime type glob patterns into a single list.
-        mime_db = QMimeDatabase()
-        glob_pattern_lists = []
-        for mime_type in mime_types:
-            mime_name = mime_db.mimeTypeForName(mime_type)
-            glob_pattern_lists.append(mime_name.globPatterns())
-
-        # Set the QFileDialog mime type filters.
-        file_dialog.setMimeTypeFilters(mime_types)
-
-        # Add an "all supported types" filter and make it the default.
-        glob_patterns_list = [
-            item for sublist in glob_pattern_lists for item in sublist]
-        glob_patterns_str = " ".join(glob_patterns_list)
-        all_supported_types = f"All supported formats {glob_patterns_str}"
-        name_filters = file_dialog.nameFilters()
-        name_filters.insert(0, all_supported_types)
-        file_dialog.setNameFilters(name_filters)
-        file_dialog.selectNameFilter(all_supported_types)
+        # The formats were discovered once, in the background, the first filter matching all of them.
+        file_dialog.setNameFilters(self._media_format_catalog.name_filters())
+        return file_dialog
 
-        # This checks if a file to play has been selected.
-        if file_dialog.exec() == QDialog.Accepted:
-            url = file_dialog.selectedUrls()[0]
-            self._media_player.setSource(url)
-            self._media_player.play()
-            self.toggle_play_pause_icon()
+    def add_angle(self, url):
+        """
+        Plays the video of a further camera angle below the main video, in
+        step with it.
+
+        Parameters:
+            url - QUrl of the video.
+        """
+        angle_view = self._window.media_panel.add_angle_view(url.fileName())
+        # The player belongs to its view, and is deleted along with it.
+        player = self._media_player_factory(angle_view)
+        player.setVideoOutput(angle_view.video_widget)
+        player.setSource(url)
+        angle_id = self._angle_sync.add_angle(player)
+        self._angle_views[angle_id] = angle_view
+        angle_view.connect_offset_to_slot(lambda offset: self._angle_sync.set_offset(angle_id, offset))
+        angle_view.connect_show_video_to_slot(lambda shown: self.show_angle_video(angle_id, shown))
+        angle_view.connect_audio_to_slot(lambda enabled: self.set_angle_audio(angle_id, enabled))
+        angle_view.connect_remove_to_slot(lambda: self.remove_angle(angle_id))
+
+    def show_angle_video(self, angle_id, shown):
+        """
+        Shows or hides the video of a camera angle. Hidden angles are paused
+        rather than decoded.
+
+        Parameters:
+            angle_id - id of the angle.
+            shown - whether the video is shown.
+        """
+        self._angle_views[angle_id].set_video_shown(shown)
+        self._angle_sync.set_active(angle_id, shown)
+
+    def set_angle_audio(self, angle_id, enabled):
+        """
+        Plays the audio of a camera angle instead of the other videos' audio,
+        or returns to the main video's audio.
+
+        Parameters:
+            angle_id - id of the angle.
+            enabled - whether the angle's audio plays.
+        """
+        if enabled:
+            self._angle_sync.set_audio_focus(angle_id)
+            for other_angle_id, angle_view in self._angle_views.items():
+                if other_angle_id != angle_id:
+                    angle_view.set_audio_checked(False)
+        elif self._angle_sync.audio_focus() == angle_id:
+            self._angle_sync.set_audio_focus(None)
+
+    def remove_angle(self, angle_id):
+        """
+        Stops playing a camera angle and removes its view.
+
+        Parameters:
+            angle_id - id of the angle.
+        """
+        self._angle_sync.remove_angle(angle_id)
+        self._window.media_panel.remove_angle_view(self._angle_views.pop(angle_id))
+
+    @Slot(bool)
+    def set_audio_only(self, enabled):
+        """
+        Plays only the audio of the media, showing its waveform in place of
+        the video, or plays its video again.
+
+        Parameters:
+            enabled - whether only the audio is played.
+        """
+        self._audio_only = enabled
+        self._audio_only_detected = False
+        self.apply_audio_only()
+        self.update_waveform()
+
+    def apply_audio_only(self):
+        """
+        Detaches the video output and turns the video track off while only
+        the audio is played, so that no video is decoded, and restores both
+        otherwise.
+        """
+        media_panel = self._window.media_panel
+        if self._audio_only:
+            self._media_player.setVideoOutput(None)
+            if self._media_player.videoTracks():
+                self._media_player.setActiveVideoTrack(-1)
+        else:
+            if self._media_player.videoTracks():
+                self._media_player.setActiveVideoTrack(0)
+            self._media_player.setVideoOutput(media_panel.video_widget)
+        media_panel.show_waveform(self._audio_only)
+
+    @Slot(QMediaPlayer.MediaStatus)
+    def on_media_status_changed(self, status):
+        """
+        Plays only the audio of media without video once it is loaded, and the
+        video of the next media that has one. Audio only chosen by the user
+        applies to every media until it is turned off.
+
+        Parameters:
+            status - media status of the player.
+        """
+        if status != QMediaPlayer.LoadedMedia:
+            return
+        has_video = bool(self._media_player.videoTracks())
+        if not has_video and not self._audio_only:
+            self._window.set_audio_only_checked(True)
+            self._audio_only_detected = True
+        elif has_video and self._audio_only_detected:
+            self._window.set_audio_only_checked(False)
+        elif self._audio_only:
+            # The tracks of the new media are on until turned off again.
+            self.apply_audio_only()
+
+    def update_waveform(self):
+        """
+        Shows the waveform of the media while only its audio is played,
+        building it unless it was built for the same media before.
+        """
+        source = self._media_player.source()
+        if not self._audio_only or source.isEmpty():
+            return
+        if source != self._waveform_builder.source():
+            self._waveform_peaks = None
+            self._waveform_builder.build(source)
+        elif self._waveform_peaks is not None:
+            self.show_waveform_peaks(self._waveform_peaks)
+
+    @Slot(object)
+    def show_waveform_peaks(self, peaks):
+        """
+        Shows the peaks of the waveform built so far.
+
+        Parameters:
+            peaks - array of peak levels, one per WaveformBuilder.PEAK_INTERVAL_MS.
+        """
+        self._window.media_panel.waveform_view.set_peaks(peaks, WaveformBuilder.PEAK_INTERVAL_MS)
+
+    def keep_waveform(self, source, peaks):
+        """
+        Keeps the peaks of a built waveform, so that they are not decoded
+        again when audio only is turned off and on for the same media.
+
+        Parameters:
+            source - QUrl of the media.
+            peaks - array of peak levels.
+        """
+        if source == self._media_player.source():
+            self._waveform_peaks = peaks
 
     @Slot()
     def open_settings_dialog(self):
@@ -284,39 +632,354 @@ class WindowController:
         """
         self.user_settings_controller.open_settings_dialog(self)
 
+    @Slot()
+    def set_undo_memory_budget(self):
+        """
+        Takes input from the settings dialog and sets the memory budget of the table's undo history.
+        """
+        budget_text = self.user_settings_controller.get_dialog().undo_memory_text_box.text()
+        if budget_text.isdigit():
+            self._window.table_panel.table.set_undo_memory_budget(int(budget_text) * 1024 * 1024)
+
+    @Slot()
+    def set_row_height_mode(self):
+        """
+        Takes input from the settings dialog and sets how the heights of the table's rows are determined.
+        """
+        row_height_mode = self.user_settings_controller.get_dialog().row_height_combo_box.currentIndex()
+        self._window.table_panel.table.set_row_height_mode(row_height_mode)
+
+    @Slot()
+    def set_seek_preroll(self):
+        """
+        Takes input from the settings dialog and sets the time played before a row's time when seeking to it.
+        """
+        preroll_text = self.user_settings_controller.get_dialog().seek_preroll_text_box.text()
+        if preroll_text.isdigit():
+            self.global_settings_manager.set_seek_preroll(int(preroll_text))
+
+    @Slot(int)
+    def seek_to_row(self, row):
+        """
+        Seeks the video to the time of a table row, less the seek preroll so
+        that the lead-up to the coded event is seen.
+
+        Parameters:
+            row - row index of the table.
+        """
+        time_ms = parse_time_range(self._window.table_panel.table.read_cell(row, 0))[0]
+        if time_ms is None or not self._media_player.source().url():
+            return
+        preroll = self.global_settings_manager.global_settings_entity.seek_preroll
+        if preroll == -1:
+            preroll = self.DEFAULT_SEEK_PREROLL_MS
+        self.seek_to(max(0, time_ms - preroll))
+
+    def seek_to(self, target_ms):
+        """
+        Seeks the video to a time. If the time was visited recently, its frame
+        is shown straight away instead of after the player has decoded it.
+
+        Parameters:
+            target_ms - time to seek to in ms.
+        """
+        image = self._seek_cache.visit(target_ms)
+        if image is not None:
+            self._window.media_panel.video_widget.show_image(image)
+            self._pending_seek_target = None
+        else:
+            self._pending_seek_target = target_ms
+        self._media_player.setPosition(target_ms)
+        self._playback_loop.reschedule()
+
+    @Slot(QVideoFrame)
+    def keep_seek_frame(self, frame):
+        """
+        Keeps the first frame shown at a seek target that was not visited
+        recently. Triggered for every frame the video widget shows.
+
+        Parameters:
+            frame - frame shown by the video widget.
+        """
+        target_ms = self._pending_seek_target
+        if target_ms is None or not frame.isValid():
+            return
+        if abs(frame.startTime() // 1000 - target_ms) > self.SEEK_FRAME_TOLERANCE_MS:
+            return
+        self._pending_seek_target = None
+        self._seek_cache.put(target_ms, frame.toImage())
+
+    @Slot(bool)
+    def set_keep_rows_in_time_order(self, enabled):
+        """
+        Turns inserting coded events at their time position on or off, and
+        saves the choice. Rows that are out of time order are moved into place
+        when it is turned on.
+
+        Parameters:
+            enabled - whether the rows are kept in time order.
+        """
+        self._keep_rows_in_time_order = enabled
+        self.global_settings_manager.set_table_auto_sort(enabled)
+        self.global_settings_manager.save_user_settings()
+        if enabled:
+            self.restore_time_order()
+
+    @Slot(bool)
+    def set_code_segments(self, enabled):
+        """
+        Turns coding segments on or off, and saves the choice. While it is on,
+        a code's button starts a segment at the playhead, and pressing it again
+        ends the segment.
+
+        Parameters:
+            enabled - whether codes start and end segments.
+        """
+        self._code_segments = enabled
+        self.global_settings_manager.set_table_segment_coding(enabled)
+        self.global_settings_manager.save_user_settings()
+
+    @Slot(bool)
+    def set_follow_playback(self, enabled):
+        """
+        Turns marking and scrolling to the table row at the video's position
+        on or off, and saves the choice.
+
+        Parameters:
+            enabled - whether the table follows the video.
+        """
+        self._follow_playback = enabled
+        self.global_settings_manager.set_table_follow_playback(enabled)
+        self.global_settings_manager.save_user_settings()
+        self.update_playback_row()
+
+    @Slot(int)
+    def schedule_playback_row_update(self, position):
+        """
+        Looks up the row at the video's position once the current interval
+        ends, rather than on every change of the position.
+
+        Parameters:
+            position - current position of the video
+        """
+        if self._follow_playback and not self._playback_row_timer.isActive():
+            self._playback_row_timer.start()
+
+    @Slot()
+    def update_playback_row(self, scroll=True):
+        """
+        Marks the table row whose time is closest to the video's position.
+
+        Parameters:
+            scroll - whether the table is scrolled to the row if it changed.
+        """
+        row = None
+        if self._follow_playback:
+            row = self._time_index.nearest_row(self._media_player.position())
+        self._window.table_panel.set_playback_row(row, scroll)
+
+    @Slot()
+    def update_segment_views(self):
+        """
+        Shows the segments of the table again after it was edited.
+        """
+        self.update_segment_highlight(self._media_player.position())
+        self.update_scrubber_segments()
+
+    @Slot(int)
+    def update_segment_highlight(self, position):
+        """
+        Highlights the rows of the segments active at the playhead.
+
+        Parameters:
+            position - current position of the video in ms.
+        """
+        self._window.table_panel.set_highlighted_rows(self._time_index.segments_at(position))
+
+    def update_scrubber_segments(self):
+        """
+        Draws the segments within the visible range of the scrubber bar on it.
+        Segments whose end has not been coded yet are drawn up to the playhead.
+        """
+        scalable_scrubber_bar = self._window.media_panel.scalable_scrubber_bar
+        position = self._media_player.position()
+        segments = self._time_index.segments_overlapping(*scalable_scrubber_bar.visible_range())
+        scalable_scrubber_bar.set_segments([(start_ms, max(start_ms, position) if end_ms is None else end_ms)
+                                            for start_ms, end_ms, _ in segments])
+
+    @Slot()
+    def apply_table_search(self):
+        """
+        Filters the encoding table with the text of the search bar, showing the
+        full table again when the search is cleared.
+        """
+        table_panel = self._window.table_panel
+        query = SearchQuery.parse(table_panel.search_bar.text())
+        self._filter_model.set_query(query)
+        if query is None:
+            table_panel.show_all_rows()
+        else:
+            self.update_search_result_count()
+
+    @Slot()
+    def update_search_result_count(self):
+        """
+        Shows the number of rows matching the current search, if any.
+        """
+        if self._filter_model.sourceModel() is not None:
+            self._window.table_panel.show_search_results(self._filter_model.match_count(),
+                                                         self._search_index.row_count())
+
+    @Slot()
+    def import_from_file(self):
+        """
+        import_from_file() - Slot function that will act as a handler whenever the
+        Import table data button is clicked. The file is read on a worker thread
+        and its rows are appended below the table's data.
+        """
+        if self._import_thread is not None:
+            return
+
+        path, _ = QFileDialog.getOpenFileName(self._window, "Import table data", "", get_import_file_filter())
+        if path == "":
+            return
+
+        try:
+            importer = create_importer(path)
+        except ValueError as error:
+            QMessageBox.warning(self._window, "Import table data", str(error))
+            return
+        self.start_import(importer, path)
+
+    def start_import(self, importer, path):
+        """
+        Imports a file on a worker thread, showing a progress dialog from which
+        the import can be canceled. Rows imported before a cancellation are kept.
+
+        Parameters:
+            importer - importer reading the source format.
+            path - path of the file to import.
+        """
+        table = self._window.table_panel.table
+        first_row = table.get_first_unused_row()
+        row_count = table.rowCount()
+        headers = table.get_headers()
+        self._import_thread = QThread()
+        self._import_worker = ImportWorker(importer, path, headers, first_row)
+        self._import_worker.moveToThread(self._import_thread)
+
+        progress_dialog = QProgressDialog("Importing table data...", "Cancel", 0, 100, self._window)
+        # The table must not be edited while rows are appended, so the dialog blocks
+        # the window from the moment the import starts.
+        progress_dialog.setWindowModality(Qt.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+        progress_dialog.setValue(0)
+        # The worker thread is busy importing, so cancellation is requested directly.
+        progress_dialog.canceled.connect(self._import_worker.cancel, Qt.DirectConnection)
+
+        # Rows are only measured once, after the last chunk has been inserted.
+        table.suspend_row_resizing()
+        self._import_thread.started.connect(self._import_worker.run)
+        # Worker signals are delivered to widgets, which live on the GUI thread.
+        self._import_worker.columns_mapped.connect(table.set_column_headers)
+        self._import_worker.rows_read.connect(table.set_rows)
+        self._import_worker.progress.connect(progress_dialog.setValue)
+        for signal in (self._import_worker.finished, self._import_worker.failed, self._import_worker.canceled):
+            signal.connect(progress_dialog.close)
+            signal.connect(self._import_thread.quit)
+        self._import_thread.finished.connect(self._on_import_thread_finished)
+        self._import_undo_state = (first_row, row_count, headers)
+
+        self._import_progress_dialog = progress_dialog
+        self._import_thread.start()
+
+    @Slot()
+    def _on_import_thread_finished(self):
+        """
+        Releases the import thread, worker and progress dialog once an import has ended.
+        """
+        table = self._window.table_panel.table
+        table.resume_row_resizing()
+        # The whole import is undone as one edit, including rows kept after a cancellation.
+        first_row, row_count, headers = self._import_undo_state
+        table.record_appended_rows(first_row, row_count, headers, "Import table data")
+        if self._import_worker.error_message is not None:
+            QMessageBox.warning(self._window, "Import table data", self._import_worker.error_message)
+        self._import_progress_dialog.deleteLater()
+        self._import_worker = self._import_thread = self._import_progress_dialog = None
+
     @Slot()
     def save_to_file(self):
         """
         save_to_file() - Slot function that will act as a handler whenever the
-        Save table data button is clicked.
-        """
-        # Opens the file browser on the main window.
-        file_dialog = QFileDialog(self._window)
-
-        output = io.StringIO()
-        csv_writer = csv.writer(output, delimiter=",", quoting=csv.QUOTE_NONNUMERIC)
-
-        # Traverse over the table data and format data in CSV style.
-        num_rows = self._window.table_panel.table.rowCount()
-        num_columns = self._window.table_panel.table.columnCount()
-        for y in range(num_rows):
-            table_row = []
-            for x in range(num_columns):
-                item = self._window.table_panel.table.item(y, x)
-                if item is not None:
-                    single_entity_of_table = item.text()
-                    table_row.append(single_entity_of_table)
-                else:
-                    table_row.append("")
-            csv_writer.writerow(table_row)
-
-        # Convert to a byte array and open file browser to save.
-        table_data_as_byte_array = QByteArray(output.getvalue())
+        Save table data button is clicked. Saves the table as CSV.
+        """
+        self.export_table("csv")
+
+    def export_table(self, format_id):
+        """
+        Asks for a destination file and exports the table in the given format.
+        The table is snapshotted on the GUI thread and streamed to disk on a
+        worker thread.
+
+        Parameters:
+            format_id - identifier of a registered export format.
+        """
+        if self._export_thread is not None:
+            return
+
+        exporter = create_exporter(format_id)
         title_name = self._window.table_panel.title.text()
-        if title_name == "":
-            file_dialog.saveFileContent(table_data_as_byte_array, "your_table_data.csv")
-        else:
-            file_dialog.saveFileContent(table_data_as_byte_array, title_name + ".csv")
+        default_name = title_name if title_name != "" else "your_table_data"
+        path, _ = QFileDialog.getSaveFileName(
+            self._window, "Save table data", f"{default_name}.{exporter.file_extension}", exporter.file_filter)
+        if path == "":
+            return
+
+        table = self._window.table_panel.table
+        self.start_export(exporter, path, table.get_headers(), table.get_table_data())
+
+    def start_export(self, exporter, path, headers, rows):
+        """
+        Exports a snapshot of the table on a worker thread, showing a progress
+        dialog from which the export can be canceled.
+
+        Parameters:
+            exporter - exporter writing the destination format.
+            path - path of the file to export to.
+            headers - list of table headers.
+            rows - snapshot of the table rows to export.
+        """
+        self._export_thread = QThread()
+        self._export_worker = ExportWorker(exporter, path, headers, rows)
+        self._export_worker.moveToThread(self._export_thread)
+
+        progress_dialog = QProgressDialog("Exporting table data...", "Cancel", 0, len(rows), self._window)
+        progress_dialog.setWindowModality(Qt.NonModal)
+        progress_dialog.setMinimumDuration(500)
+        progress_dialog.setValue(0)
+        # The worker thread is busy exporting, so cancellation is requested directly.
+        progress_dialog.canceled.connect(self._export_worker.cancel, Qt.DirectConnection)
+
+        self._export_thread.started.connect(self._export_worker.run)
+        self._export_worker.progress.connect(progress_dialog.setValue)
+        for signal in (self._export_worker.finished, self._export_worker.failed, self._export_worker.canceled):
+            signal.connect(progress_dialog.close)
+            signal.connect(self._export_thread.quit)
+        self._export_thread.finished.connect(self._on_export_thread_finished)
+
+        self._export_progress_dialog = progress_dialog
+        self._export_thread.start()
+
+    @Slot()
+    def _on_export_thread_finished(self):
+        """
+        Releases the export thread, worker and progress dialog once an export has ended.
+        """
+        if self._export_worker.error_message is not None:
+            QMessageBox.warning(self._window, "Save table data", self._export_worker.error_message)
+        self._export_progress_dialog.deleteLater()
+        self._export_worker = self._export_thread = self._export_progress_dialog = None
 
     @Slot()
     def play_video(self):
@@ -390,7 +1053,8 @@ class WindowController:
         Takes input from the settings dialog and calls the set_padding function in encoding_table.py
         """
         padding = self.user_settings_controller.get_dialog().padding_text_box.text()
-        self._window.table_panel.table.set_padding(padding)
+        if padding.isdigit():
+            self._window.table_panel.table.set_padding(int(padding))
 
     @Slot()
     def set_playback_speed(self):
@@ -414,6 +1078,34 @@ class WindowController:
         # Only set the position of the media player if a video has been loaded.
         if self._media_player.source().url():
             self._media_player.setPosition(new_position)
+            self._playback_loop.reschedule()
+
+    @Slot(object, object)
+    def show_playback_loop(self, start_ms, end_ms):
+        """
+        Shows the points of the A-B loop in the media controls.
+
+        Parameters:
+            start_ms - point A in ms, None if it is not marked.
+            end_ms - point B in ms, None if it is not marked.
+        """
+        self._window.media_panel.media_control_panel.set_loop_points(
+            format_timestamp(start_ms) if start_ms is not None else None,
+            format_timestamp(end_ms) if end_ms is not None else None)
+
+    @Slot(float)
+    def on_shuttle_speed_changed(self, speed):
+        """
+        Shows the shuttle speed in the media controls. The speed chosen in the
+        playback speed combo box applies again once the shuttle stops.
+
+        Parameters:
+            speed - shuttle speed, negative backwards and 0 when stopped.
+        """
+        self._window.media_panel.media_control_panel.set_shuttle_speed(speed)
+        if speed == 0:
+            self.set_playback_speed()
+        self.toggle_play_pause_icon()
 
     @Slot()
     def toggle_play_pause_icon(self):
@@ -486,12 +1178,32 @@ class WindowController:
         """
         button_name = self.add_coding_assistance_button_dialog.apply_text_field.text()
         button_hotkey = self.add_coding_assistance_button_dialog.hotkey_field.text()
+        parent_code = self.add_coding_assistance_button_dialog.parent_code_field.text()
         button_exists = False
 
         data = []
         for text in self.add_coding_assistance_button_dialog.dynamic_line_edits:
             data.append(text.text())
 
+        # Nested codes live in the global codebook and are reached through their parent's page.
+        if parent_code != "":
+            if not save_button:
+                self.add_coding_assistance_button_dialog.error_label.setText(
+                    "Nested codes are only kept in the saved codebook!")
+            elif not self.global_settings_manager.has_button_id(parent_code):
+                self.add_coding_assistance_button_dialog.error_label.setText("This parent code does not exist!")
+            elif self.global_settings_manager.has_button_id(button_name):
+                self.add_coding_assistance_button_dialog.error_label.setText("This button name is already being used!")
+            else:
+                self.global_settings_manager.add_button_definition(
+                    ButtonDefinitionEntity(button_name, data, parent_code))
+                self.add_coding_assistance_button_dialog.error_label.setText("")
+            return
+
+        if self._window.is_playback_shortcut(button_hotkey):
+            self.add_coding_assistance_button_dialog.error_label.setText("This hotkey is used by the playback controls!")
+            return
+
         saved_button_definitions = self.global_settings_manager.global_settings_entity.button_definitions
         hotkeys = self.button_manager.get_hotkeys()
         new_button = QPushButton(button_name)
@@ -509,7 +1221,7 @@ class WindowController:
             self.add_coding_assistance_button_dialog.error_label.setText("")
             self._window.coding_assistance_panel.button_panel.create_coding_assistance_button(new_button)
             new_button.clicked.connect(ProjectManagementController.make_lambda(
-                self.dynamic_button_click, new_button_definition))
+                self.coding_button_click, new_button_definition))
 
             self.button_manager.add_button_definition(button_name, new_button_definition)
             self.button_manager.add_button_hotkey(button_name, button_hotkey)
@@ -527,7 +1239,7 @@ class WindowController:
                 self.add_coding_assistance_button_dialog.error_label.setText("")
                 self._window.coding_assistance_panel.button_panel.create_coding_assistance_button(new_button)
                 new_button.clicked.connect(ProjectManagementController.make_lambda(
-                    self.dynamic_button_click, new_button_definition))
+                    self.coding_button_click, new_button_definition))
 
                 self.button_manager.add_button_definition(button_name, new_button_definition)
                 self.button_manager.add_button_hotkey(button_name, button_hotkey)
@@ -546,7 +1258,7 @@ class WindowController:
         button.setShortcut(QKeySequence(hotkey))
         self._window.coding_assistance_panel.button_panel.create_coding_assistance_button(button)
         button.clicked.connect(ProjectManagementController.make_lambda(
-            self.dynamic_button_click, button_definition))
+            self.coding_button_click, button_definition))
         self.button_manager.add_button_definition(button_name, button_definition)
         self.button_manager.add_button_hotkey(button_name, hotkey)
 
@@ -561,6 +1273,9 @@ class WindowController:
         hotkeys = self.button_manager.get_hotkeys()
 
         hotkey = self.load_coding_assistance_button_dialog.hotkey_textfield.text()
+        if self._window.is_playback_shortcut(hotkey):
+            self.load_coding_assistance_button_dialog.error_label.setText("This hotkey is used by the playback controls!")
+            return
         for i, radio_button in enumerate(radio_buttons):
             if radio_button.isChecked():
                 button_definition = self.global_settings_manager.global_settings_entity.button_definitions[i]
@@ -571,7 +1286,7 @@ class WindowController:
         if not hotkeys:
             self._window.coding_assistance_panel.button_panel.create_coding_assistance_button(new_button)
             new_button.clicked.connect(
-                ProjectManagementController.make_lambda(self.dynamic_button_click, button_definition))
+                ProjectManagementController.make_lambda(self.coding_button_click, button_definition))
 
             self.button_manager.add_button_definition(button_id, button_definition)
             self.button_manager.add_button_hotkey(button_id, hotkey)
@@ -581,7 +1296,7 @@ class WindowController:
             else:
                 self._window.coding_assistance_panel.button_panel.create_coding_assistance_button(new_button)
                 new_button.clicked.connect(
-                    ProjectManagementController.make_lambda(self.dynamic_button_click, button_definition))
+                    ProjectManagementController.make_lambda(self.coding_button_click, button_definition))
 
                 self.button_manager.add_button_definition(button_id, button_definition)
                 self.button_manager.add_button_hotkey(button_id, hotkey)
@@ -596,6 +1311,36 @@ class WindowController:
         self.button_manager.remove_button_definition(button_id)
         self.button_manager.remove_button_hotkey(button_id)
 
+    @Slot(ButtonDefinitionEntity)
+    def coding_button_click(self, button_definition):
+        """
+        Handles a click of an encoding button. Codes with nested codes open a
+        drill-down page of their subcodes, all other codes add their data to
+        the table.
+
+        Parameters:
+            button_definition - An instance of ButtonDefinition
+        """
+        if self.global_settings_manager.has_child_button_definitions(button_definition.button_id):
+            self.open_codebook_page(button_definition)
+        else:
+            self.dynamic_button_click(button_definition)
+
+    def open_codebook_page(self, button_definition):
+        """
+        Opens a drill-down page in the button panel holding a button for each
+        code nested beneath the given code. The subtree is loaded on demand.
+
+        Parameters:
+            button_definition - definition of the parent code
+        """
+        buttons = []
+        for child in self.global_settings_manager.get_child_button_definitions(button_definition.button_id):
+            button = QPushButton(child.button_id)
+            button.clicked.connect(ProjectManagementController.make_lambda(self.coding_button_click, child))
+            buttons.append(button)
+        self._window.coding_assistance_panel.button_panel.push_page(button_definition.button_id, buttons)
+
     @Slot(ButtonDefinitionEntity)
     def dynamic_button_click(self, button_definition):
         """
@@ -604,23 +1349,81 @@ class WindowController:
         Parameters:
             button_definition - An instance of ButtonDefinition
         """
-        if not self._media_player.hasVideo():
+        if not (self._media_player.hasVideo() or self._media_player.hasAudio()):
             return
 
-        video_timestamp = self._window.media_panel.media_control_panel.time_stamp.text()
-        split = video_timestamp.split("/")
-        video_timestamp = split[0]
-        timestamp_text = QTableWidgetItem(video_timestamp)
-        for row in range(self._window.table_panel.table.rowCount()):
-            column = 0
-            cell = self._window.table_panel.table.item(row, column)
-            if not cell:
-                self._window.table_panel.table.setItem(row, column, timestamp_text)
-                column = 1
-                data = 0
-                while column <= self._window.table_panel.table.columnCount():
-                    insert_text = QTableWidgetItem(button_definition.data[data])
-                    self._window.table_panel.table.setItem(row, column, insert_text)
-                    column += 1
-                    data += 1
+        # The time label only shows whole seconds, so the time is taken from the player.
+        time_ms = self._media_player.position()
+        video_timestamp = format_timestamp(time_ms)
+        table = self._window.table_panel.table
+        time_text = video_timestamp
+        if self._code_segments:
+            if self.end_open_segment(video_timestamp, button_definition):
                 return
+            # The segment stays open until its code is pressed again.
+            time_text = video_timestamp + TIME_RANGE_SEPARATOR.rstrip()
+        if self._keep_rows_in_time_order:
+            self.insert_code_in_time_order(time_text, time_ms, button_definition)
+            return
+        for row in range(table.rowCount()):
+            if table.read_cell(row, 0) is None:
+                # The time and data of the code are inserted as one undoable edit.
+                cells = [(row, 0, time_text)]
+                for column, data_item in zip(range(1, table.columnCount()), button_definition.data):
+                    cells.append((row, column, data_item))
+                table.set_cells(cells, f'Insert code "{button_definition.button_id}"')
+                return
+
+    def end_open_segment(self, video_timestamp, button_definition):
+        """
+        Ends the latest open segment of a code at the given time.
+
+        Parameters:
+            video_timestamp - end time of the segment as shown by the media controls.
+            button_definition - An instance of ButtonDefinition
+
+        Returns:
+            Whether an open segment of the code was found.
+        """
+        table = self._window.table_panel.table
+        data_columns = list(zip(range(1, table.columnCount()), button_definition.data))
+        for row in reversed(self._time_index.open_segment_rows()):
+            if all(table.read_cell(row, column) == (data_item or None) for column, data_item in data_columns):
+                start_text = table.read_cell(row, 0).rpartition("-")[0].strip()
+                table.set_cells([(row, 0, start_text + TIME_RANGE_SEPARATOR + video_timestamp)],
+                                f'End segment "{button_definition.button_id}"')
+                return True
+        return False
+
+    def restore_time_order(self):
+        """
+        Moves the rows that are out of time order back into place, as one
+        undoable edit.
+        """
+        moves, order = self._time_index.plan_reorder()
+        self._window.table_panel.table.reorder_rows(moves, "Sort rows by time", order)
+
+    def insert_code_in_time_order(self, video_timestamp, time_ms, button_definition):
+        """
+        Adds button data to the table at the row of its time, found by binary
+        search over the rows' times. Rows edited out of time order since the
+        last code are first moved back into place.
+
+        Parameters:
+            video_timestamp - time of the code as shown in the table.
+            time_ms - time of the code in ms.
+            button_definition - An instance of ButtonDefinition
+        """
+        table = self._window.table_panel.table
+        self.restore_time_order()
+
+        row, is_empty = self._time_index.find_slot(time_ms)
+        cells = [(0, video_timestamp)]
+        for column, data_item in zip(range(1, table.columnCount()), button_definition.data):
+            cells.append((column, data_item))
+        description = f'Insert code "{button_definition.button_id}"'
+        if is_empty:
+            table.set_cells([(row, column, text) for column, text in cells], description)
+        else:
+            # Only the inserted row is announced to the views of the table.
+            table.insert_row(row, cells, description)
@@ -4,15 +4,18 @@ from datetime import datetime
 class ButtonDefinitionEntity:
     """
     An object defining the attributes for a button within the coding assistance
-    panel.
+    panel. Button definitions may be nested into a codebook hierarchy, where a
+    parent code (a theme) contains any number of child codes (subcodes).
     """
-    def __init__(self, button_id, data):
+    def __init__(self, button_id, data, parent_id=None):
         """
         Constructor - Creates an instance of ButtonDefinitionEntity
 
         Parameters:
             button_id - identifier of button
             data - button definition of button
+            parent_id - identifier of the parent code, None for a top-level code
         """
         self.button_id = button_id
         self.data = data
+        self.parent_id = parent_id
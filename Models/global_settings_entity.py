@@ -7,6 +7,13 @@ class GlobalSettingsEntity:
         Constructor - Creates an instance of GlobalSettingsEntity
         """
         self.button_definitions = []
+        self.child_button_definitions = {}  # parent id : list of child button definitions
         self.table_padding = -1
         self.table_cell_size = [-1, -1]
         self.table_maximum_width = -1
+        self.undo_memory_budget = -1  # in MB
+        self.table_row_height_mode = -1
+        self.seek_preroll = -1  # in ms
+        self.table_auto_sort = False
+        self.table_segment_coding = False
+        self.table_follow_playback = False
@@ -0,0 +1,18 @@
+class PlaylistEntryEntity:
+    """
+    A media file in the playlist of a session, with the position it was
+    last played to.
+    """
+    def __init__(self, path, position=0):
+        """
+        Constructor - Creates an instance of PlaylistEntryEntity
+
+        Parameters:
+            path - path of the media file.
+            position - position in ms that playback resumes from, defaults to 0.
+        """
+        self.path = path
+        self.position = position
+        # Found out once the file is probed, and not saved with the session.
+        self.duration = None  # duration in ms, None until probed
+        self.playable = True  # whether the file could be loaded
@@ -1,6 +1,8 @@
 from PySide6.QtCore import Slot, QSettings
 from PySide6.QtGui import QCloseEvent
 
+from Models.table_data_entity import TableDataEntity
+
 
 class SessionEntity:
     """
@@ -11,7 +13,8 @@ class SessionEntity:
     def __init__(self):
         """
         Constructor - contains initial values for the session id, table name,
-        table rows, table columns, table headers, and table data.
+        table rows, table columns, table headers, table data, and the playlist
+        of media files.
         """
         self.session_id = ""
         self.button_definitions = []
@@ -19,4 +22,6 @@ class SessionEntity:
         self.table_row_count = 0
         self.table_col_count = 0
         self.table_headers = []
-        self.table_data = []
+        self.table_data = TableDataEntity()
+        self.playlist = []  # PlaylistEntryEntity of each media file, in order
+        self.playlist_index = -1  # index of the media file last played, -1 for none
@@ -0,0 +1,145 @@
+from array import array
+from collections import Counter
+
+
+class TableDataEntity:
+    """
+    A data structure that holds the cells of the encoding table. Coded tables
+    repeat the same few values over and over, so every distinct value is kept
+    once in a shared string table, and each cell only holds the integer id of
+    its value. The ids are stored column by column in compact arrays, with id 0
+    standing for an empty cell.
+    """
+
+    def __init__(self, column_count=0):
+        """
+        Constructor - Creates an empty table of the given number of columns.
+
+        Parameters:
+            column_count - number of columns of the table.
+        """
+        self.values = [None]  # value id : cell value
+        self.value_ids = {}  # cell value : value id
+        self.columns = [array("I") for _ in range(column_count)]  # value ids of each column's cells
+        self.row_count = 0
+
+    def __len__(self):
+        """
+        Gets the number of rows of the table.
+        """
+        return self.row_count
+
+    def __iter__(self):
+        """
+        Iterates over the rows of the table, each as a list of cell values.
+        """
+        for row_ix in range(self.row_count):
+            yield self.get_row(row_ix)
+
+    def column_count(self):
+        """
+        Gets the number of columns of the table.
+        """
+        return len(self.columns)
+
+    def intern(self, value):
+        """
+        Gets the id of a cell value, adding it to the string table if it is new.
+
+        Parameters:
+            value - cell value, None or "" for an empty cell.
+
+        Returns:
+            Id of the value.
+        """
+        if not value:
+            return 0
+        value_id = self.value_ids.get(value)
+        if value_id is None:
+            value_id = len(self.values)
+            self.values.append(value)
+            self.value_ids[value] = value_id
+        return value_id
+
+    def append_column(self, value_ids):
+        """
+        Adds a column of already interned cells to the right of the table.
+
+        Parameters:
+            value_ids - array of the value ids of the column's cells, one per row.
+        """
+        if len(value_ids) != self.row_count:
+            raise ValueError("column length does not match the table's row count")
+        self.columns.append(value_ids)
+
+    def append_row(self, row):
+        """
+        Adds a row to the bottom of the table. Columns are added when the row
+        holds more cells than the table has columns.
+
+        Parameters:
+            row - list of cell values or None.
+        """
+        while len(self.columns) < len(row):
+            self.columns.append(array("I", bytes(4 * self.row_count)))
+        intern = self.intern
+        for col_ix, column in enumerate(self.columns):
+            column.append(intern(row[col_ix]) if col_ix < len(row) else 0)
+        self.row_count += 1
+
+    def get_cell(self, row_ix, col_ix):
+        """
+        Gets the value of a cell.
+
+        Parameters:
+            row_ix - row of the cell.
+            col_ix - column of the cell.
+
+        Returns:
+            Cell value, None for an empty cell.
+        """
+        return self.values[self.columns[col_ix][row_ix]]
+
+    def get_row(self, row_ix):
+        """
+        Gets the values of a row.
+
+        Parameters:
+            row_ix - index of the row.
+
+        Returns:
+            List of cell values, None for empty cells.
+        """
+        values = self.values
+        return [values[column[row_ix]] for column in self.columns]
+
+    def get_rows(self, first_row, count):
+        """
+        Gets the values of consecutive rows. Only the requested rows are
+        decoded, so large tables can be handed out in chunks.
+
+        Parameters:
+            first_row - index of the first row.
+            count - number of rows, fewer are returned past the end of the table.
+
+        Returns:
+            List of rows, each a list of cell values or None.
+        """
+        values = self.values
+        column_slices = [column[first_row:first_row + count] for column in self.columns]
+        return [[values[value_id] for value_id in row_ids] for row_ids in zip(*column_slices)]
+
+    def count_values(self, col_ix):
+        """
+        Counts how often each value occurs in a column. The cells are counted
+        by their integer ids, and only the distinct values are looked up.
+
+        Parameters:
+            col_ix - index of the column.
+
+        Returns:
+            Dictionary of cell value : number of cells, without empty cells.
+        """
+        values = self.values
+        return {values[value_id]: count for value_id, count in Counter(self.columns[col_ix]).items()
+                if value_id != 0}
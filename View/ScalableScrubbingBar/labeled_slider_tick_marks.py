@@ -2,21 +2,6 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QGraphicsScene, QGraphicsView
 
 
-def _get_timestamp(time_ms):
-    """
-    Converts the given time, in milliseconds, to a timestamp string.
-
-    Parameters:
-        time_ms - time in milliseconds to convert.
-    """
-    centi_seconds = int((time_ms / 10) % 100)
-    seconds = int((time_ms / 1000) % 60)
-    minutes = int((time_ms / (1000 * 60)) % 60)
-    hours = int((time_ms / (1000 * 60 * 60)) % 24)
-
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{centi_seconds:02d}"
-
-
 class LabeledSliderTickMarks(QGraphicsView):
     """
     Custom widget that draws tick marks with timestamp labels for the provided
@@ -31,6 +16,8 @@ class LabeledSliderTickMarks(QGraphicsView):
      a left and right content margin of 1/2 * label_width. And, the tick  mark
      bar has no margins.}
     """
+    # Number of fraction digits shown in the tick mark labels.
+    FRACTION_DIGITS = 2
 
     def __init__(self, slider, label_width):
         """
@@ -64,6 +51,20 @@ class LabeledSliderTickMarks(QGraphicsView):
         self._label_padding = 5
         self.setStyleSheet("background: transparent;")
 
+        self._format_timestamp = None  # function converting ms to a timestamp, set by the controller
+
+    def set_timestamp_formatter(self, format_timestamp):
+        """
+        Sets the function converting the times of the tick marks to timestamp
+        labels, and redraws the tick marks with it.
+
+        Parameters:
+            format_timestamp - function called with the milliseconds and the
+                number of fraction digits, returning the timestamp.
+        """
+        self._format_timestamp = format_timestamp
+        self._reposition_tick_marks()
+
     def _reposition_tick_marks(self):
         """
         Repositions the tick marks, dynamically choosing the best tick mark interval which
@@ -87,7 +88,7 @@ class LabeledSliderTickMarks(QGraphicsView):
                 chosen_interval_sec = tick_interval_sec
                 break
 
-        if chosen_interval_sec is None:
+        if chosen_interval_sec is None or self._format_timestamp is None:
             return
 
         # Decide the time and starting position of the first tick-mark.
@@ -102,7 +103,7 @@ class LabeledSliderTickMarks(QGraphicsView):
         font = self.font()
         font.setPointSize(10)
         while tick_x < end_slider_px:
-            timestamp = _get_timestamp(curr_time_ms)
+            timestamp = self._format_timestamp(curr_time_ms, fraction_digits=self.FRACTION_DIGITS)
             self._graphics_scene.addLine(tick_x, 0, tick_x, 8)
             label = self._graphics_scene.addText(timestamp, font)
             label.setPos(tick_x - label.boundingRect().width() / 2, 9)
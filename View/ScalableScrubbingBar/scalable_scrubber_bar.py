@@ -122,6 +122,47 @@ class ScalableScrubberBar(QWidget):
         self.progress_bar_tick_marks.show()
         self.scrubber_bar_tick_marks.show()
 
+    def connect_visible_range_to_slot(self, slot):
+        """
+        Connects changes of the range shown by the scrubber bar to a slot
+        function in the controller.
+
+        Parameters:
+            slot: the handler function that is called with the (start, end) of the range.
+        """
+        self.scaling_bar.valueChanged.connect(slot)
+
+    def visible_range(self):
+        """
+        Gets the range shown by the scrubber bar.
+
+        Returns:
+            (start, end) of the range.
+        """
+        return self.scrubber_bar.minimum(), self.scrubber_bar.maximum()
+
+    def set_timestamp_formatter(self, format_timestamp):
+        """
+        Sets the function converting times to the timestamps labelling the bars.
+
+        Parameters:
+            format_timestamp - function called with the milliseconds and the
+                number of fraction digits, returning the timestamp.
+        """
+        self.scaling_bar_widget.set_timestamp_formatter(format_timestamp)
+        self.scaling_bar_tick_marks.set_timestamp_formatter(format_timestamp)
+        self.progress_bar_tick_marks.set_timestamp_formatter(format_timestamp)
+        self.scrubber_bar_tick_marks.set_timestamp_formatter(format_timestamp)
+
+    def set_segments(self, segments):
+        """
+        Sets the coded segments drawn below the scrubber bar.
+
+        Parameters:
+            segments - list of (start, end) in ms, ordered by start.
+        """
+        self.scrubber_bar.set_segments(segments)
+
     def _compute_max_timestamp_width(self):
         """
         Computes the maximum timestamp width required to paint any arbitrary
@@ -53,6 +53,17 @@ class ScalingBar(QWidget):
         """
         return self._slider
 
+    def set_timestamp_formatter(self, format_timestamp):
+        """
+        Sets the function converting the values of the handle labels to timestamps.
+
+        Parameters:
+            format_timestamp - function called with the milliseconds and the
+                number of fraction digits, returning the timestamp.
+        """
+        for label in self._handle_labels:
+            label.set_timestamp_formatter(format_timestamp)
+
     def resizeEvent(self, e):
         """
         On the event that the slider resizes, we update the handle labels
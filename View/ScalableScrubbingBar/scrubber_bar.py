@@ -9,10 +9,14 @@ class ScrubberBar(QSlider):
     based on the values of the scaling bar, and the handle is hidden when
     our privately tracked _value state is out of bounds. This variable is
     important since the parent's value is bounded strictly by the slider's
-    range, whereas our variable is not.
+    range, whereas our variable is not. Coded segments within the range are
+    drawn below the bar, overlapping segments in separate lanes.
     """
     onValueChanged = Signal(int)
 
+    SEGMENT_COLOR = QColor(230, 126, 34, 170)
+    SEGMENT_BORDER_COLOR = QColor(168, 84, 14)
+
     def __init__(self, scaling_bar):
         """
         Constructs an instance of the scrubber bar. The passed in scaling bar is
@@ -23,6 +27,7 @@ class ScrubberBar(QSlider):
         """
         super().__init__(Qt.Orientation.Horizontal)
         self._value = 0
+        self._segments = []  # (start, end) of the coded segments to draw, ordered by start
         scaling_bar.valueChanged.connect(lambda val: self.setRange(val[0], val[1]))
         self.sliderMoved.connect(self._slider_moved)
 
@@ -55,6 +60,16 @@ class ScrubberBar(QSlider):
         self.onValueChanged.emit(self._value)
         self.update()
 
+    def set_segments(self, segments):
+        """
+        Sets the coded segments drawn below the bar.
+
+        Parameters:
+            segments - list of (start, end) in the slider's units, ordered by start.
+        """
+        self._segments = segments
+        self.update()
+
     def paintEvent(self, e):
         """
         Complete override of slider painting. This method will hide the handle if our
@@ -99,6 +114,58 @@ class ScrubberBar(QSlider):
             painter.setPen(QColor(40, 99, 132))
             painter.drawRect(progress_rect)
 
+        if self._segments:
+            self._paint_segments(painter, groove_rect)
+
+    def _paint_segments(self, painter, groove_rect):
+        """
+        Draws the coded segments within the slider's range below the groove.
+        Each segment takes the first lane that is free at its start, so that
+        overlapping segments are drawn one below the other. Segments of a lane
+        that meet on screen are drawn as one rectangle.
+
+        Parameters:
+            painter - painter of the slider.
+            groove_rect - rectangle of the slider's groove.
+        """
+        minimum, maximum = self.minimum(), self.maximum()
+        if maximum <= minimum:
+            return
+        top = groove_rect.bottom() + 2
+        available_height = self.height() - top
+        if available_height < 2:
+            return
+        scale = groove_rect.width() / (maximum - minimum)
+
+        lane_ends = []  # end of the last segment of each lane
+        lane_rects = []  # [left, right] pixel ranges of each lane
+        for start, end in self._segments:
+            for lane, lane_end in enumerate(lane_ends):
+                if lane_end < start:
+                    break
+            else:
+                lane = len(lane_ends)
+                lane_ends.append(end)
+                lane_rects.append([])
+            lane_ends[lane] = end
+            left = groove_rect.left() + int((max(start, minimum) - minimum) * scale)
+            right = groove_rect.left() + int((min(end, maximum) - minimum) * scale)
+            rects = lane_rects[lane]
+            if rects and left <= rects[-1][1] + 1:
+                rects[-1][1] = max(rects[-1][1], right)
+            else:
+                rects.append([left, right])
+
+        lane_height = max(2, min(6, available_height // len(lane_rects)))
+        painter.setBrush(self.SEGMENT_COLOR)
+        painter.setPen(self.SEGMENT_BORDER_COLOR)
+        for lane, rects in enumerate(lane_rects):
+            lane_top = top + lane * lane_height
+            if lane_top + lane_height > self.height():
+                break
+            for left, right in rects:
+                painter.drawRect(QRect(left, lane_top, max(1, right - left), lane_height - 1))
+
     @Slot(tuple)
     def _slider_moved(self, value):
         """
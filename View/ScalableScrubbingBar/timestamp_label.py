@@ -2,19 +2,6 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QLineEdit
 
 
-def convert_ms_to_timestamp(milliseconds):
-    """
-    Converts the given millisecond value to a timestamp.
-
-    Parameters:
-        milliseconds - milliseconds to convert.
-    """
-    seconds = (milliseconds // 1000) % 60
-    minutes = (milliseconds // (1000 * 60)) % 60
-    hours = milliseconds // (1000 * 60 * 60)
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-
 class TimestampLabel(QLineEdit):
     """
     Custom timestamp label, which presents the timestamp in a fixed
@@ -23,6 +10,8 @@ class TimestampLabel(QLineEdit):
     Note: A QLabel was not used as changes to its text triggered
     layout updates.
     """
+    # Number of fraction digits shown in the label.
+    FRACTION_DIGITS = 0
 
     def __init__(self, slider, parent, timestamp_width):
         """
@@ -44,6 +33,21 @@ class TimestampLabel(QLineEdit):
         # Don't allow the user to edit the label.
         self.setEnabled(False)
 
+        self._value = 0
+        self._format_timestamp = None  # function converting ms to a timestamp, set by the controller
+
+    def set_timestamp_formatter(self, format_timestamp):
+        """
+        Sets the function converting the label's value to a timestamp, and
+        shows the current value with it.
+
+        Parameters:
+            format_timestamp - function called with the milliseconds and the
+                number of fraction digits, returning the timestamp.
+        """
+        self._format_timestamp = format_timestamp
+        self.set_value(self._value)
+
     def set_value(self, value):
         """
         Sets the timestamp value of the label according to the given
@@ -51,5 +55,6 @@ class TimestampLabel(QLineEdit):
         Parameters:
             value - millisecond duration.
         """
-        timestamp = convert_ms_to_timestamp(value)
-        self.setText(timestamp)
+        self._value = value
+        if self._format_timestamp is not None:
+            self.setText(self._format_timestamp(value, fraction_digits=self.FRACTION_DIGITS))
@@ -32,6 +32,12 @@ class AddCodingAssistanceButtonDialog(QDialog):
         hotkey_hbox.addWidget(hotkey_label)
         hotkey_hbox.addWidget(self.hotkey_field)
 
+        parent_code_hbox = QHBoxLayout()
+        parent_code_label = QLabel("Parent code (optional): ")
+        self.parent_code_field = QLineEdit()
+        parent_code_hbox.addWidget(parent_code_label)
+        parent_code_hbox.addWidget(self.parent_code_field)
+
         self.error_label = QLabel()
 
         self.create_button = QPushButton("Create Button")
@@ -41,6 +47,8 @@ class AddCodingAssistanceButtonDialog(QDialog):
         dialog_layout.addSpacing(50)
         dialog_layout.addLayout(hotkey_hbox)
         dialog_layout.addSpacing(50)
+        dialog_layout.addLayout(parent_code_hbox)
+        dialog_layout.addSpacing(50)
 
         self.dynamic_line_edits = []
         headers = [self.table.horizontalHeaderItem(c) for c in range(self.table.columnCount())]
@@ -0,0 +1,111 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QPushButton, QCheckBox
+
+from View.video_widget import VideoWidget
+
+
+class AngleView(QWidget):
+    """
+    Container of the widgets of a further camera angle: its video, the
+    offset aligning it with the main video, and toggles for its video and
+    audio.
+    """
+    # Offsets of up to a day are accepted, in either direction.
+    MAXIMUM_OFFSET_MS = 24 * 60 * 60 * 1000
+
+    def __init__(self, title):
+        """
+        Constructor - Creates the widgets of the camera angle and adds them
+        to the view using a vertical layout.
+
+        Parameters:
+            title - name of the camera angle, such as its file name.
+        """
+        super().__init__()
+
+        self.video_widget = VideoWidget(minimum_width=160)
+
+        # Create the title of the angle and a button removing it.
+        self.title_label = QLabel(title)
+        self.remove_button = QPushButton("Remove")
+
+        # Create the offset of the angle from the main video.
+        offset_label = QLabel("Offset (ms)")
+        self.offset_spin_box = QSpinBox()
+        self.offset_spin_box.setRange(-self.MAXIMUM_OFFSET_MS, self.MAXIMUM_OFFSET_MS)
+        self.offset_spin_box.setSingleStep(40)
+        self.offset_spin_box.setToolTip("Position of this angle when the main video is at its start")
+
+        # Create toggles showing the video and playing the audio of the angle.
+        self.show_video_check_box = QCheckBox("Video")
+        self.show_video_check_box.setChecked(True)
+        self.audio_check_box = QCheckBox("Audio")
+
+        title_layout = QHBoxLayout()
+        title_layout.addWidget(self.title_label, stretch=1)
+        title_layout.addWidget(self.remove_button)
+        control_layout = QHBoxLayout()
+        control_layout.addWidget(offset_label)
+        control_layout.addWidget(self.offset_spin_box, stretch=1)
+        control_layout.addWidget(self.show_video_check_box)
+        control_layout.addWidget(self.audio_check_box)
+
+        vertical_layout = QVBoxLayout()
+        vertical_layout.setContentsMargins(0, 0, 0, 0)
+        vertical_layout.addLayout(title_layout)
+        vertical_layout.addWidget(self.video_widget, stretch=1)
+        vertical_layout.addLayout(control_layout)
+        self.setLayout(vertical_layout)
+
+    def set_video_shown(self, shown):
+        """
+        Shows or hides the video of the angle, keeping its controls.
+
+        Parameters:
+            shown - whether the video is shown.
+        """
+        self.video_widget.setVisible(shown)
+
+    def set_audio_checked(self, checked):
+        """
+        Checks or unchecks the audio toggle of the angle.
+
+        Parameters:
+            checked - whether the audio toggle is checked.
+        """
+        self.audio_check_box.setChecked(checked)
+
+    def connect_offset_to_slot(self, slot):
+        """
+        Connects changes of the offset to a slot function in the controller.
+
+        Parameters:
+            slot: the handler function that is called with the offset in ms.
+        """
+        self.offset_spin_box.valueChanged.connect(slot)
+
+    def connect_show_video_to_slot(self, slot):
+        """
+        Connects the video toggle to a slot function in the controller.
+
+        Parameters:
+            slot: the handler function that is called with whether the video is shown.
+        """
+        self.show_video_check_box.toggled.connect(slot)
+
+    def connect_audio_to_slot(self, slot):
+        """
+        Connects the audio toggle to a slot function in the controller.
+
+        Parameters:
+            slot: the handler function that is called with whether the audio plays.
+        """
+        self.audio_check_box.toggled.connect(slot)
+
+    def connect_remove_to_slot(self, slot):
+        """
+        Connects the remove button to a slot function in the controller.
+
+        Parameters:
+            slot: the handler function that is called when the button is clicked.
+        """
+        self.remove_button.clicked.connect(slot)
@@ -1,6 +1,9 @@
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, Qt
 from PySide6.QtGui import QKeySequence
-from PySide6.QtWidgets import QWidget, QPushButton, QVBoxLayout, QSizePolicy, QGridLayout, QHBoxLayout
+import math
+
+from PySide6.QtWidgets import QWidget, QPushButton, QVBoxLayout, QSizePolicy, QGridLayout, QHBoxLayout, \
+    QStackedWidget, QLabel
 
 from View.grid_layout import GridLayout
 
@@ -58,7 +61,11 @@ class ButtonPanel(QWidget):
         self.horizontal_layout.addWidget(self.delete_button)
         button_container.setLayout(self.horizontal_layout)
 
-        self.vertical_layout.addWidget(grid_container, stretch=10)
+        # The root grid is the first page of a stack of codebook drill-down pages.
+        self.page_stack = QStackedWidget()
+        self.page_stack.addWidget(grid_container)
+
+        self.vertical_layout.addWidget(self.page_stack, stretch=10)
         self.vertical_layout.addWidget(button_container, stretch=1)
 
         # Add the button container to the button panel.
@@ -92,6 +99,53 @@ class ButtonPanel(QWidget):
         button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.grid_layout.addWidget(button)
 
+    def push_page(self, title, buttons):
+        """
+        Shows a drill-down page holding the buttons of a code's nested codes.
+        The page is only created when it is opened.
+
+        Parameters:
+            title - title of the page, typically the parent code's identifier.
+            buttons - list of buttons to place on the page.
+        """
+        page = QWidget()
+        page_layout = QVBoxLayout()
+        page_layout.setContentsMargins(0, 0, 0, 0)
+
+        header_layout = QHBoxLayout()
+        back_button = QPushButton("< Back")
+        back_button.clicked.connect(self.pop_page)
+        title_label = QLabel(title)
+        title_label.setAlignment(Qt.AlignCenter)
+        header_layout.addWidget(back_button)
+        header_layout.addWidget(title_label, stretch=1)
+
+        grid_container = QWidget()
+        row_count = max(1, math.ceil(len(buttons) / 3))
+        grid_layout = GridLayout(grid_container, row_count, 3)
+        for button in buttons:
+            button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            grid_layout.addWidget(button)
+
+        page_layout.addLayout(header_layout)
+        page_layout.addWidget(grid_container, stretch=1)
+        page.setLayout(page_layout)
+
+        self.page_stack.addWidget(page)
+        self.page_stack.setCurrentWidget(page)
+
+    def pop_page(self):
+        """
+        Closes the current drill-down page, releasing its widgets, and returns
+        to the previous page.
+        """
+        if self.page_stack.count() <= 1:
+            return
+        page = self.page_stack.widget(self.page_stack.count() - 1)
+        self.page_stack.removeWidget(page)
+        self.page_stack.setCurrentIndex(self.page_stack.count() - 1)
+        page.deleteLater()
+
     def delete_coding_assistance_button(self, button_id):
         """
         Deletes a button in the Coding Assistance Panel
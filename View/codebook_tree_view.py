@@ -0,0 +1,132 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem
+
+
+class CodebookTreeView(QTreeWidget):
+    """
+    CodebookTreeView presents the codebook hierarchy of button definitions.
+    Subtrees are materialized only when their parent item is expanded, and are
+    released again once it is collapsed, so large codebooks stay cheap to show.
+    """
+    BUTTON_ID_ROLE = Qt.UserRole
+    PLACEHOLDER_ROLE = Qt.UserRole + 1
+
+    def __init__(self):
+        """
+        Constructor - Sets the properties of the codebook tree.
+        """
+        super().__init__()
+
+        self.setHeaderLabels(["Code", "Data"])
+        self.setColumnCount(2)
+        self.itemCollapsed.connect(self._release_subtree)
+
+    def connect_expand_to_slot(self, slot):
+        """
+        Connects the expansion of a codebook item to a slot function in the
+        controller. The slot is responsible for populating the item's subtree.
+
+        Parameters:
+            slot: the handler function that is called with the expanded item.
+        """
+        self.itemExpanded.connect(slot)
+
+    def add_definitions(self, button_definitions, has_children, parent_item=None):
+        """
+        Adds a list of button definitions to the tree. Items with nested codes
+        receive a placeholder child so they can be expanded.
+
+        Parameters:
+            button_definitions - list of button definitions to add.
+            has_children - function returning whether a code has nested codes.
+            parent_item - tree item to add the definitions under, None for the root.
+        """
+        items = []
+        for button_definition in button_definitions:
+            item = QTreeWidgetItem([button_definition.button_id, ", ".join(button_definition.data)])
+            item.setData(0, self.BUTTON_ID_ROLE, button_definition.button_id)
+            if has_children(button_definition.button_id):
+                item.addChild(self._create_placeholder())
+            items.append(item)
+
+        if parent_item is None:
+            self.addTopLevelItems(items)
+        else:
+            parent_item.addChildren(items)
+
+    def is_populated(self, item):
+        """
+        Determines whether the subtree of an item has been materialized.
+
+        Parameters:
+            item - tree item to check.
+        """
+        return not (item.childCount() == 1 and item.child(0).data(0, self.PLACEHOLDER_ROLE))
+
+    def populate_item(self, item, button_definitions, has_children):
+        """
+        Replaces the placeholder of an expanded item with its child definitions.
+
+        Parameters:
+            item - expanded tree item.
+            button_definitions - list of child button definitions of the item.
+            has_children - function returning whether a code has nested codes.
+        """
+        item.takeChildren()
+        self.add_definitions(button_definitions, has_children, item)
+
+    def remove_definition_item(self, button_id):
+        """
+        Removes the materialized item of a button definition from the tree.
+
+        Parameters:
+            button_id - identifier of the button definition to remove.
+        """
+        for item in self.findItems(button_id, Qt.MatchExactly | Qt.MatchRecursive, 0):
+            parent_item = item.parent()
+            if parent_item is None:
+                self.takeTopLevelItem(self.indexOfTopLevelItem(item))
+            else:
+                parent_item.removeChild(item)
+
+    def update_definition_item(self, button_id, button_definition):
+        """
+        Updates the materialized item of a button definition after it was edited.
+
+        Parameters:
+            button_id - identifier of the button definition before the edit.
+            button_definition - edited button definition.
+        """
+        for item in self.findItems(button_id, Qt.MatchExactly | Qt.MatchRecursive, 0):
+            item.setText(0, button_definition.button_id)
+            item.setText(1, ", ".join(button_definition.data))
+            item.setData(0, self.BUTTON_ID_ROLE, button_definition.button_id)
+
+    def button_id(self, item):
+        """
+        Gets the button definition identifier of a tree item.
+
+        Parameters:
+            item - tree item.
+        """
+        return item.data(0, self.BUTTON_ID_ROLE)
+
+    def _create_placeholder(self):
+        """
+        Creates a placeholder item standing in for an unloaded subtree.
+        """
+        placeholder = QTreeWidgetItem(["Loading..."])
+        placeholder.setData(0, self.PLACEHOLDER_ROLE, True)
+        return placeholder
+
+    def _release_subtree(self, item):
+        """
+        Drops the materialized subtree of a collapsed item, restoring its
+        placeholder so that the subtree is reloaded when expanded again.
+
+        Parameters:
+            item - collapsed tree item.
+        """
+        if item.childCount() and self.is_populated(item):
+            item.takeChildren()
+            item.addChild(self._create_placeholder())
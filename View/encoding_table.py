@@ -1,5 +1,17 @@
+from array import array
+from contextlib import contextmanager
+
 from PySide6.QtWidgets import QTableWidget, QTableWidgetItem, QLineEdit
 from PySide6 import QtWidgets, QtCore
+from PySide6.QtGui import QFont
+from PySide6.QtCore import Signal, QTimer
+
+from Models.table_data_entity import TableDataEntity
+from View.encoding_table_commands import SetCellsCommand, InsertRowsCommand, RemoveRowsCommand, MoveRowsCommand, \
+    ReorderRowsCommand, InsertColumnsCommand, RemoveColumnsCommand, RenameHeaderCommand, AppendRowsCommand, \
+    group_ranges
+from View.encoding_table_delegate import EncodingTableDelegate
+from View.undo_history import UndoHistory
 
 
 class EncodingTable(QTableWidget):
@@ -8,6 +20,17 @@ class EncodingTable(QTableWidget):
     functionalities in the front-end.
     """
 
+    # Emitted with whether an edit can be undone and whether one can be redone.
+    undo_state_changed = Signal(bool, bool)
+    # Emitted when a batch of edits starts, and once the whole batch is made.
+    batch_started = Signal()
+    batch_finished = Signal()
+
+    # Ways the heights of rows are determined, from the most exact to the fastest.
+    ROW_HEIGHTS_FIT_ALL = 0  # every row fits its contents, measured again after every change
+    ROW_HEIGHTS_FIT_EDITED = 1  # edited rows fit their contents, measured once they are shown
+    ROW_HEIGHTS_UNIFORM = 2  # every row is one line high, and longer notes are elided
+
     def __init__(self):
         """
         Constructor - Sets the properties of a QTableWidget.
@@ -17,8 +40,27 @@ class EncodingTable(QTableWidget):
         self.setRowCount(10)
         self.setColumnCount(4)
 
-        # Holds the padding in non stylesheet format
-        self.padding = 0
+        # Number of pending suspend_row_resizing() calls.
+        self._row_resizing_suspended = 0
+        self._row_height_mode = self.ROW_HEIGHTS_FIT_ALL
+        # Rows edited since they were last fitted to their contents, fitted
+        # once they are shown while only edited rows are fitted.
+        self._rows_to_fit = set()
+        self._fit_rows_timer = QTimer(self)
+        self._fit_rows_timer.setSingleShot(True)
+        self._fit_rows_timer.setInterval(0)
+        self._fit_rows_timer.timeout.connect(self._fit_shown_rows)
+        self.verticalScrollBar().valueChanged.connect(self._fit_rows_timer.start)
+        # Number of batch_update() blocks currently open.
+        self._batch_depth = 0
+
+        # Holds the undoable edits of the table. Edited cells are committed
+        # through the delegate so that every edit is recorded.
+        self.undo_history = UndoHistory(self)
+        self.undo_history.indexChanged.connect(self._emit_undo_state)
+        # Draws and measures the cells with their font, padding and minimum height.
+        self.cell_delegate = EncodingTableDelegate(self, self)
+        self.setItemDelegate(self.cell_delegate)
 
         self.horizontalHeader().setStretchLastSection(True)
         self.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
@@ -63,57 +105,131 @@ class EncodingTable(QTableWidget):
         """
         Increases the column count of the table by 1.
         """
-        self.setColumnCount(self.columnCount() + 1)
+        self.undo_history.push(InsertColumnsCommand(self, [(self.columnCount(), 1)], "Add column"))
 
     def add_row(self):
         """
         Increases the row count of the table by 1.
         """
-        self.setRowCount(self.rowCount() + 1)
+        self.undo_history.push(InsertRowsCommand(self, [(self.rowCount(), 1)], "Add row"))
+
+    def insert_rows(self, rows):
+        """
+        Inserts empty rows above every group of consecutive rows, as many as
+        the group holds, as one undoable command.
+
+        Parameters:
+            rows - iterable of row indices.
+        """
+        ranges = []
+        offset = 0
+        for first_row, count in group_ranges(rows):
+            ranges.append((first_row + offset, count))
+            offset += count
+        if ranges:
+            self.undo_history.push(InsertRowsCommand(self, ranges, "Insert rows"))
+
+    def duplicate_rows(self, rows):
+        """
+        Inserts a copy of every group of consecutive rows below it, as one
+        undoable command.
+
+        Parameters:
+            rows - iterable of row indices.
+        """
+        ranges = []
+        payload = []
+        offset = 0
+        for first_row, count in group_ranges(rows):
+            ranges.append((first_row + count + offset, count))
+            payload.append(self.read_rows(first_row, count))
+            offset += count
+        if ranges:
+            self.undo_history.push(InsertRowsCommand(self, ranges, "Duplicate rows", payload))
+
+    def remove_rows(self, rows):
+        """
+        Deletes rows as one undoable command. Consecutive rows are removed
+        together, and the table always keeps its first row.
+
+        Parameters:
+            rows - iterable of row indices.
+        """
+        rows = set(rows)
+        if len(rows) >= self.rowCount():
+            rows.discard(0)
+        if rows:
+            self.undo_history.push(RemoveRowsCommand(self, rows, "Delete rows"))
+
+    def move_rows(self, rows, offset):
+        """
+        Moves rows up or down by one row as one undoable command. Groups of
+        consecutive rows at the edge of the table stay in place.
+
+        Parameters:
+            rows - iterable of row indices.
+            offset - -1 to move the rows up, 1 to move them down.
+        """
+        row_count = self.rowCount()
+        ranges = [(first_row, count) for first_row, count in group_ranges(rows)
+                  if first_row + offset >= 0 and first_row + count + offset <= row_count]
+        if ranges:
+            text = "Move rows up" if offset < 0 else "Move rows down"
+            self.undo_history.push(MoveRowsCommand(self, ranges, offset, text))
+
+    def insert_row(self, row, cells, description):
+        """
+        Inserts a single row filled with cells as one undoable command.
 
-    def del_column(self):
+        Parameters:
+            row - index of the row once it is inserted.
+            cells - list of (column, text) of the row's non-empty cells.
+            description - description of the edit in the undo history.
         """
-        Deletes current selected column
+        self.undo_history.push(InsertRowsCommand(self, [(row, 1)], description, [[tuple(cells)]]))
+
+    def reorder_rows(self, moves, description, order=None):
         """
-        current_col = self.currentColumn()
-        item_list = self.selectedIndexes()
-        if current_col != 0 and len(item_list) > 0:
-            self.removeColumn(current_col)
+        Moves single rows to other positions, or puts the rows in a new order,
+        as one undoable command.
 
-    def del_row(self):
+        Parameters:
+            moves - list of (source row, destination row), applied one after the other.
+            description - description of the edit in the undo history.
+            order - list of every row in its new order, applied after the moves, or None.
         """
-        Deletes current selected row
+        if moves or order:
+            self.undo_history.push(ReorderRowsCommand(self, moves, description, order))
+
+    def insert_columns(self, columns):
         """
-        if self.rowCount() > 1:
-            current_row = self.currentRow()
-            item_list = self.selectedIndexes()
-            num_columns = self.columnCount()
-            num_rows = self.rowCount()
-            row = col = False
+        Inserts empty columns left of every group of consecutive columns, as
+        many as the group holds, as one undoable command. Columns are never
+        inserted left of the "Time" column.
 
-            # This logic determines whether a column or a row is selected
-            if num_columns == 1:
-                if len(item_list) == 0:
-                    return
-                elif len(item_list) == num_rows:
-                    col = True
-                else:
-                    row = True
-            elif len(item_list) > 1:
-                row1 = item_list[0].row()
-                col1 = item_list[0].column()
-                row2 = item_list[1].row()
-                col2 = item_list[1].column()
+        Parameters:
+            columns - iterable of column indices.
+        """
+        ranges = []
+        offset = 0
+        for first_column, count in group_ranges(columns):
+            ranges.append((max(first_column, 1) + offset, count))
+            offset += count
+        if ranges:
+            self.undo_history.push(InsertColumnsCommand(self, ranges, "Insert columns"))
 
-                if row1 == row2 and col1 != col2:
-                    row = True
-                if row1 != row2 and col1 == col2:
-                    col = True
+    def remove_columns(self, columns):
+        """
+        Deletes columns as one undoable command. Consecutive columns are
+        removed together, and the "Time" column is never removed.
 
-            if current_row == -1 or col:
-                return
-            elif row:
-                self.removeRow(current_row)
+        Parameters:
+            columns - iterable of column indices.
+        """
+        columns = set(columns)
+        columns.discard(0)
+        if columns:
+            self.undo_history.push(RemoveColumnsCommand(self, columns, "Delete columns"))
 
     def change_font(self, font_choice):
         """
@@ -122,9 +238,7 @@ class EncodingTable(QTableWidget):
         Parameters:
             font_choice: size of user selected font.
         """
-        font = self.font()
-        font.setPointSize(font_choice)
-        self.setFont(font)
+        self.apply_cell_settings(font_size=font_choice)
 
     def edit_header(self, section):
         """
@@ -153,11 +267,193 @@ class EncodingTable(QTableWidget):
         new_label = str(self.horizontalHeader().line.text())
 
         if new_label != '':
-            self.setHorizontalHeaderItem(
-                self.horizontalHeader().sectionedit, QTableWidgetItem(new_label))
+            section = self.horizontalHeader().sectionedit
+            self.undo_history.push(RenameHeaderCommand(self, section, self.read_header(section), new_label))
             self.horizontalHeader().line.setText('')
             self.horizontalHeader().setCurrentIndex(QtCore.QModelIndex())
 
+    def set_cells(self, cells, description, merge=False):
+        """
+        Sets the text of cells as one undoable command.
+
+        Parameters:
+            cells - list of (row, column, text), None for empty cells.
+            description - description of the edit in the undo history.
+            merge - whether consecutive edits of the same single cell merge into one command.
+        """
+        changes = [(row, column, self.read_cell(row, column), text) for row, column, text in cells]
+        changes = [change for change in changes if change[2] != change[3]]
+        if changes:
+            self.undo_history.push(SetCellsCommand(self, changes, description, merge))
+
+    def record_appended_rows(self, first_row, row_count, headers, description):
+        """
+        Records rows that were written below the table's data as one undoable command.
+
+        Parameters:
+            first_row - index of the first written row.
+            row_count - number of rows of the table before the rows were written.
+            headers - list of the table's headers before the rows were written.
+            description - description of the edit in the undo history.
+        """
+        if self.rowCount() > first_row or self.get_headers() != headers:
+            self.undo_history.push(AppendRowsCommand(self, first_row, row_count, headers, description))
+
+    def undo(self):
+        """
+        Undoes the last edit of the table.
+        """
+        self.undo_history.undo()
+
+    def redo(self):
+        """
+        Redoes the last undone edit of the table.
+        """
+        self.undo_history.redo()
+
+    def set_undo_memory_budget(self, memory_budget):
+        """
+        Sets the memory the undo history may hold.
+
+        Parameters:
+            memory_budget - budget in bytes.
+        """
+        self.undo_history.set_memory_budget(memory_budget)
+        self._emit_undo_state()
+
+    def _emit_undo_state(self):
+        """
+        Emits whether an edit can be undone and whether one can be redone.
+        """
+        self.undo_state_changed.emit(self.undo_history.can_undo(), self.undo_history.canRedo())
+
+    @contextmanager
+    def batch_update(self, enabled=True):
+        """
+        Suspends repainting and row resizing while a batch of edits is made.
+        batch_started and batch_finished are emitted around the outermost batch,
+        so that views of the table can catch up once per batch.
+
+        Parameters:
+            enabled - whether to suspend them, so that single edits can skip it.
+        """
+        if not enabled:
+            yield
+            return
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self.batch_started.emit()
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        self.suspend_row_resizing()
+        try:
+            yield
+        finally:
+            self.resume_row_resizing()
+            self.setUpdatesEnabled(updates_enabled)
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.batch_finished.emit()
+
+    def read_cell(self, row, column):
+        """
+        Gets the text of a cell.
+
+        Returns:
+            The text, or None if the cell is empty.
+        """
+        item = self.item(row, column)
+        text = item.text() if item is not None else None
+        return text if text else None
+
+    def write_cell(self, row, column, text):
+        """
+        Sets the text of a cell without recording it in the undo history.
+
+        Parameters:
+            row - index of the row.
+            column - index of the column.
+            text - text of the cell, None to empty it.
+        """
+        item = self.item(row, column)
+        if text is None:
+            if item is not None:
+                self.takeItem(row, column)
+        elif item is None:
+            self.setItem(row, column, QTableWidgetItem(text))
+        else:
+            item.setText(text)
+
+    def read_rows(self, first_row, count):
+        """
+        Gets the non-empty cells of consecutive rows.
+
+        Returns:
+            List of sparse rows, each a tuple of (column, text).
+        """
+        get_item = self.item
+        col_range = range(self.columnCount())
+        rows = []
+        for row_ix in range(first_row, first_row + count):
+            cells = []
+            for col_ix in col_range:
+                item = get_item(row_ix, col_ix)
+                if item is not None and item.text():
+                    cells.append((col_ix, item.text()))
+            rows.append(tuple(cells))
+        return rows
+
+    def write_rows(self, first_row, rows):
+        """
+        Sets the cells of consecutive rows without recording them in the undo history.
+
+        Parameters:
+            first_row - index of the first row.
+            rows - list of sparse rows, each a tuple of (column, text).
+        """
+        set_item = self.setItem
+        for row_ix, cells in enumerate(rows, first_row):
+            for col_ix, text in cells:
+                set_item(row_ix, col_ix, QTableWidgetItem(text))
+
+    def read_column(self, column):
+        """
+        Gets the non-empty cells of a column.
+
+        Returns:
+            Tuple of (row, text).
+        """
+        get_item = self.item
+        cells = []
+        for row_ix in range(self.rowCount()):
+            item = get_item(row_ix, column)
+            if item is not None and item.text():
+                cells.append((row_ix, item.text()))
+        return tuple(cells)
+
+    def read_header(self, column):
+        """
+        Gets the header of a column.
+
+        Returns:
+            The header text, or None if the column has no header item.
+        """
+        item = self.horizontalHeaderItem(column)
+        return item.text() if item is not None else None
+
+    def write_header(self, column, header):
+        """
+        Sets the header of a column without recording it in the undo history.
+
+        Parameters:
+            column - index of the column.
+            header - header text, None to remove the header item.
+        """
+        if header is None:
+            self.takeHorizontalHeaderItem(column)
+        else:
+            self.setHorizontalHeaderItem(column, QTableWidgetItem(header))
+
     def get_row_count(self):
         """
         Getter method to get the row count.
@@ -184,7 +480,7 @@ class EncodingTable(QTableWidget):
             List of ints with index 0 holding the width and index 1 holding the height.
         """
         min_width = self.horizontalHeader().minimumSectionSize()
-        min_height = self.verticalHeader().minimumSectionSize()
+        min_height = self.cell_delegate.minimum_height()
         return [min_width, min_height]
 
     def get_maximum_width(self):
@@ -204,7 +500,7 @@ class EncodingTable(QTableWidget):
         Returns:
             Int representing the padding in each table cell.
         """
-        return self.padding
+        return self.cell_delegate.padding()
 
     def get_headers(self):
         """
@@ -226,19 +522,39 @@ class EncodingTable(QTableWidget):
         Getter method to get the table data.
 
         Returns:
-            2D list of table data
+            TableDataEntity holding the table data
         """
-        row_data = []
-        for row_ix in range(self.rowCount()):
-            col_data = []
-            for col_ix in range(self.columnCount()):
-                item = self.item(row_ix, col_ix)
-                if item is not None and item.text() != '':
-                    col_data.append(item.text())
-                else:
-                    col_data.append(None)
-            row_data.append(col_data)
-        return row_data
+        table_data = TableDataEntity()
+        table_data.row_count = self.rowCount()
+        # Bind the lookups locally, as this loop runs once per cell.
+        get_item = self.item
+        intern = table_data.intern
+        row_range = range(self.rowCount())
+
+        for col_ix in range(self.columnCount()):
+            value_ids = array("I", bytes(4 * len(row_range)))
+            for row_ix in row_range:
+                item = get_item(row_ix, col_ix)
+                if item is not None:
+                    value_ids[row_ix] = intern(item.text())
+            table_data.append_column(value_ids)
+        return table_data
+
+    def get_first_unused_row(self):
+        """
+        Getter method to get the row following the last row holding any data.
+
+        Returns:
+            Int that is the first row after the table's data
+        """
+        get_item = self.item
+        col_range = range(self.columnCount())
+        for row_ix in range(self.rowCount() - 1, -1, -1):
+            for col_ix in col_range:
+                item = get_item(row_ix, col_ix)
+                if item is not None and item.text():
+                    return row_ix + 1
+        return 0
 
     def set_table_width(self, width):
         """
@@ -247,7 +563,7 @@ class EncodingTable(QTableWidget):
         Parameters:
             height - height of table cell.
         """
-        self.horizontalHeader().setMinimumSectionSize(width)
+        self.apply_cell_settings(minimum_width=width)
 
     def set_table_height(self, height):
         """
@@ -256,13 +572,13 @@ class EncodingTable(QTableWidget):
         Parameters:
             height - height of table cell.
         """
-        self.verticalHeader().setMinimumSectionSize(height)
+        self.apply_cell_settings(minimum_height=height)
 
     def set_maximum_width(self, width):
         """
         Changes default cell height.
         """
-        self.horizontalHeader().setMaximumSectionSize(width)
+        self.apply_cell_settings(maximum_width=width)
 
     def set_cell_size(self, width, height):
         """
@@ -272,15 +588,166 @@ class EncodingTable(QTableWidget):
             width - width of table cell.
             height - height of table cell.
         """
-        self.horizontalHeader().setMinimumSectionSize(width)
-        self.verticalHeader().setMinimumSectionSize(height)
+        self.apply_cell_settings(minimum_width=width, minimum_height=height)
 
     def set_padding(self, padding):
         """
         Changes default padding.
+
+        Parameters:
+            padding - padding of table cells in pixels.
+        """
+        self.apply_cell_settings(padding=int(padding))
+
+    def apply_cell_settings(self, minimum_width=None, minimum_height=None, maximum_width=None, padding=None,
+                            font_size=None):
+        """
+        Applies display settings of the cells together, so that the table is
+        only laid out again once. Cells are drawn and measured by the cell
+        delegate, so no stylesheet has to be parsed and applied to every cell.
+
+        Parameters:
+            minimum_width - minimum width of table cells, None to keep it.
+            minimum_height - minimum height of table cells, None to keep it.
+            maximum_width - maximum width of table cells, None to keep it.
+            padding - padding of table cells in pixels, None to keep it.
+            font_size - point size of the font of table cells, None to keep it.
+        """
+        if minimum_width is not None:
+            self.horizontalHeader().setMinimumSectionSize(minimum_width)
+        if maximum_width is not None:
+            self.horizontalHeader().setMaximumSectionSize(maximum_width)
+        font = None
+        if font_size is not None:
+            font = QFont(self.cell_delegate.font() or self.font())
+            font.setPointSize(font_size)
+        self.cell_delegate.set_style(font=font, padding=padding, minimum_height=minimum_height)
+        if self._row_height_mode != self.ROW_HEIGHTS_FIT_ALL:
+            self._reset_row_heights()
+        elif self._row_resizing_suspended == 0:
+            self.verticalHeader().resizeSections()
+
+    def set_row_height_mode(self, mode):
+        """
+        Changes how the heights of rows are determined. Fitting every row to
+        its contents measures rows again after every change, which slows down
+        with the size of the table, while the other modes take the same time
+        however many rows there are.
+
+        Parameters:
+            mode - one of ROW_HEIGHTS_FIT_ALL, ROW_HEIGHTS_FIT_EDITED or ROW_HEIGHTS_UNIFORM.
+        """
+        if mode == self._row_height_mode:
+            return
+        if self._row_height_mode == self.ROW_HEIGHTS_FIT_EDITED:
+            self._disconnect_fit_edited_rows()
+        self._row_height_mode = mode
+        self._rows_to_fit = set()
+        if mode == self.ROW_HEIGHTS_FIT_EDITED:
+            model = self.model()
+            model.dataChanged.connect(self._on_rows_edited)
+            model.rowsInserted.connect(self._on_rows_inserted)
+            model.rowsRemoved.connect(self._on_rows_removed)
+
+        # Long notes wrap onto more lines only while rows can grow to fit them.
+        self.setWordWrap(mode != self.ROW_HEIGHTS_UNIFORM)
+        if self._row_resizing_suspended == 0:
+            self.verticalHeader().setSectionResizeMode(self._get_row_resize_mode())
+        if mode != self.ROW_HEIGHTS_FIT_ALL:
+            self._reset_row_heights()
+
+    def get_row_height_mode(self):
+        """
+        Getter method to get how the heights of rows are determined.
+
+        Returns:
+            One of ROW_HEIGHTS_FIT_ALL, ROW_HEIGHTS_FIT_EDITED or ROW_HEIGHTS_UNIFORM.
+        """
+        return self._row_height_mode
+
+    def _get_row_resize_mode(self):
+        """
+        Gets the resize mode of the rows in the current row height mode.
+        """
+        if self._row_height_mode == self.ROW_HEIGHTS_FIT_ALL:
+            return QtWidgets.QHeaderView.ResizeToContents
+        return QtWidgets.QHeaderView.Fixed
+
+    def _disconnect_fit_edited_rows(self):
+        """
+        Stops tracking the edited rows to fit.
+        """
+        model = self.model()
+        model.dataChanged.disconnect(self._on_rows_edited)
+        model.rowsInserted.disconnect(self._on_rows_inserted)
+        model.rowsRemoved.disconnect(self._on_rows_removed)
+
+    def _reset_row_heights(self):
+        """
+        Gives every row the height of one line of text. Rows holding data are
+        fitted to their contents again as they are shown, if edited rows are fitted.
+        """
+        line_height = self.cell_delegate.line_height(self.font()) + (1 if self.showGrid() else 0)
+        header = self.verticalHeader()
+        header.setDefaultSectionSize(max(line_height, header.minimumSectionSize()))
+        if self._row_height_mode == self.ROW_HEIGHTS_FIT_EDITED:
+            self._rows_to_fit = set(range(self.rowCount()))
+            self._fit_rows_timer.start()
+
+    def _on_rows_edited(self, top_left, bottom_right, roles=()):
+        """
+        Marks edited rows to be fitted to their contents once they are shown.
+        """
+        self._rows_to_fit.update(range(top_left.row(), bottom_right.row() + 1))
+        self._fit_rows_timer.start()
+
+    def _on_rows_inserted(self, parent, first, last):
+        """
+        Moves the rows to fit below inserted rows along with them.
+        """
+        count = last - first + 1
+        self._rows_to_fit = {row + count if row >= first else row for row in self._rows_to_fit}
+
+    def _on_rows_removed(self, parent, first, last):
+        """
+        Drops removed rows from the rows to fit, and moves the rows below them up.
+        """
+        count = last - first + 1
+        self._rows_to_fit = {row - count if row > last else row for row in self._rows_to_fit
+                             if row < first or row > last}
+
+    def _fit_shown_rows(self):
+        """
+        Fits the shown rows that were edited since they were last fitted to
+        their contents. Only the rows in view are measured, however many rows
+        were edited.
+        """
+        if not self._rows_to_fit or self._row_resizing_suspended:
+            return
+        first_row = self.rowAt(0)
+        if first_row == -1:
+            return
+        last_row = self.rowAt(self.viewport().height() - 1)
+        if last_row == -1:
+            last_row = self.rowCount() - 1
+        rows = [row for row in range(first_row, last_row + 1) if row in self._rows_to_fit]
+        for row in rows:
+            self.resizeRowToContents(row)
+        self._rows_to_fit.difference_update(rows)
+        if rows:
+            # Rows that shrank may have brought further edited rows into view.
+            self._fit_rows_timer.start()
+
+    def resizeEvent(self, event):
+        """
+        Fits the edited rows brought into view by resizing the table.
+
+        Parameters:
+            event - resize event of the table.
         """
-        self.padding = padding
-        self.setStyleSheet("QTableWidget::item { padding: " + padding + "px }")
+        super().resizeEvent(event)
+        if self._rows_to_fit:
+            self._fit_rows_timer.start()
 
     def set_row_count(self, table_row):
         """
@@ -311,15 +778,71 @@ class EncodingTable(QTableWidget):
             header = table_headers[col_ix]
             self.setHorizontalHeaderItem(col_ix, QTableWidgetItem(header))
 
-    def set_table_data(self, table_data):
+    def set_column_headers(self, columns):
         """
-        Sets the table data of the view.
+        Sets the headers of columns, adding columns if the table is narrower.
 
         Parameters:
-            2D list of table data
+            columns - list of (column index, header text) pairs.
         """
-        for row_ix in range(self.rowCount()):
-            for col_ix in range(self.columnCount()):
-                cell_data = table_data[row_ix][col_ix]
-                if cell_data is not None:
-                    self.setItem(row_ix, col_ix, QTableWidgetItem(table_data[row_ix][col_ix]))
+        for col_ix, header in columns:
+            if col_ix >= self.columnCount():
+                self.setColumnCount(col_ix + 1)
+            self.setHorizontalHeaderItem(col_ix, QTableWidgetItem(header))
+
+    def suspend_row_resizing(self):
+        """
+        Stops rows from being resized to their contents until
+        resume_row_resizing() is called. Calls may be nested.
+        """
+        if self._row_resizing_suspended == 0:
+            self.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self._row_resizing_suspended += 1
+
+    def resume_row_resizing(self):
+        """
+        Restores resizing rows to their contents once every suspension has
+        been resumed. All rows are measured once at that point.
+        """
+        self._row_resizing_suspended -= 1
+        if self._row_resizing_suspended == 0:
+            self.verticalHeader().setSectionResizeMode(self._get_row_resize_mode())
+            if self._rows_to_fit:
+                self._fit_rows_timer.start()
+
+    def set_rows(self, first_row, rows):
+        """
+        Sets a batch of rows, adding rows if the table is shorter. Repainting
+        and row resizing are suspended until the whole batch is set.
+
+        Parameters:
+            first_row - index of the table row receiving the first row.
+            rows - 2D list of table data, None for empty cells
+        """
+        with self.batch_update():
+            if self.rowCount() < first_row + len(rows):
+                self.setRowCount(first_row + len(rows))
+            set_item = self.setItem
+            for row_ix, row in enumerate(rows, first_row):
+                for col_ix, cell_data in enumerate(row):
+                    if cell_data is not None:
+                        set_item(row_ix, col_ix, QTableWidgetItem(cell_data))
+
+    def set_table_data(self, table_data):
+        """
+        Sets the table data of the view. Each distinct value is decoded once
+        from the table data. Repainting and row resizing are suspended until
+        every cell is set.
+
+        Parameters:
+            TableDataEntity holding the table data
+        """
+        values = table_data.values
+        row_range = range(min(self.rowCount(), len(table_data)))
+        set_item = self.setItem
+        with self.batch_update():
+            for col_ix, value_ids in enumerate(table_data.columns[:self.columnCount()]):
+                for row_ix in row_range:
+                    value_id = value_ids[row_ix]
+                    if value_id:
+                        set_item(row_ix, col_ix, QTableWidgetItem(values[value_id]))
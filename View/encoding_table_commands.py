@@ -0,0 +1,711 @@
+import sys
+from array import array
+
+from PySide6.QtGui import QUndoCommand
+
+# Approximate number of bytes held by one cell of undo data besides its text.
+CELL_OVERHEAD = 72
+
+# Number of table rows whose insertRows() or removeRows() call takes about as
+# long as moving the item of one cell to another row.
+SHIFTED_CELL_COST = 2500
+
+
+def _cells_size(cells):
+    """
+    Estimates the number of bytes held by a sequence of cell tuples.
+
+    Parameters:
+        cells - sequence of tuples whose string members are cell texts.
+    """
+    size = 0
+    for cell in cells:
+        size += CELL_OVERHEAD
+        for value in cell:
+            if isinstance(value, str):
+                size += sys.getsizeof(value)
+    return size
+
+
+def group_ranges(indices):
+    """
+    Groups row or column indices into contiguous ranges.
+
+    Parameters:
+        indices - iterable of indices.
+
+    Returns:
+        List of (first index, count) pairs in ascending order.
+    """
+    ranges = []
+    for ix in sorted(set(indices)):
+        if ranges and ranges[-1][0] + ranges[-1][1] == ix:
+            ranges[-1] = (ranges[-1][0], ranges[-1][1] + 1)
+        else:
+            ranges.append((ix, 1))
+    return ranges
+
+
+def _should_shift_rows(table, ranges):
+    """
+    Determines whether ranges of rows are cheaper to insert or remove by
+    shifting the items of the rows below them than one range at a time. Each
+    insertRows() or removeRows() call on a QTableWidget takes time proportional
+    to its row count, so scattered selections of a large table add up to many
+    slow calls, while shifting takes time proportional to the shifted items.
+
+    Parameters:
+        table - EncodingTable to edit.
+        ranges - list of (first row, count) in ascending order.
+    """
+    row_count = table.rowCount()
+    shifted_cells = (row_count - ranges[0][0]) * table.columnCount()
+    return len(ranges) * row_count > SHIFTED_CELL_COST * shifted_cells
+
+
+def _insert_row_ranges(table, ranges, payload=None):
+    """
+    Inserts ranges of rows, optionally filled with cells.
+
+    Parameters:
+        table - EncodingTable to edit.
+        ranges - list of (first row, count) in ascending order, as positioned
+            once every range is inserted.
+        payload - list of the sparse rows of each range, None for empty rows.
+    """
+    with table.batch_update():
+        if len(ranges) > 1 and _should_shift_rows(table, ranges):
+            _shift_rows_down(table, ranges)
+        else:
+            for first_row, count in ranges:
+                table.model().insertRows(first_row, count)
+        if payload:
+            for (first_row, _), rows in zip(ranges, payload):
+                table.write_rows(first_row, rows)
+
+
+def _remove_row_ranges(table, ranges):
+    """
+    Removes ranges of rows, starting from the bottom so that indices stay valid.
+
+    Parameters:
+        table - EncodingTable to edit.
+        ranges - list of (first row, count) in ascending order.
+    """
+    with table.batch_update():
+        if len(ranges) > 1 and _should_shift_rows(table, ranges):
+            _shift_rows_up(table, ranges)
+        else:
+            for first_row, count in reversed(ranges):
+                table.model().removeRows(first_row, count)
+
+
+def _shift_rows_down(table, ranges):
+    """
+    Inserts ranges of empty rows by appending the rows at the end of the table
+    in one call, then moving the items of every row below a range down.
+
+    Parameters:
+        table - EncodingTable to edit.
+        ranges - list of (first row, count) in ascending order, as positioned
+            once every range is inserted.
+    """
+    take_item = table.takeItem
+    set_item = table.setItem
+    columns = range(table.columnCount())
+    old_row_count = table.rowCount()
+    table.model().insertRows(old_row_count, sum(count for _, count in ranges))
+
+    # Walk the rows from the bottom, so that every row moves into a row that
+    # was already emptied.
+    range_ix = len(ranges) - 1
+    destination_row = table.rowCount() - 1
+    for row in range(old_row_count - 1, -1, -1):
+        while range_ix >= 0 and destination_row < ranges[range_ix][0] + ranges[range_ix][1]:
+            destination_row = ranges[range_ix][0] - 1
+            range_ix -= 1
+        if range_ix < 0:
+            break
+        for column in columns:
+            item = take_item(row, column)
+            if item is not None:
+                set_item(destination_row, column, item)
+        destination_row -= 1
+
+
+def _shift_rows_up(table, ranges):
+    """
+    Removes ranges of rows by moving the items of every remaining row below a
+    range up, then removing the rows left over at the end of the table in one call.
+
+    Parameters:
+        table - EncodingTable to edit.
+        ranges - list of (first row, count) in ascending order.
+    """
+    take_item = table.takeItem
+    set_item = table.setItem
+    columns = range(table.columnCount())
+    row_count = table.rowCount()
+
+    range_ix = 0
+    removed_count = 0
+    row = ranges[0][0]
+    while row < row_count:
+        if range_ix < len(ranges) and row == ranges[range_ix][0]:
+            # Take the items of the removed rows, so that no item is left in the
+            # rows that remaining rows move into.
+            for removed_row in range(row, row + ranges[range_ix][1]):
+                for column in columns:
+                    take_item(removed_row, column)
+            removed_count += ranges[range_ix][1]
+            row += ranges[range_ix][1]
+            range_ix += 1
+            continue
+        for column in columns:
+            item = take_item(row, column)
+            if item is not None:
+                set_item(row - removed_count, column, item)
+        row += 1
+    table.model().removeRows(row_count - removed_count, removed_count)
+
+
+def _move_row(table, source_row, destination_row):
+    """
+    Moves a single row.
+
+    Parameters:
+        table - EncodingTable to edit.
+        source_row - index of the row.
+        destination_row - index of the row once it is moved.
+    """
+    cells = table.read_rows(source_row, 1)
+    table.model().removeRows(source_row, 1)
+    table.model().insertRows(destination_row, 1)
+    table.write_rows(destination_row, cells)
+
+
+def _permute_rows(table, first_row, sources):
+    """
+    Puts consecutive rows in a new order by moving their items.
+
+    Parameters:
+        table - EncodingTable to edit.
+        first_row - index of the first row.
+        sources - for each row from the first row on, the row whose items it receives.
+    """
+    take_item = table.takeItem
+    set_item = table.setItem
+    columns = range(table.columnCount())
+    items = [[take_item(row, column) for column in columns] for row in range(first_row, first_row + len(sources))]
+    for row, source_row in enumerate(sources, first_row):
+        for column, item in zip(columns, items[source_row - first_row]):
+            if item is not None:
+                set_item(row, column, item)
+
+
+class EncodingTableCommand(QUndoCommand):
+    """
+    EncodingTableCommand is the base of the undoable edits of an encoding
+    table. A command holds only the difference it makes to the table, and
+    can release that data when the undo history runs out of memory, after
+    which it can no longer be undone. The size of the data is measured
+    whenever the data changes, rather than each time it is asked for.
+    """
+
+    def __init__(self, table, text):
+        """
+        Constructor - Creates an instance of EncodingTableCommand
+
+        Parameters:
+            table - EncodingTable the command edits.
+            text - description of the command.
+        """
+        super().__init__(text)
+        self._table = table
+        self._evicted = False
+        self._byte_size = CELL_OVERHEAD
+
+    def byte_size(self):
+        """
+        Gets the estimated number of bytes of undo data held by the command.
+        """
+        return self._byte_size
+
+    def evict(self):
+        """
+        Releases the undo data of the command.
+        """
+        self._evicted = True
+        self._release_data()
+        self._byte_size = 0
+
+    def is_evicted(self):
+        """
+        Determines whether the undo data of the command was released.
+        """
+        return self._evicted
+
+    def _measure(self):
+        """
+        Measures the size of the command's undo data after it changed.
+        """
+        self._byte_size = 0 if self._evicted else CELL_OVERHEAD + self._data_size()
+
+    def _data_size(self):
+        """
+        Estimates the number of bytes of the command's undo data.
+        """
+        return 0
+
+    def _release_data(self):
+        """
+        Drops the command's undo data.
+        """
+
+
+class SetCellsCommand(EncodingTableCommand):
+    """
+    SetCellsCommand changes the text of any number of cells. Consecutive edits
+    of the same single cell merge into one command.
+    """
+    MERGE_ID = 1
+
+    def __init__(self, table, cells, text, merge=False):
+        """
+        Constructor - Creates an instance of SetCellsCommand
+
+        Parameters:
+            table - EncodingTable the command edits.
+            cells - list of (row, column, old text, new text), None for empty cells.
+            text - description of the command.
+            merge - whether the command merges with following edits of its cell.
+        """
+        super().__init__(table, text)
+        self._cells = cells
+        self._merge = merge and len(cells) == 1
+        self._measure()
+
+    def id(self):
+        """
+        Gets the merge id of the command, -1 if the command does not merge.
+        """
+        return self.MERGE_ID if self._merge else -1
+
+    def mergeWith(self, other):
+        """
+        Merges a following edit of the same cell into this command.
+
+        Parameters:
+            other - the following command.
+        """
+        if self._evicted or not isinstance(other, SetCellsCommand):
+            return False
+        row, column, old_text, _ = self._cells[0]
+        other_row, other_column, _, new_text = other._cells[0]
+        if (row, column) != (other_row, other_column):
+            return False
+        self._cells = [(row, column, old_text, new_text)]
+        self._measure()
+        # An edit that was typed back to the original text is dropped from the history.
+        self.setObsolete(old_text == new_text)
+        return True
+
+    def redo(self):
+        """
+        Sets the new texts of the cells.
+        """
+        with self._table.batch_update(len(self._cells) > 1):
+            for row, column, _, new_text in self._cells:
+                self._table.write_cell(row, column, new_text)
+
+    def undo(self):
+        """
+        Restores the old texts of the cells.
+        """
+        with self._table.batch_update(len(self._cells) > 1):
+            for row, column, old_text, _ in reversed(self._cells):
+                self._table.write_cell(row, column, old_text)
+
+    def _data_size(self):
+        return _cells_size(self._cells)
+
+    def _release_data(self):
+        self._cells = []
+
+
+class InsertRowsCommand(EncodingTableCommand):
+    """
+    InsertRowsCommand inserts any number of ranges of rows into the table,
+    optionally filled with cells.
+    """
+
+    def __init__(self, table, ranges, text, payload=None):
+        """
+        Constructor - Creates an instance of InsertRowsCommand
+
+        Parameters:
+            table - EncodingTable the command edits.
+            ranges - list of (first row, count) in ascending order, as positioned
+                once every range is inserted.
+            text - description of the command.
+            payload - list of the sparse rows of each range, each a tuple of
+                (column, text), None for empty rows.
+        """
+        super().__init__(table, text)
+        self._ranges = ranges
+        self._payload = payload
+        self._measure()
+
+    def redo(self):
+        """
+        Inserts the rows.
+        """
+        _insert_row_ranges(self._table, self._ranges, self._payload)
+
+    def undo(self):
+        """
+        Removes the inserted rows.
+        """
+        _remove_row_ranges(self._table, self._ranges)
+
+    def _data_size(self):
+        return sum(_cells_size(row) for rows in self._payload or () for row in rows)
+
+    def _release_data(self):
+        self._payload = None
+
+
+class RemoveRowsCommand(EncodingTableCommand):
+    """
+    RemoveRowsCommand removes any set of rows. Contiguous rows are removed
+    together, and only the cells of the removed rows are kept for undoing.
+    """
+
+    def __init__(self, table, rows, text):
+        """
+        Constructor - Creates an instance of RemoveRowsCommand
+
+        Parameters:
+            table - EncodingTable the command edits.
+            rows - iterable of indices of the rows to remove.
+            text - description of the command.
+        """
+        super().__init__(table, text)
+        self._ranges = group_ranges(rows)
+        self._payload = None  # sparse rows of each range, read when first removed
+
+    def redo(self):
+        """
+        Removes the rows, starting from the bottom so that indices stay valid.
+        """
+        table = self._table
+        if self._payload is None:
+            self._payload = [table.read_rows(first_row, count) for first_row, count in self._ranges]
+            self._measure()
+        _remove_row_ranges(table, self._ranges)
+
+    def undo(self):
+        """
+        Inserts the removed rows back with their cells.
+        """
+        _insert_row_ranges(self._table, self._ranges, self._payload)
+
+    def _data_size(self):
+        return sum(_cells_size(row) for rows in self._payload or () for row in rows)
+
+    def _release_data(self):
+        self._payload = []
+
+
+class MoveRowsCommand(EncodingTableCommand):
+    """
+    MoveRowsCommand moves ranges of rows up or down by one row. Rather than
+    rewriting a moved range, the single row next to it is moved to its other
+    side, so the moved rows keep their cells, and their selection, untouched.
+    """
+
+    def __init__(self, table, ranges, offset, text):
+        """
+        Constructor - Creates an instance of MoveRowsCommand
+
+        Parameters:
+            table - EncodingTable the command edits.
+            ranges - list of (first row, count) of the moved rows, separated by
+                at least one row that is not moved.
+            offset - -1 to move the rows up, 1 to move them down.
+            text - description of the command.
+        """
+        super().__init__(table, text)
+        self._ranges = ranges
+        self._offset = offset
+
+    def redo(self):
+        """
+        Moves the rows.
+        """
+        with self._table.batch_update():
+            for first_row, count in self._ranges:
+                if self._offset < 0:
+                    _move_row(self._table, first_row - 1, first_row - 1 + count)
+                else:
+                    _move_row(self._table, first_row + count, first_row)
+
+    def undo(self):
+        """
+        Moves the rows back.
+        """
+        with self._table.batch_update():
+            for first_row, count in self._ranges:
+                if self._offset < 0:
+                    _move_row(self._table, first_row - 1 + count, first_row - 1)
+                else:
+                    _move_row(self._table, first_row, first_row + count)
+
+
+class ReorderRowsCommand(EncodingTableCommand):
+    """
+    ReorderRowsCommand moves single rows to other positions, one after the
+    other, or puts many rows in a new order at once. Moved rows are
+    rewritten, and the rows between them and their destinations are left
+    untouched. A new order only moves the items of the rows from the first
+    to the last row whose place changes.
+    """
+
+    def __init__(self, table, moves, text, order=None):
+        """
+        Constructor - Creates an instance of ReorderRowsCommand
+
+        Parameters:
+            table - EncodingTable the command edits.
+            moves - list of (source row, destination row), applied in order.
+            text - description of the command.
+            order - list of every row in its new order, applied after the moves, or None.
+        """
+        super().__init__(table, text)
+        self._moves = moves
+        self._first_row = 0
+        self._sources = array("I")  # row each row from the first row on receives
+        if order is not None:
+            changed_rows = [row for row, source_row in enumerate(order) if row != source_row]
+            if changed_rows:
+                self._first_row = changed_rows[0]
+                self._sources = array("I", order[changed_rows[0]:changed_rows[-1] + 1])
+        self._measure()
+
+    def redo(self):
+        """
+        Moves the rows.
+        """
+        with self._table.batch_update():
+            for source_row, destination_row in self._moves:
+                _move_row(self._table, source_row, destination_row)
+            if self._sources:
+                _permute_rows(self._table, self._first_row, self._sources)
+
+    def undo(self):
+        """
+        Moves the rows back, in reverse order.
+        """
+        with self._table.batch_update():
+            if self._sources:
+                # Each row goes back to the row it was received from.
+                sources = array("I", bytes(4 * len(self._sources)))
+                for row, source_row in enumerate(self._sources, self._first_row):
+                    sources[source_row - self._first_row] = row
+                _permute_rows(self._table, self._first_row, sources)
+            for source_row, destination_row in reversed(self._moves):
+                _move_row(self._table, destination_row, source_row)
+
+    def _data_size(self):
+        return CELL_OVERHEAD * len(self._moves) + self._sources.itemsize * len(self._sources)
+
+
+class InsertColumnsCommand(EncodingTableCommand):
+    """
+    InsertColumnsCommand inserts any number of ranges of empty columns into the table.
+    """
+
+    def __init__(self, table, ranges, text):
+        """
+        Constructor - Creates an instance of InsertColumnsCommand
+
+        Parameters:
+            table - EncodingTable the command edits.
+            ranges - list of (first column, count) in ascending order, as
+                positioned once every range is inserted.
+            text - description of the command.
+        """
+        super().__init__(table, text)
+        self._ranges = ranges
+
+    def redo(self):
+        """
+        Inserts the columns.
+        """
+        with self._table.batch_update():
+            for first_column, count in self._ranges:
+                self._table.model().insertColumns(first_column, count)
+
+    def undo(self):
+        """
+        Removes the inserted columns, starting from the right so that indices stay valid.
+        """
+        with self._table.batch_update():
+            for first_column, count in reversed(self._ranges):
+                self._table.model().removeColumns(first_column, count)
+
+
+class RemoveColumnsCommand(EncodingTableCommand):
+    """
+    RemoveColumnsCommand removes any set of columns along with their headers.
+    Only the cells of the removed columns are kept for undoing.
+    """
+
+    def __init__(self, table, columns, text):
+        """
+        Constructor - Creates an instance of RemoveColumnsCommand
+
+        Parameters:
+            table - EncodingTable the command edits.
+            columns - iterable of indices of the columns to remove.
+            text - description of the command.
+        """
+        super().__init__(table, text)
+        self._ranges = group_ranges(columns)
+        self._payload = None  # (header, sparse column) of each removed column
+
+    def redo(self):
+        """
+        Removes the columns, starting from the right so that indices stay valid.
+        """
+        table = self._table
+        if self._payload is None:
+            self._payload = [[(table.read_header(column), table.read_column(column))
+                              for column in range(first_column, first_column + count)]
+                             for first_column, count in self._ranges]
+            self._measure()
+        with table.batch_update():
+            for first_column, count in reversed(self._ranges):
+                table.model().removeColumns(first_column, count)
+
+    def undo(self):
+        """
+        Inserts the removed columns back with their headers and cells.
+        """
+        table = self._table
+        with table.batch_update():
+            for (first_column, count), columns in zip(self._ranges, self._payload):
+                table.model().insertColumns(first_column, count)
+                for column, (header, cells) in enumerate(columns, first_column):
+                    table.write_header(column, header)
+                    for row, text in cells:
+                        table.write_cell(row, column, text)
+
+    def _data_size(self):
+        return sum(_cells_size(cells) + CELL_OVERHEAD for columns in self._payload or ()
+                   for _, cells in columns)
+
+    def _release_data(self):
+        self._payload = []
+
+
+class RenameHeaderCommand(EncodingTableCommand):
+    """
+    RenameHeaderCommand changes the header of a column.
+    """
+
+    def __init__(self, table, column, old_header, new_header):
+        """
+        Constructor - Creates an instance of RenameHeaderCommand
+
+        Parameters:
+            table - EncodingTable the command edits.
+            column - index of the column.
+            old_header - header before the rename, None if the column had none.
+            new_header - header after the rename.
+        """
+        super().__init__(table, f'Rename column to "{new_header}"')
+        self._column = column
+        self._old_header = old_header
+        self._new_header = new_header
+
+    def redo(self):
+        """
+        Sets the new header.
+        """
+        self._table.write_header(self._column, self._new_header)
+
+    def undo(self):
+        """
+        Restores the old header.
+        """
+        self._table.write_header(self._column, self._old_header)
+
+
+class AppendRowsCommand(EncodingTableCommand):
+    """
+    AppendRowsCommand records rows that were already written below the table's
+    data, such as by an import, so that they can be undone as one command. The
+    written cells are only read when the command is undone, so the command
+    holds no data until then.
+    """
+
+    def __init__(self, table, first_row, row_count, headers, text):
+        """
+        Constructor - Creates an instance of AppendRowsCommand
+
+        Parameters:
+            table - EncodingTable the command edits.
+            first_row - index of the first written row.
+            row_count - number of rows of the table before the rows were written.
+            headers - list of the table's headers before the rows were written.
+            text - description of the command.
+        """
+        super().__init__(table, text)
+        self._first_row = first_row
+        self._row_count = row_count
+        self._headers = headers
+        self._applied = True
+        self._rows = None
+        self._new_headers = None
+        self._measure()
+
+    def redo(self):
+        """
+        Writes the rows back, unless they are already in the table.
+        """
+        if self._applied:
+            return
+        table = self._table
+        with table.batch_update():
+            table.setColumnCount(len(self._new_headers))
+            for column, header in enumerate(self._new_headers):
+                table.write_header(column, header)
+            table.setRowCount(max(self._row_count, self._first_row + len(self._rows)))
+            table.write_rows(self._first_row, self._rows)
+        self._rows = None
+        self._applied = True
+        self._measure()
+
+    def undo(self):
+        """
+        Reads the written rows and clears them from the table.
+        """
+        table = self._table
+        with table.batch_update():
+            self._new_headers = [table.read_header(column) for column in range(table.columnCount())]
+            self._rows = table.read_rows(self._first_row, table.rowCount() - self._first_row)
+            table.model().removeRows(self._first_row, table.rowCount() - self._first_row)
+            table.setRowCount(self._row_count)
+            table.setColumnCount(len(self._headers))
+            for column, header in enumerate(self._headers):
+                table.write_header(column, header)
+        self._applied = False
+        self._measure()
+
+    def _data_size(self):
+        size = sum(_cells_size(row) for row in self._rows) if self._rows is not None else 0
+        return size + _cells_size([self._headers, self._new_headers or ()])
+
+    def _release_data(self):
+        self._rows = None
@@ -0,0 +1,241 @@
+from PySide6.QtCore import QAbstractProxyModel, QEvent, QModelIndex, QSize, Qt
+from PySide6.QtGui import QBrush, QColor, QFontMetrics
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem, QToolTip
+
+
+class EncodingTableDelegate(QStyledItemDelegate):
+    """
+    EncodingTableDelegate draws and edits the cells of an encoding table. It
+    owns the cells' font, padding and minimum height, so that changing them
+    only repaints and measures cells again instead of re-polishing the whole
+    table through a stylesheet. Edited text is committed to the table as an
+    undoable command instead of being written to the model directly, both in
+    the table itself and in views filtering it.
+    """
+    HIGHLIGHT_COLOR = QColor(255, 236, 153)
+    PLAYBACK_COLOR = QColor(180, 215, 255)
+
+    def __init__(self, table, parent=None):
+        """
+        Constructor - Creates an instance of EncodingTableDelegate
+
+        Parameters:
+            table - EncodingTable whose cells are edited.
+            parent - owner of the delegate.
+        """
+        super().__init__(parent)
+        self._table = table
+        self._font = None  # None for the font of the view
+        self._font_metrics = None  # metrics of the font, measured once per font change
+        self._padding = 0
+        self._minimum_height = 0
+        self._highlighted_rows = frozenset()  # table rows drawn with the highlight color
+        self._highlight_brush = QBrush(self.HIGHLIGHT_COLOR)
+        self._playback_row = None  # table row at the video's position, drawn with the playback color
+        self._playback_brush = QBrush(self.PLAYBACK_COLOR)
+
+    def font(self):
+        """
+        Gets the font of the cells, None if cells use the font of the view.
+        """
+        return self._font
+
+    def padding(self):
+        """
+        Gets the padding around the content of each cell in pixels.
+        """
+        return self._padding
+
+    def minimum_height(self):
+        """
+        Gets the minimum height of the cells in pixels.
+        """
+        return self._minimum_height
+
+    def line_height(self, default_font):
+        """
+        Gets the height of a cell holding one line of text.
+
+        Parameters:
+            default_font - font of the view, used if the cells have no font of their own.
+        """
+        font_metrics = self._font_metrics or QFontMetrics(default_font)
+        return max(font_metrics.height() + 2 * self._padding, self._minimum_height)
+
+    def set_style(self, font=None, padding=None, minimum_height=None):
+        """
+        Changes how cells are drawn and measured. Views using the delegate lay
+        out their cells again once, however many settings change.
+
+        Parameters:
+            font - font of the cells, None to keep the current font.
+            padding - padding around the content of each cell in pixels, None to keep it.
+            minimum_height - minimum height of the cells in pixels, None to keep it.
+        """
+        if font is not None:
+            self._font = font
+            self._font_metrics = QFontMetrics(font)
+        if padding is not None:
+            self._padding = padding
+        if minimum_height is not None:
+            self._minimum_height = minimum_height
+        self.sizeHintChanged.emit(QModelIndex())
+
+    def set_highlighted_rows(self, rows):
+        """
+        Sets the table rows whose cells are drawn with the highlight color.
+
+        Parameters:
+            rows - iterable of row indices of the table.
+
+        Returns:
+            Whether the highlighted rows changed.
+        """
+        rows = frozenset(rows)
+        if rows == self._highlighted_rows:
+            return False
+        self._highlighted_rows = rows
+        return True
+
+    def playback_row(self):
+        """
+        Gets the table row drawn with the playback color, None for no row.
+        """
+        return self._playback_row
+
+    def set_playback_row(self, row):
+        """
+        Sets the table row drawn with the playback color, which is drawn over
+        the highlight color.
+
+        Parameters:
+            row - row index of the table, None for no row.
+        """
+        self._playback_row = row
+
+    def initStyleOption(self, option, index):
+        """
+        Fills in the style option of a cell, using the font of the cells and
+        the highlight and playback colors of their rows.
+
+        Parameters:
+            option - style option to fill in.
+            index - model index of the cell.
+        """
+        super().initStyleOption(option, index)
+        if self._font is not None:
+            option.font = self._font
+            option.fontMetrics = self._font_metrics
+        if self._highlighted_rows or self._playback_row is not None:
+            model = index.model()
+            row = model.mapToSource(index).row() if isinstance(model, QAbstractProxyModel) else index.row()
+            if row == self._playback_row:
+                option.backgroundBrush = self._playback_brush
+            elif row in self._highlighted_rows:
+                option.backgroundBrush = self._highlight_brush
+
+    def paint(self, painter, option, index):
+        """
+        Draws a cell, insetting its content by the padding.
+
+        Parameters:
+            painter - painter of the view.
+            option - style option of the cell.
+            index - model index of the cell.
+        """
+        if self._padding == 0:
+            super().paint(painter, option, index)
+            return
+
+        option = QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        # The background fills the whole cell, while the content is inset.
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, widget)
+        padding = self._padding
+        option.rect = option.rect.adjusted(padding, padding, -padding, -padding)
+        style.drawControl(QStyle.CE_ItemViewItem, option, painter, widget)
+
+    def sizeHint(self, option, index):
+        """
+        Measures a cell with its padding and minimum height.
+
+        Parameters:
+            option - style option of the cell.
+            index - model index of the cell.
+        """
+        padding = 2 * self._padding
+        if not index.data():
+            # Empty cells, which most rows of a coding table have, are measured
+            # from the font metrics alone without laying out any text.
+            font_metrics = self._font_metrics or option.fontMetrics
+            return QSize(padding, max(font_metrics.height() + padding, self._minimum_height))
+        size = super().sizeHint(option, index)
+        return QSize(size.width() + padding, max(size.height() + padding, self._minimum_height))
+
+    def helpEvent(self, event, view, option, index):
+        """
+        Shows the full text of a cell whose text does not fit it as a tooltip.
+
+        Parameters:
+            event - help event of the view.
+            view - view the event occurred in.
+            option - style option of the cell.
+            index - model index of the cell.
+        """
+        if event.type() == QEvent.ToolTip:
+            text = index.data()
+            if text and not self._fits(text, option):
+                QToolTip.showText(event.globalPos(), text, view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+    def _fits(self, text, option):
+        """
+        Determines whether the text of a cell is shown in full, rather than
+        being elided.
+
+        Parameters:
+            text - text of the cell.
+            option - style option of the cell.
+        """
+        font_metrics = self._font_metrics or option.fontMetrics
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        # The style keeps a margin on either side of the text.
+        text_margin = style.pixelMetric(QStyle.PM_FocusFrameHMargin, None, widget) + 1
+        rect = option.rect.adjusted(self._padding + text_margin, self._padding,
+                                    -self._padding - text_margin, -self._padding)
+        flags = Qt.TextWordWrap if option.features & QStyleOptionViewItem.WrapText else 0
+        bounds = font_metrics.boundingRect(rect.x(), rect.y(), rect.width(), 1 << 20, flags, text)
+        return bounds.width() <= rect.width() and bounds.height() <= rect.height()
+
+    def createEditor(self, parent, option, index):
+        """
+        Creates the editor of a cell, using the font of the cells.
+
+        Parameters:
+            parent - parent widget of the editor.
+            option - style option of the cell.
+            index - model index of the cell.
+        """
+        editor = super().createEditor(parent, option, index)
+        if editor is not None and self._font is not None:
+            editor.setFont(self._font)
+        return editor
+
+    def setModelData(self, editor, model, index):
+        """
+        Commits the text of a cell editor to the table.
+
+        Parameters:
+            editor - editor widget of the cell.
+            model - model of the view the cell was edited in.
+            index - model index of the edited cell.
+        """
+        if isinstance(model, QAbstractProxyModel):
+            index = model.mapToSource(index)
+        user_property = editor.metaObject().userProperty()
+        text = editor.property(user_property.name()) if user_property.isValid() else None
+        self._table.set_cells([(index.row(), index.column(), str(text) if text else None)], "Edit cell", merge=True)
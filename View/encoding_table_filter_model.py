@@ -0,0 +1,111 @@
+from PySide6.QtCore import QSortFilterProxyModel
+
+
+class EncodingTableFilterModel(QSortFilterProxyModel):
+    """
+    EncodingTableFilterModel shows the rows of the encoding table that match a
+    search. Matching rows are looked up in the table's search index instead of
+    being compared cell by cell, and rows edited while the search is shown are
+    matched again on their own. The model is only attached to the table while
+    a search is shown, so that it does not track edits at other times. During
+    a batch of edits the matches are only brought up to date once the whole
+    batch is made.
+    """
+
+    def __init__(self, search_index, table_model):
+        """
+        Constructor - Creates an instance of EncodingTableFilterModel
+
+        Parameters:
+            search_index - TableSearchIndex of the encoding table.
+            table_model - item model of the encoding table.
+        """
+        super().__init__()
+        self._search_index = search_index
+        self._table_model = table_model
+        self._query = None
+        self._matches = set()
+        self._batch_depth = 0
+
+    def begin_batch(self):
+        """
+        Stops matching edited rows until end_batch() is called. Rows inserted
+        meanwhile are hidden until then.
+        """
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """
+        Matches the rows edited during a batch, filtering the rows again if
+        any of them started or stopped matching.
+        """
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._query is not None and self._search_index.is_outdated():
+            if self._refresh_matches():
+                self.invalidateRowsFilter()
+
+    def set_query(self, query):
+        """
+        Filters the rows with a search query.
+
+        Parameters:
+            query - SearchQuery to filter with, None to show every row.
+        """
+        self._query = query
+        if query is None:
+            self._matches = set()
+            self.setSourceModel(None)
+            return
+
+        self._matches = self._search_index.search(query)
+        if self.sourceModel() is None:
+            # The search index connected to the table first, so it sees row
+            # changes before this model filters them.
+            self.setSourceModel(self._table_model)
+        else:
+            self.invalidateRowsFilter()
+
+    def match_count(self):
+        """
+        Gets the number of rows matching the current query.
+        """
+        return self.rowCount() if self._query is not None else self._table_model.rowCount()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        """
+        Determines whether a row of the encoding table matches the current query.
+
+        Parameters:
+            source_row - index of the row in the encoding table.
+            source_parent - parent index of the row, unused by tables.
+        """
+        if self._query is None:
+            return True
+        if self._batch_depth == 0 and self._search_index.is_outdated():
+            self._refresh_matches()
+        return self._search_index.row_key(source_row) in self._matches
+
+    def _refresh_matches(self):
+        """
+        Brings the matching rows up to date with the rows edited since the
+        last search.
+
+        Returns:
+            Whether any row started or stopped matching.
+        """
+        search_index = self._search_index
+        updated_keys = search_index.update()
+        if updated_keys is None:
+            matches = search_index.search(self._query)
+            changed = matches != self._matches
+            self._matches = matches
+            return changed
+        changed = False
+        for key in updated_keys:
+            if search_index.row_matches(key, self._query):
+                changed |= key not in self._matches
+                self._matches.add(key)
+            elif key in self._matches:
+                changed = True
+                self._matches.discard(key)
+        return changed
@@ -1,5 +1,5 @@
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QAction
+from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import QMainWindow, QStyle, QHBoxLayout, QWidget, QVBoxLayout, QMessageBox, QScrollArea
 
 from View.coding_assistance_panel import CodingAssistancePanel
@@ -77,6 +77,177 @@ class MainWindow(QMainWindow):
         """
         self._open_settings_dialog_action.triggered.connect(slot)
 
+    def connect_import_file_to_slot(self, slot):
+        """
+        Connects the "import table data" menu action to the given slot method.
+
+        Parameters:
+            slot: The handler function that is called when the action is triggered.
+        """
+        self._import_action.triggered.connect(slot)
+
+    def connect_undo_to_slot(self, slot):
+        """
+        Connects the "undo" menu action to the given slot method.
+
+        Parameters:
+            slot: The handler function that is called when the action is triggered.
+        """
+        self._undo_action.triggered.connect(slot)
+
+    def connect_redo_to_slot(self, slot):
+        """
+        Connects the "redo" menu action to the given slot method.
+
+        Parameters:
+            slot: The handler function that is called when the action is triggered.
+        """
+        self._redo_action.triggered.connect(slot)
+
+    def set_undo_redo_enabled(self, undo_enabled, redo_enabled):
+        """
+        Enables or disables the undo and redo menu actions.
+
+        Parameters:
+            undo_enabled: whether there is an edit to undo.
+            redo_enabled: whether there is an edit to redo.
+        """
+        self._undo_action.setEnabled(undo_enabled)
+        self._redo_action.setEnabled(redo_enabled)
+
+    def connect_table_edit_to_slot(self, action_id, slot):
+        """
+        Connects an action of the Edit menu that changes the rows or columns
+        of the encoding table to the given slot method.
+
+        Parameters:
+            action_id: one of "insert_rows", "duplicate_rows", "delete_rows",
+                "move_rows_up", "move_rows_down", "insert_columns" or "delete_columns".
+            slot: The handler function that is called when the action is triggered.
+        """
+        self._table_edit_actions[action_id].triggered.connect(slot)
+
+    def connect_add_angle_to_slot(self, slot):
+        """
+        Connects the "add camera angle" menu action to the given slot method.
+
+        Parameters:
+            slot: The handler function that is called when the action is triggered.
+        """
+        self._add_angle_action.triggered.connect(slot)
+
+    def connect_add_media_to_slot(self, slot):
+        """
+        Connects the "add media to playlist" menu action to the given slot method.
+
+        Parameters:
+            slot: The handler function that is called when the action is triggered.
+        """
+        self._add_media_action.triggered.connect(slot)
+
+    def connect_remove_media_to_slot(self, slot):
+        """
+        Connects the "remove media from playlist" menu action to the given slot method.
+
+        Parameters:
+            slot: The handler function that is called when the action is triggered.
+        """
+        self._remove_media_action.triggered.connect(slot)
+
+    def connect_playback_to_slot(self, action_id, slot):
+        """
+        Connects an action of the Playback menu to the given slot method.
+
+        Parameters:
+            action_id: one of "play_backward", "pause", "play_forward",
+                "previous_frame", "next_frame", "mark_loop", "previous_media"
+                or "next_media".
+            slot: The handler function that is called when the action is triggered.
+        """
+        self._playback_actions[action_id].triggered.connect(slot)
+
+    def is_playback_shortcut(self, hotkey):
+        """
+        Determines whether a hotkey is taken by an action of the Playback menu.
+
+        Parameters:
+            hotkey: text of the hotkey.
+        """
+        key_sequence = QKeySequence(hotkey)
+        return any(action.shortcut() == key_sequence for action in self._playback_actions.values())
+
+    def connect_audio_only_to_slot(self, slot):
+        """
+        Connects the "audio only" menu action to the given slot method.
+
+        Parameters:
+            slot: The handler function that is called with whether the action is checked.
+        """
+        self._audio_only_action.toggled.connect(slot)
+
+    def set_audio_only_checked(self, checked):
+        """
+        Checks or unchecks the "audio only" menu action.
+
+        Parameters:
+            checked: whether only the audio of the media is played.
+        """
+        self._audio_only_action.setChecked(checked)
+
+    def connect_auto_sort_to_slot(self, slot):
+        """
+        Connects the "keep rows in time order" menu action to the given slot method.
+
+        Parameters:
+            slot: The handler function that is called with whether the action is checked.
+        """
+        self._auto_sort_action.toggled.connect(slot)
+
+    def set_auto_sort_checked(self, checked):
+        """
+        Checks or unchecks the "keep rows in time order" menu action.
+
+        Parameters:
+            checked: whether the rows are kept in time order.
+        """
+        self._auto_sort_action.setChecked(checked)
+
+    def connect_segment_coding_to_slot(self, slot):
+        """
+        Connects the "code segments" menu action to the given slot method.
+
+        Parameters:
+            slot: The handler function that is called with whether the action is checked.
+        """
+        self._segment_coding_action.toggled.connect(slot)
+
+    def set_segment_coding_checked(self, checked):
+        """
+        Checks or unchecks the "code segments" menu action.
+
+        Parameters:
+            checked: whether codes start and end segments.
+        """
+        self._segment_coding_action.setChecked(checked)
+
+    def connect_follow_playback_to_slot(self, slot):
+        """
+        Connects the "follow video in table" menu action to the given slot method.
+
+        Parameters:
+            slot: The handler function that is called with whether the action is checked.
+        """
+        self._follow_playback_action.toggled.connect(slot)
+
+    def set_follow_playback_checked(self, checked):
+        """
+        Checks or unchecks the "follow video in table" menu action.
+
+        Parameters:
+            checked: whether the table follows the video.
+        """
+        self._follow_playback_action.setChecked(checked)
+
     def connect_export_file_to_slot(self, slot):
         """
         In this case this function checks whether the Save table data button is pressed
@@ -87,12 +258,26 @@ class MainWindow(QMainWindow):
         """
         self._save_action.triggered.connect(slot)
 
+    def add_export_format_action(self, format_name, slot):
+        """
+        Adds an action for an export format to the "Export as" sub-menu and
+        connects it to the given slot method.
+
+        Parameters:
+            format_name: display name of the export format.
+            slot: The handler function that is called when the action is triggered.
+        """
+        action = self._export_as_menu.addAction(format_name)
+        action.triggered.connect(slot)
+
     def create_menu_bar(self):
         """
         Creates the main menu-bar for the application window and populates it with a
-        File sub-menu, export sub-menu, and a settings sub-menu.
+        File sub-menu, Edit sub-menu, Playback sub-menu, export sub-menu, and a settings sub-menu.
         """
         file_menu = self.menuBar().addMenu("File")
+        edit_menu = self.menuBar().addMenu("Edit")
+        playback_menu = self.menuBar().addMenu("Playback")
         settings_menu = self.menuBar().addMenu("Settings")
         # Accesses image from the resource qrc file.
         file_dialog_icon = self.style().standardIcon(QStyle.SP_FileDialogStart)
@@ -105,9 +290,77 @@ class MainWindow(QMainWindow):
         self._load_session_action = QAction(load_file_dialog_icon, "Load Saved Session", self)
         self._open_settings_dialog_action = QAction(settings_dialog_icon, "Settings", self)
         file_menu.addAction(self._open_file_dialog_action)
+        self._add_media_action = QAction(file_dialog_icon, "Add media to playlist", self)
+        file_menu.addAction(self._add_media_action)
+        self._remove_media_action = QAction("Remove media from playlist", self)
+        file_menu.addAction(self._remove_media_action)
+        self._add_angle_action = QAction(file_dialog_icon, "Add camera angle", self)
+        file_menu.addAction(self._add_angle_action)
         file_menu.addAction(self._create_session_action)
         file_menu.addAction(self._load_session_action)
+        self._import_action = QAction(load_file_dialog_icon, "Import table data", self)
+        file_menu.addAction(self._import_action)
         settings_menu.addAction(self._open_settings_dialog_action)
+        # Adds undo and redo actions for edits of the encoding table.
+        self._undo_action = QAction("Undo", self)
+        self._undo_action.setShortcut(QKeySequence.Undo)
+        self._redo_action = QAction("Redo", self)
+        self._redo_action.setShortcut(QKeySequence.Redo)
+        edit_menu.addAction(self._undo_action)
+        edit_menu.addAction(self._redo_action)
+        # Adds actions changing the selected rows and columns of the encoding table.
+        self._table_edit_actions = {}
+        for action_id, action_name, shortcut in [
+                ("insert_rows", "Insert rows", "Ctrl+Shift+R"),
+                ("duplicate_rows", "Duplicate rows", "Ctrl+D"),
+                ("delete_rows", "Delete rows", "Ctrl+Shift+Delete"),
+                ("move_rows_up", "Move rows up", "Alt+Up"),
+                ("move_rows_down", "Move rows down", "Alt+Down"),
+                ("insert_columns", "Insert columns", "Ctrl+Shift+C"),
+                ("delete_columns", "Delete columns", None)]:
+            if action_id in ("insert_rows", "insert_columns"):
+                edit_menu.addSeparator()
+            action = QAction(action_name, self)
+            if shortcut is not None:
+                action.setShortcut(QKeySequence(shortcut))
+            edit_menu.addAction(action)
+            self._table_edit_actions[action_id] = action
+        # Adds actions reviewing the video with shuttle controls, frame steps and an A-B loop, and
+        #   switching between the media files of the playlist.
+        self._playback_actions = {}
+        for action_id, action_name, shortcut in [
+                ("play_backward", "Play backwards / faster", "J"),
+                ("pause", "Pause", "K"),
+                ("play_forward", "Play forwards / faster", "L"),
+                ("previous_frame", "Previous frame", ","),
+                ("next_frame", "Next frame", "."),
+                ("mark_loop", "Mark A-B loop point", "\\"),
+                ("previous_media", "Previous media file", "Ctrl+PgUp"),
+                ("next_media", "Next media file", "Ctrl+PgDown")]:
+            if action_id in ("previous_frame", "mark_loop", "previous_media"):
+                playback_menu.addSeparator()
+            action = QAction(action_name, self)
+            action.setShortcut(QKeySequence(shortcut))
+            playback_menu.addAction(action)
+            self._playback_actions[action_id] = action
+        # Adds a toggle playing only the audio of the media, with its waveform in place of the video.
+        playback_menu.addSeparator()
+        self._audio_only_action = QAction("Audio only", self)
+        self._audio_only_action.setCheckable(True)
+        playback_menu.addAction(self._audio_only_action)
+        # Adds a toggle inserting coded events at their time position rather than below the data.
+        edit_menu.addSeparator()
+        self._auto_sort_action = QAction("Keep rows in time order", self)
+        self._auto_sort_action.setCheckable(True)
+        edit_menu.addAction(self._auto_sort_action)
+        # Adds a toggle coding segments, which a code's button starts and a second press ends.
+        self._segment_coding_action = QAction("Code segments (press a code twice)", self)
+        self._segment_coding_action.setCheckable(True)
+        edit_menu.addAction(self._segment_coding_action)
+        # Adds a toggle marking and scrolling to the table row at the video's position.
+        self._follow_playback_action = QAction("Follow video in table", self)
+        self._follow_playback_action.setCheckable(True)
+        edit_menu.addAction(self._follow_playback_action)
         # This adds a new sub-menu for exporting a file.
         export_menu = self.menuBar().addMenu("Export")
         export_dialog_icon = self.style().standardIcon(QStyle.SP_DialogSaveButton)
@@ -115,6 +368,8 @@ class MainWindow(QMainWindow):
         # Adds a Save table data button with an action.
         self._save_action = QAction(export_dialog_icon, "Save table data", self)
         export_menu.addAction(self._save_action)
+        # Holds one action per registered export format.
+        self._export_as_menu = export_menu.addMenu("Export as")
 
     def set_layout(self):
         """
@@ -1,6 +1,6 @@
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QPushButton, QStyle, \
-    QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QSizePolicy
+    QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QSizePolicy, QComboBox
 
 from View.playback_speed_combo_box import PlaybackSpeedComboBox
 
@@ -21,11 +21,32 @@ class MediaControlPanel(QWidget):
         # Create a playback speed combobox.
         self.playback_speed_combo_box = PlaybackSpeedComboBox()
 
+        # Create the list of the session's media files, hidden until one is added.
+        self.playlist_combo_box = QComboBox()
+        self.playlist_combo_box.setSizeAdjustPolicy(QComboBox.AdjustToContents)
+        self.playlist_combo_box.setToolTip("Media file playing")
+        self.playlist_combo_box.hide()
+
         # Create play pause button.
         self.play_pause_button = QPushButton()
         self.play_pause_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
         self.play_pause_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
 
+        # Create frame step buttons on either side of the play pause button.
+        self.frame_back_button = QPushButton()
+        self.frame_back_button.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipBackward))
+        self.frame_back_button.setToolTip("Previous frame")
+        self.frame_forward_button = QPushButton()
+        self.frame_forward_button.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipForward))
+        self.frame_forward_button.setToolTip("Next frame")
+
+        # Create the A-B loop button, which marks A, then B, then clears the loop.
+        self.loop_button = QPushButton()
+        self.set_loop_points(None, None)
+
+        # Create the label showing the shuttle speed.
+        self.shuttle_label = QLabel()
+
         # Create the timestamp label.
         self.time_stamp = QLabel()
         self.time_stamp.setText("00:00:00/00:00:00")
@@ -37,9 +58,70 @@ class MediaControlPanel(QWidget):
 
         # Adds the widgets to the layout.
         horizontal_layout.addWidget(self.playback_speed_combo_box)
+        horizontal_layout.addWidget(self.playlist_combo_box)
         horizontal_layout.addStretch()
+        horizontal_layout.addWidget(self.loop_button)
+        horizontal_layout.addWidget(self.frame_back_button)
         horizontal_layout.addWidget(self.play_pause_button)
+        horizontal_layout.addWidget(self.frame_forward_button)
+        horizontal_layout.addWidget(self.shuttle_label)
         horizontal_layout.addStretch()
         horizontal_layout.addWidget(self.time_stamp)
 
         self.setLayout(horizontal_layout)
+
+    def set_loop_points(self, start_text, end_text):
+        """
+        Shows the points of the A-B loop on the loop button.
+
+        Parameters:
+            start_text - timestamp of point A, None if it is not marked.
+            end_text - timestamp of point B, None if it is not marked.
+        """
+        if start_text is None:
+            self.loop_button.setText("A-B")
+            self.loop_button.setToolTip("Mark point A of a loop")
+        elif end_text is None:
+            self.loop_button.setText(f"A: {start_text}")
+            self.loop_button.setToolTip("Mark point B of the loop")
+        else:
+            self.loop_button.setText(f"A-B: {start_text} - {end_text}")
+            self.loop_button.setToolTip("Clear the loop")
+
+    def set_shuttle_speed(self, speed):
+        """
+        Shows the shuttle speed next to the play pause button.
+
+        Parameters:
+            speed - shuttle speed, negative backwards and 0 when stopped.
+        """
+        if speed > 0:
+            self.shuttle_label.setText(f"\u25b6 {speed:g}x")
+        elif speed < 0:
+            self.shuttle_label.setText(f"\u25c0 {-speed:g}x")
+        else:
+            self.shuttle_label.setText("")
+
+    def set_playlist(self, titles, current_index):
+        """
+        Shows the media files of the session, selecting the one playing.
+
+        Parameters:
+            titles - title of each media file, in order.
+            current_index - index of the media file playing, -1 for none.
+        """
+        self.playlist_combo_box.blockSignals(True)
+        self.playlist_combo_box.clear()
+        self.playlist_combo_box.addItems(titles)
+        self.playlist_combo_box.setCurrentIndex(current_index)
+        self.playlist_combo_box.blockSignals(False)
+        self.playlist_combo_box.setVisible(bool(titles))
+
+    def connect_playlist_to_slot(self, slot):
+        """
+        Connects picking a media file from the playlist to a slot function in the controller.
+
+        Parameters:
+            slot: the handler function that is called with the index of the media file.
+        """
+        self.playlist_combo_box.activated.connect(slot)
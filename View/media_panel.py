@@ -1,15 +1,20 @@
+from PySide6.QtCore import Signal
 from PySide6.QtMultimedia import QAudioOutput
-from PySide6.QtWidgets import QWidget, QVBoxLayout
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget
 
+from View.angle_view import AngleView
 from View.media_control_panel import MediaControlPanel
 from View.ScalableScrubbingBar.scalable_scrubber_bar import ScalableScrubberBar
 from View.video_widget import VideoWidget
+from View.waveform_view import WaveformView
 
 
 class MediaPanel(QWidget):
     """
-    Container of all Media player related widgets.
+    Container of all Media player related widgets. Media files dropped onto
+    the panel are handed to the controller, if their formats can be played.
     """
+    media_dropped = Signal(list)  # QUrl of each media file dropped
 
     def __init__(self):
         """
@@ -17,19 +22,115 @@ class MediaPanel(QWidget):
         to the panel using a QVBoxLayout.
         """
         super().__init__()
+        self.setAcceptDrops(True)
+        self._drop_filter = None  # function telling whether a dropped file can be played
 
         self.video_widget = VideoWidget()
+        # Audio-only recordings show their waveform in place of the video.
+        self.waveform_view = WaveformView()
+        self.video_stack = QStackedWidget()
+        self.video_stack.addWidget(self.video_widget)
+        self.video_stack.addWidget(self.waveform_view)
         self.audio_widget = QAudioOutput()
         self.media_control_panel = MediaControlPanel()
         
         # Create sliders for the scalable scrubbing bars.
         self.scalable_scrubber_bar = ScalableScrubberBar()
 
+        # Create a row for the views of further camera angles, hidden until one is added.
+        self.angle_container = QWidget()
+        self.angle_layout = QHBoxLayout()
+        self.angle_layout.setContentsMargins(0, 0, 0, 0)
+        self.angle_container.setLayout(self.angle_layout)
+        self.angle_container.hide()
+
         # Add vertical layout box to add widgets
         vertical_layout = QVBoxLayout()
 
         vertical_layout.setSpacing(0)
-        vertical_layout.addWidget(self.video_widget, stretch=2)
+        vertical_layout.addWidget(self.video_stack, stretch=2)
+        vertical_layout.addWidget(self.angle_container, stretch=1)
         vertical_layout.addWidget(self.scalable_scrubber_bar, stretch=1)
         vertical_layout.addWidget(self.media_control_panel)
         self.setLayout(vertical_layout)
+
+    def set_drop_filter(self, accepts_file):
+        """
+        Sets the function telling which dropped files are accepted.
+
+        Parameters:
+            accepts_file - function called with the path of a file, returning
+                whether it can be played.
+        """
+        self._drop_filter = accepts_file
+
+    def connect_media_dropped_to_slot(self, slot):
+        """
+        Connects media files dropped onto the panel to a slot function in the controller.
+
+        Parameters:
+            slot: the handler function that is called with a list of the QUrl of each file.
+        """
+        self.media_dropped.connect(slot)
+
+    def dragEnterEvent(self, event):
+        """
+        Accepts dragged files if any of them can be played.
+        """
+        if self._accepted_urls(event.mimeData()):
+            event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        """
+        Hands the dropped files that can be played to the controller.
+        """
+        urls = self._accepted_urls(event.mimeData())
+        if urls:
+            event.acceptProposedAction()
+            self.media_dropped.emit(urls)
+
+    def _accepted_urls(self, mime_data):
+        """
+        Gets the dragged local files that can be played.
+
+        Parameters:
+            mime_data - QMimeData of the drag.
+        """
+        return [url for url in mime_data.urls()
+                if url.isLocalFile() and (self._drop_filter is None or self._drop_filter(url.toLocalFile()))]
+
+    def show_waveform(self, shown):
+        """
+        Shows the waveform in place of the video, or the video again.
+
+        Parameters:
+            shown - whether the waveform is shown.
+        """
+        self.video_stack.setCurrentWidget(self.waveform_view if shown else self.video_widget)
+
+    def add_angle_view(self, title):
+        """
+        Adds the view of a further camera angle below the main video.
+
+        Parameters:
+            title - name of the camera angle.
+
+        Returns:
+            The AngleView added.
+        """
+        angle_view = AngleView(title)
+        self.angle_layout.addWidget(angle_view)
+        self.angle_container.show()
+        return angle_view
+
+    def remove_angle_view(self, angle_view):
+        """
+        Removes the view of a camera angle, hiding the row of angles once it is empty.
+
+        Parameters:
+            angle_view - AngleView to remove.
+        """
+        self.angle_layout.removeWidget(angle_view)
+        angle_view.deleteLater()
+        if self.angle_layout.count() == 0:
+            self.angle_container.hide()
@@ -1,5 +1,6 @@
 from PySide6 import QtCore
-from PySide6.QtWidgets import QWidget, QPushButton, QGridLayout, QSizePolicy, QComboBox, QLabel, QLineEdit
+from PySide6.QtWidgets import QWidget, QPushButton, QGridLayout, QSizePolicy, QComboBox, QLabel, QLineEdit, \
+    QStackedWidget, QTableView, QHBoxLayout, QAbstractItemView
 from View.encoding_table import EncodingTable
 from PySide6.QtCore import Qt
 
@@ -16,14 +17,32 @@ class TablePanel(QWidget):
 
         self.table = EncodingTable()
 
+        # Shows the rows matching the search in place of the full table.
+        self.filtered_table = QTableView()
+        self.filtered_table.horizontalHeader().setStretchLastSection(True)
+        # Cells of the search results are drawn like those of the table, and
+        # edits made in them are recorded in the table's undo history.
+        self.filtered_table.setItemDelegate(self.table.cell_delegate)
+        self.table_stack = QStackedWidget()
+        self.table_stack.addWidget(self.table)
+        self.table_stack.addWidget(self.filtered_table)
+
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Search rows: words, code:<value>, time:<from>-<to>")
+        self.search_bar.setClearButtonEnabled(True)
+        self.search_result_label = QLabel()
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(self.search_bar, stretch=1)
+        search_layout.addWidget(self.search_result_label)
+
         self.title = QLineEdit(self)
         self.title.setText("Table Title")
         self.title.setAlignment(QtCore.Qt.AlignCenter)
 
         self.add_col_button = QPushButton("Add column")
         self.add_row_button = QPushButton("Add row")
-        self.delete_col_button = QPushButton("Delete current column")
-        self.delete_row_button = QPushButton("Delete current row")
+        self.delete_col_button = QPushButton("Delete selected columns")
+        self.delete_row_button = QPushButton("Delete selected rows")
 
         # Configure the add column button to expand vertically.
         self.add_col_button.setSizePolicy(
@@ -39,7 +58,8 @@ class TablePanel(QWidget):
 
         grid_layout = QGridLayout()
         grid_layout.addWidget(self.title, 0, 0, QtCore.Qt.AlignCenter)
-        grid_layout.addWidget(self.table, 1, 0)
+        grid_layout.addWidget(self.table_stack, 1, 0)
+        grid_layout.addLayout(search_layout, 2, 0)
         grid_layout.addWidget(self.add_col_button, 1, 1, alignment=Qt.AlignCenter)
         grid_layout.addWidget(self.add_row_button, 1, 1, alignment=Qt.AlignBottom)
         grid_layout.addWidget(self.change_font_label, 1, 1, alignment=Qt.AlignTop)
@@ -48,6 +68,141 @@ class TablePanel(QWidget):
         grid_layout.addWidget(self.delete_row_button, 1, 2, alignment=Qt.AlignBottom)
         self.setLayout(grid_layout)
 
+    def set_highlighted_rows(self, rows):
+        """
+        Highlights rows of the table, both in the table and in the search results.
+
+        Parameters:
+            rows - iterable of row indices of the table.
+        """
+        if self.table.cell_delegate.set_highlighted_rows(rows):
+            self.table.viewport().update()
+            self.filtered_table.viewport().update()
+
+    def set_playback_row(self, row, scroll=False):
+        """
+        Marks the row at the video's position, both in the table and in the
+        search results. Only the rows that were and are marked are repainted.
+
+        Parameters:
+            row - row index of the table, None for no row.
+            scroll - whether the shown table is scrolled to the row.
+        """
+        delegate = self.table.cell_delegate
+        previous_row = delegate.playback_row()
+        if row == previous_row:
+            return
+        delegate.set_playback_row(row)
+        for view in (self.table, self.filtered_table):
+            for changed_row in (previous_row, row):
+                index = self._view_index(view, changed_row)
+                if index.isValid():
+                    viewport = view.viewport()
+                    viewport.update(0, view.visualRect(index).top(), viewport.width(), view.rowHeight(index.row()))
+
+        view = self.table_stack.currentWidget()
+        index = self._view_index(view, row)
+        # Cells being edited are not scrolled away from.
+        if scroll and index.isValid() and view.state() != QAbstractItemView.EditingState:
+            view.scrollTo(index, QAbstractItemView.EnsureVisible)
+
+    def _view_index(self, view, row):
+        """
+        Gets the model index of the first cell of a table row in a view.
+
+        Parameters:
+            view - the table, or the search results.
+            row - row index of the table, or None.
+
+        Returns:
+            The model index, invalid if the view does not show the row.
+        """
+        model = view.model()
+        if row is None or model is None:
+            return QtCore.QModelIndex()
+        if view is self.filtered_table:
+            source_model = model.sourceModel()
+            return model.mapFromSource(source_model.index(row, 0)) if source_model is not None else QtCore.QModelIndex()
+        return model.index(row, 0)
+
+    def connect_row_double_click_to_slot(self, slot):
+        """
+        Connects double clicks on the row headers of the table and of the
+        search results to a slot function in the controller.
+
+        Parameters:
+            slot: the handler function that is called with the row index of the table.
+        """
+        self.table.verticalHeader().sectionDoubleClicked.connect(slot)
+        self.filtered_table.verticalHeader().sectionDoubleClicked.connect(
+            lambda row: slot(self.filtered_table.model().mapToSource(self.filtered_table.model().index(row, 0)).row()))
+
+    def connect_search_to_slot(self, slot):
+        """
+        Connects edits of the search bar to a slot function in the controller.
+
+        Parameters:
+            slot: the handler function that is called with the search text.
+        """
+        self.search_bar.textChanged.connect(slot)
+
+    def set_filter_model(self, filter_model):
+        """
+        Sets the model of the table showing the rows matching the search.
+
+        Parameters:
+            filter_model - proxy model filtering the rows of the encoding table.
+        """
+        self.filtered_table.setModel(filter_model)
+
+    def show_search_results(self, match_count, row_count):
+        """
+        Shows the rows matching the search in place of the full table.
+
+        Parameters:
+            match_count - number of matching rows.
+            row_count - number of rows in the table.
+        """
+        self.search_result_label.setText(f"{match_count} of {row_count} rows")
+        self.table_stack.setCurrentWidget(self.filtered_table)
+
+    def show_all_rows(self):
+        """
+        Shows the full table again once the search is cleared.
+        """
+        self.search_result_label.setText("")
+        self.table_stack.setCurrentWidget(self.table)
+
+    def selected_rows(self):
+        """
+        Gets the encoding table rows selected in the shown table. Rows selected
+        in the search results are mapped to the rows of the encoding table.
+
+        Returns:
+            Sorted list of row indices.
+        """
+        view = self.table_stack.currentWidget()
+        model = view.model()
+        rows = set()
+        for selection_range in view.selectionModel().selection():
+            rows.update(range(selection_range.top(), selection_range.bottom() + 1))
+        if view is self.filtered_table:
+            rows = {model.mapToSource(model.index(row, 0)).row() for row in rows}
+        return sorted(rows)
+
+    def selected_columns(self):
+        """
+        Gets the encoding table columns selected in the shown table.
+
+        Returns:
+            Sorted list of column indices.
+        """
+        view = self.table_stack.currentWidget()
+        columns = set()
+        for selection_range in view.selectionModel().selection():
+            columns.update(range(selection_range.left(), selection_range.right() + 1))
+        return sorted(columns)
+
     def get_table_name(self):
         """
         Getter to get the table name.
@@ -0,0 +1,126 @@
+from PySide6.QtGui import QUndoStack
+
+
+class UndoHistory(QUndoStack):
+    """
+    UndoHistory is an undo stack whose commands are bounded by the memory they
+    hold instead of only by their number. Commands report the size of their
+    undo data, and once the history exceeds its memory budget the data of the
+    oldest commands is released. Commands whose data was released can no
+    longer be undone, so the history stops undoing at the oldest command that
+    still holds its data. The count limit of the stack remains as a backstop
+    that deletes the oldest commands outright. The memory held is totalled
+    as commands are pushed, merged, undone, redone and released, so that a
+    push costs no more with a full history than with an empty one.
+    """
+    DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+    COUNT_LIMIT = 10000
+
+    def __init__(self, parent=None):
+        """
+        Constructor - Creates an instance of UndoHistory
+
+        Parameters:
+            parent - owner of the history.
+        """
+        super().__init__(parent)
+        # The count limit can only be set while the stack is empty.
+        self.setUndoLimit(self.COUNT_LIMIT)
+        self._memory_budget = self.DEFAULT_MEMORY_BUDGET
+        # Bytes of undo data held by the commands, kept up to date as commands come and go.
+        self._memory_usage = 0
+        # Index of the oldest command that still holds its data.
+        self._first_undoable_index = 0
+
+    def set_memory_budget(self, memory_budget):
+        """
+        Sets the number of bytes of undo data the history may hold, releasing
+        the data of the oldest commands if it holds more.
+
+        Parameters:
+            memory_budget - budget in bytes.
+        """
+        self._memory_budget = memory_budget
+        self._enforce_memory_budget()
+
+    def get_memory_budget(self):
+        """
+        Getter method to get the memory budget in bytes.
+        """
+        return self._memory_budget
+
+    def push(self, command):
+        """
+        Applies a command and adds it to the history, merging it with the
+        previous command where possible.
+
+        Parameters:
+            command - command to push, providing byte_size(), evict() and is_evicted().
+        """
+        index = self.index()
+        # The commands that could be redone are deleted by the push.
+        self._memory_usage -= sum(self.command(ix).byte_size() for ix in range(index, self.count()))
+        previous = self.command(index - 1) if index > 0 else None
+        previous_size = previous.byte_size() if previous is not None else 0
+        oldest_size = self.command(0).byte_size() if index == self.undoLimit() else 0
+
+        super().push(command)
+
+        if self.count() > 0 and self.command(self.count() - 1) is command:
+            self._memory_usage += command.byte_size()
+            if self.count() == index:
+                # The count limit deleted the oldest command.
+                self._memory_usage -= oldest_size
+                self._first_undoable_index = max(0, self._first_undoable_index - 1)
+        elif self.count() == index:
+            # The command was merged into the previous one.
+            self._memory_usage += previous.byte_size() - previous_size
+        else:
+            # The merge made the previous command obsolete, and it was deleted.
+            self._memory_usage -= previous_size
+            self._first_undoable_index = min(self._first_undoable_index, self.count())
+        self._enforce_memory_budget()
+
+    def can_undo(self):
+        """
+        Determines whether the next command to undo still holds its data.
+        """
+        return self.index() > self._first_undoable_index
+
+    def undo(self):
+        """
+        Undoes the last command, unless its data was released.
+        """
+        if self.can_undo():
+            command = self.command(self.index() - 1)
+            size = command.byte_size()
+            super().undo()
+            self._memory_usage += command.byte_size() - size
+
+    def redo(self):
+        """
+        Redoes the next command.
+        """
+        if self.canRedo():
+            command = self.command(self.index())
+            size = command.byte_size()
+            super().redo()
+            self._memory_usage += command.byte_size() - size
+
+    def memory_usage(self):
+        """
+        Gets the number of bytes of undo data held by the history.
+        """
+        return self._memory_usage
+
+    def _enforce_memory_budget(self):
+        """
+        Releases the data of the oldest commands until the history fits its
+        budget. The command that would be undone next is always kept, and
+        commands that can be redone are never released.
+        """
+        while self._memory_usage > self._memory_budget and self._first_undoable_index < self.index() - 1:
+            command = self.command(self._first_undoable_index)
+            self._memory_usage -= command.byte_size()
+            command.evict()
+            self._first_undoable_index += 1
@@ -1,4 +1,5 @@
 from PySide6.QtCore import QSize
+from PySide6.QtMultimedia import QVideoFrame
 from PySide6.QtMultimediaWidgets import QVideoWidget
 
 
@@ -7,9 +8,12 @@ class VideoWidget(QVideoWidget):
     Custom QVideoWidget which overrides QWidget functions to preserve a 16:9 aspect
     ratio.
     """
-    def __init__(self):
+    def __init__(self, minimum_width=500):
         """
         Construct a Video Widget instance and set its size policy.
+
+        Parameters:
+            minimum_width - least width of the widget in pixels.
         """
         super().__init__()
         p = self.sizePolicy()
@@ -17,12 +21,31 @@ class VideoWidget(QVideoWidget):
         p.setWidthForHeight(True)
         self.setSizePolicy(p)
 
-        self.minimum_width = 500
+        self.minimum_width = minimum_width
 
         # Set the minimum size.
         self.setMinimumWidth(self.minimum_width)
         self.setMinimumHeight(self.heightForWidth(self.minimum_width))
 
+    def connect_frame_to_slot(self, slot):
+        """
+        Connects the frames shown by the widget to a slot function in the controller.
+
+        Parameters:
+            slot: the handler function that is called with each QVideoFrame.
+        """
+        self.videoSink().videoFrameChanged.connect(slot)
+
+    def show_image(self, image):
+        """
+        Shows an image in place of the current frame, until the media player
+        delivers its next frame.
+
+        Parameters:
+            image - QImage to show.
+        """
+        self.videoSink().setVideoFrame(QVideoFrame(image))
+
     def heightForWidth(self, width):
         """
         The video widget height should be 9/16 of the width.
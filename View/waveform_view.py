@@ -0,0 +1,174 @@
+from PySide6.QtCore import Qt, Signal, QLineF
+from PySide6.QtGui import QPainter, QColor
+from PySide6.QtWidgets import QWidget, QSizePolicy
+
+
+class WaveformView(QWidget):
+    """
+    Shows the waveform of an audio recording in place of the video, with a
+    line at the playback position. Clicking or dragging across the waveform
+    seeks to the time under the cursor. The peaks are reduced to one level
+    per column of pixels, which is only done again when the width or the
+    peaks change.
+    """
+    seek_requested = Signal(int)  # position in ms
+
+    BACKGROUND_COLOR = QColor(32, 36, 40)
+    WAVE_COLOR = QColor(68, 160, 217)
+    PLAYED_WAVE_COLOR = QColor(140, 200, 240)
+    POSITION_COLOR = QColor(230, 126, 34)
+    TEXT_COLOR = QColor(200, 200, 200)
+
+    def __init__(self):
+        """
+        Constructor - Creates an empty waveform view.
+        """
+        super().__init__()
+        self.setMinimumHeight(120)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self._peaks = []
+        self._interval_ms = 1
+        self._duration = 0
+        self._position = 0
+        self._column_levels = None  # level per column of pixels, None until computed for the width
+
+    def set_peaks(self, peaks, interval_ms):
+        """
+        Sets the peak levels drawn as the waveform.
+
+        Parameters:
+            peaks - sequence of levels from 0 to 1, one per interval.
+            interval_ms - length of each interval in ms.
+        """
+        self._peaks = peaks
+        self._interval_ms = interval_ms
+        self._column_levels = None
+        self.update()
+
+    def set_duration(self, duration):
+        """
+        Sets the duration of the recording, which spans the width of the view.
+
+        Parameters:
+            duration - duration in ms.
+        """
+        self._duration = duration
+        self._column_levels = None
+        self.update()
+
+    def set_position(self, position):
+        """
+        Moves the line at the playback position.
+
+        Parameters:
+            position - position in ms.
+        """
+        old_x = self._x_of(self._position)
+        self._position = position
+        new_x = self._x_of(position)
+        if old_x != new_x:
+            self.update()
+
+    def connect_seek_to_slot(self, slot):
+        """
+        Connects seeks on the waveform to a slot function in the controller.
+
+        Parameters:
+            slot: the handler function that is called with the position in ms.
+        """
+        self.seek_requested.connect(slot)
+
+    def mousePressEvent(self, event):
+        """
+        Seeks to the time under the cursor.
+        """
+        if event.button() == Qt.LeftButton:
+            self._seek_to_x(event.position().x())
+
+    def mouseMoveEvent(self, event):
+        """
+        Seeks along while the cursor is dragged.
+        """
+        if event.buttons() & Qt.LeftButton:
+            self._seek_to_x(event.position().x())
+
+    def resizeEvent(self, event):
+        """
+        Reduces the peaks again for the new width.
+        """
+        self._column_levels = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        """
+        Draws each column of the waveform as a vertical line around the
+        middle, lighter before the playback position.
+        """
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.BACKGROUND_COLOR)
+        if not self._peaks:
+            painter.setPen(self.TEXT_COLOR)
+            painter.drawText(self.rect(), Qt.AlignCenter, "Audio only")
+            return
+
+        if self._column_levels is None:
+            self._column_levels = self._reduce_peaks(self.width())
+        middle = self.height() / 2
+        half_height = middle - 1
+        position_x = self._x_of(self._position)
+        played_lines = []
+        unplayed_lines = []
+        for x in range(event.rect().left(), min(event.rect().right() + 1, len(self._column_levels))):
+            extent = max(0.5, self._column_levels[x] * half_height)
+            line = QLineF(x + 0.5, middle - extent, x + 0.5, middle + extent)
+            (played_lines if x < position_x else unplayed_lines).append(line)
+        painter.setPen(self.PLAYED_WAVE_COLOR)
+        painter.drawLines(played_lines)
+        painter.setPen(self.WAVE_COLOR)
+        painter.drawLines(unplayed_lines)
+
+        painter.setPen(self.POSITION_COLOR)
+        painter.drawLine(position_x, 0, position_x, self.height())
+
+    def _span(self):
+        """
+        Gets the time spanned by the width of the view in ms.
+        """
+        return max(self._duration, len(self._peaks) * self._interval_ms, 1)
+
+    def _x_of(self, position):
+        """
+        Gets the column of pixels at a time.
+
+        Parameters:
+            position - time in ms.
+        """
+        return int(position * self.width() / self._span())
+
+    def _seek_to_x(self, x):
+        """
+        Requests a seek to the time at a column of pixels.
+
+        Parameters:
+            x - column of pixels.
+        """
+        x = min(max(x, 0), self.width())
+        self.seek_requested.emit(int(x * self._span() / max(self.width(), 1)))
+
+    def _reduce_peaks(self, width):
+        """
+        Gets the highest peak level within each column of pixels.
+
+        Parameters:
+            width - number of columns.
+        """
+        levels = []
+        peak_count = len(self._peaks)
+        peaks_per_column = self._span() / self._interval_ms / max(width, 1)
+        for x in range(width):
+            start = int(x * peaks_per_column)
+            if start >= peak_count:
+                break
+            end = min(max(int((x + 1) * peaks_per_column), start + 1), peak_count)
+            levels.append(max(self._peaks[start:end]))
+        return levels